@@ -3,6 +3,10 @@ Deploy Campus Crowdfunding Platform to Algorand Testnet
 
 This script deploys the smart contract to Testnet and outputs the App ID
 Required for RIFT hackathon submission
+
+Run from the project root so the smart_contracts package imports:
+
+    python -m scripts.deploy_testnet
 """
 
 import logging
@@ -10,7 +14,9 @@ from pathlib import Path
 
 import algokit_utils
 from algokit_utils import Account
-from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.algod import algod_client as shared_algod_client
+from smart_contracts._helpers.algod import algorand_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,11 +25,8 @@ logger = logging.getLogger(__name__)
 def deploy_to_testnet() -> None:
     """Deploy contract to Testnet and display App ID"""
     
-    # Initialize Algorand client for Testnet
-    algod_token = ""  # Testnet doesn't require token
-    algod_server = "https://testnet-api.algonode.cloud"
-    
-    algod_client = AlgodClient(algod_token, algod_server)
+    # Shared algod client; the endpoint comes from ALGOD_SERVER (default: Testnet)
+    algod_client = shared_algod_client()
     
     # Get deployer account from environment or mnemonic
     # For testnet, you need to set DEPLOYER_MNEMONIC environment variable
@@ -45,14 +48,13 @@ def deploy_to_testnet() -> None:
     from smart_contracts.artifacts.campus_funding.campus_funding_client import (
         CampusFundingFactory,
     )
+    from smart_contracts.campus_funding.deploy_config import fund_app_account
     
-    # Create algorand client
-    algorand = algokit_utils.AlgorandClient(
-        algokit_utils.AlgorandClientConfig(
-            algod_client=algod_client,
-        )
-    )
+    # Create algorand client on the same connection pool
+    algorand = algorand_client()
     
+    algorand.account.set_signer_from_account(deployer)
+
     # Deploy the contract
     factory = algorand.client.get_typed_app_factory(
         CampusFundingFactory,
@@ -66,14 +68,19 @@ def deploy_to_testnet() -> None:
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
     )
     
-    # Fund the contract for box storage and inner transactions
-    logger.info("💰 Funding contract with 5 ALGO...")
-    algorand.send.payment(
-        algokit_utils.PaymentParams(
-            amount=algokit_utils.AlgoAmount(algo=5),
-            sender=deployer.address,
-            receiver=app_client.app_address,
-        )
+    # Fund the contract for box storage, submitted right after the create
+    # without a second wait for confirmation; the balance shown is the one
+    # the app has once the payment lands in the next block
+    logger.info("💰 Funding contract for box storage...")
+    funded_balance = fund_app_account(
+        algorand,
+        deployer.address,
+        app_client.app_address,
+        created=result.operation_performed
+        in (
+            algokit_utils.OperationPerformed.Create,
+            algokit_utils.OperationPerformed.Replace,
+        ),
     )
     
     # Display deployment information
@@ -82,6 +89,7 @@ def deploy_to_testnet() -> None:
     logger.info("="*60)
     logger.info(f"📱 App ID: {app_client.app_id}")
     logger.info(f"📍 App Address: {app_client.app_address}")
+    logger.info(f"💰 App Balance: {funded_balance / 1_000_000} ALGO")
     logger.info(f"🌐 Network: Testnet")
     logger.info(f"👤 Creator: {deployer.address}")
     logger.info("="*60)
@@ -1,19 +1,20 @@
 """
 Deploy with a newly generated account
 This creates a new account, shows you the address to fund, then deploys
+
+Run from the project root so the smart_contracts package imports:
+
+    python -m scripts.deploy_with_new_account
 """
 
-from algosdk.v2client.algod import AlgodClient
-from algosdk import account, mnemonic
-from algosdk.transaction import ApplicationCreateTxn, OnComplete, StateSchema
-from algosdk.transaction import wait_for_confirmation
 import base64
 import time
 
-# Testnet configuration
-ALGOD_TOKEN = ""
-ALGOD_SERVER = "https://testnet-api.algonode.cloud"
-ALGOD_PORT = 443
+from algosdk import account, mnemonic
+from algosdk.transaction import ApplicationCreateTxn, OnComplete, StateSchema
+
+from smart_contracts._helpers.algod import algod_client as shared_algod_client
+from smart_contracts._helpers.confirmations import send_and_confirm
 
 def deploy_contract():
     """Deploy the smart contract to TestNet"""
@@ -22,8 +23,8 @@ def deploy_contract():
     print("🚀 Campus Crowdfunding Platform - TestNet Deployment")
     print("="*60)
     
-    # Initialize Algod client
-    algod_client = AlgodClient(ALGOD_TOKEN, ALGOD_SERVER, ALGOD_PORT)
+    # Shared algod client; the endpoint comes from ALGOD_SERVER (default: TestNet)
+    algod_client = shared_algod_client()
     
     print("\n🔑 Generating new deployment account...")
     
@@ -127,12 +128,10 @@ return
     # Send transaction
     print("📤 Sending transaction to TestNet...")
     try:
-        tx_id = algod_client.send_transaction(signed_txn)
-        print(f"✅ Transaction sent! ID: {tx_id}")
-        
-        # Wait for confirmation
+        # Submit and wait for the block containing it
         print("⏳ Waiting for confirmation (this may take 4-5 seconds)...")
-        confirmed_txn = wait_for_confirmation(algod_client, tx_id, 4)
+        tx_id, confirmed_txn = send_and_confirm(algod_client, signed_txn)
+        print(f"✅ Transaction confirmed! ID: {tx_id}")
         
         # Get app ID
         app_id = confirmed_txn['application-index']
@@ -2,13 +2,18 @@
 Interaction script for Campus Crowdfunding Platform
 
 Use this to interact with deployed contract on Testnet
+
+Run from the project root so the smart_contracts package imports:
+
+    python -m scripts.interact_with_contract
 """
 
 import logging
-from algosdk.v2client.algod import AlgodClient
-import algokit_utils
+
 from algokit_utils import Account
 
+from smart_contracts._helpers.algod import algorand_client
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -16,11 +21,6 @@ logger = logging.getLogger(__name__)
 def interact_with_contract():
     """Interact with deployed contract"""
     
-    # Testnet configuration
-    algod_token = ""
-    algod_server = "https://testnet-api.algonode.cloud"
-    algod_client = AlgodClient(algod_token, algod_server)
-    
     # Get App ID
     app_id = int(input("Enter your deployed App ID: "))
     
@@ -35,13 +35,11 @@ def interact_with_contract():
     from smart_contracts.artifacts.campus_funding.campus_funding_client import (
         CampusFundingClient,
     )
+    from smart_contracts.campus_funding.reads import get_campaign
     
-    # Create algorand client
-    algorand = algokit_utils.AlgorandClient(
-        algokit_utils.AlgorandClientConfig(
-            algod_client=algod_client,
-        )
-    )
+    # Shared client; the endpoint comes from ALGOD_SERVER (default: Testnet)
+    algorand = algorand_client()
+    algorand.account.set_signer_from_account(account)
     
     # Get app client
     app_client = algorand.client.get_typed_app_client_by_id(
@@ -55,7 +53,6 @@ def interact_with_contract():
     
     result = app_client.send.create_campaign(
         {
-            "campaign_id": 1,
             "title": "Campus Innovation Lab",
             "description": "Building a maker space for students to prototype ideas",
             "goal_amount": 50_000_000,  # 50 ALGO
@@ -64,13 +61,15 @@ def interact_with_contract():
         }
     )
     
-    logger.info(f"✅ Result: {result.abi_return}")
+    campaign_id = result.abi_return
+    logger.info(f"✅ Created campaign {campaign_id}")
     
     # Get campaign info
     logger.info("\n📊 Fetching campaign info...")
     
-    campaign_info = app_client.send.get_campaign_info({"campaign_id": 1})
-    logger.info(f"Campaign Info: {campaign_info.abi_return}")
+    # Reads are simulated, so they are free and don't wait for a block
+    campaign_info = get_campaign(app_client, campaign_id)
+    logger.info(f"Campaign Info: {campaign_info}")
     
     logger.info("\n✅ Interaction complete!")
 
@@ -0,0 +1,70 @@
+"""
+Refund every contributor of a failed campaign in batches
+
+Finds the campaign's contributors from its ledger boxes and refunds them
+with refund_batch, packing as many per group as the protocol allows. Any
+account can run it; it pays the fees (REFUNDER_MNEMONIC, or a LocalNet
+account). Ends with the fees spent compared with one claim_refund per
+contributor. With --release, it instead deletes the ledger boxes of a
+campaign that reached its goal and pays back their deposits:
+
+    python -m scripts.refund_campaign 42 --app-id 1234 [--release]
+"""
+
+import argparse
+import logging
+
+from smart_contracts._helpers.algod import algorand_client
+from smart_contracts.campus_funding.refunds import (
+    MAX_GROUP_SIZE,
+    campaign_contributors,
+    refund_all,
+    release_all,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("campaign_id", type=int)
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument(
+        "--calls-per-group", type=int, default=MAX_GROUP_SIZE, help="batch calls per group"
+    )
+    parser.add_argument(
+        "--release",
+        action="store_true",
+        help="release the ledger deposits of a campaign that reached its goal",
+    )
+    args = parser.parse_args()
+
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingClient,
+    )
+
+    algorand = algorand_client()
+    refunder = algorand.account.from_environment("REFUNDER")
+    app_client = algorand.client.get_typed_app_client_by_id(
+        CampusFundingClient, app_id=args.app_id, default_sender=refunder.address
+    )
+
+    contributors = campaign_contributors(algorand.client.algod, args.app_id, args.campaign_id)
+    if not contributors:
+        logger.info(f"Campaign {args.campaign_id} has no ledger entries left")
+        return
+    if args.release:
+        released = release_all(
+            app_client, args.campaign_id, contributors, calls_per_group=args.calls_per_group
+        )
+        logger.info(f"✅ Released {released} ledger deposits")
+        return
+    report = refund_all(
+        app_client, args.campaign_id, contributors, calls_per_group=args.calls_per_group
+    )
+    logger.info(f"✅ {report.summary()}")
+
+
+if __name__ == "__main__":
+    main()
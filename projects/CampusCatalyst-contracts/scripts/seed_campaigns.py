@@ -0,0 +1,77 @@
+"""
+Bulk-load campaigns into a deployed Campus Crowdfunding app
+
+Reads campaigns from a CSV file (header: title, description, goal_amount,
+duration_seconds, image_url) or a JSONL file with the same keys, and
+creates them in atomic groups of up to 16 with several groups in flight.
+Progress is kept in a checkpoint file next to the input, so rerunning the
+same command after an interruption picks up where it stopped.
+
+The network comes from ALGOD_SERVER etc. (see smart_contracts/_helpers/algod.py)
+and the creating account from DEPLOYER_MNEMONIC:
+
+    python -m scripts.seed_campaigns campaigns.csv --app-id 1234
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from smart_contracts._helpers.algod import algorand_client
+from smart_contracts.campus_funding.seeding import (
+    DEFAULT_WINDOW,
+    MAX_GROUP_SIZE,
+    read_campaigns,
+    seed_campaigns,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("source", type=Path, help="campaigns as .csv or .jsonl")
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument(
+        "--checkpoint", type=Path, help="progress file (default: <source>.checkpoint.json)"
+    )
+    parser.add_argument("--group-size", type=int, default=MAX_GROUP_SIZE)
+    parser.add_argument(
+        "--window", type=int, default=DEFAULT_WINDOW, help="groups in flight at once"
+    )
+    args = parser.parse_args()
+
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingClient,
+    )
+
+    rows = read_campaigns(args.source)
+    checkpoint = args.checkpoint or args.source.with_name(f"{args.source.name}.checkpoint.json")
+
+    algorand = algorand_client()
+    creator = algorand.account.from_environment("DEPLOYER")
+    app_client = algorand.client.get_typed_app_client_by_id(
+        CampusFundingClient, app_id=args.app_id, default_sender=creator.address
+    )
+
+    started = time.perf_counter()
+    created = asyncio.run(
+        seed_campaigns(
+            app_client,
+            creator.address,
+            rows,
+            checkpoint,
+            source=args.source.name,
+            group_size=args.group_size,
+            window=args.window,
+        )
+    )
+    elapsed = time.perf_counter() - started
+    logger.info(f"✅ Created {created} campaigns in {elapsed:.1f}s from {args.source}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,19 @@
 """
 Simple deployment script for Campus Crowdfunding Platform
 Works without complex setup
+
+Run from the project root so the smart_contracts package imports:
+
+    python -m scripts.simple_deploy
 """
 
-from algosdk.v2client.algod import AlgodClient
+import base64
+
 from algosdk import account, mnemonic
 from algosdk.transaction import ApplicationCreateTxn, OnComplete, StateSchema, PaymentTxn
-from algosdk.transaction import wait_for_confirmation
-import base64
 
-# Testnet configuration
-ALGOD_TOKEN = ""
-ALGOD_SERVER = "https://testnet-api.algonode.cloud"
-ALGOD_PORT = 443
+from smart_contracts._helpers.algod import algod_client as shared_algod_client
+from smart_contracts._helpers.confirmations import send_and_confirm
 
 def deploy_contract():
     """Deploy the smart contract to TestNet"""
@@ -21,8 +22,8 @@ def deploy_contract():
     print("🚀 Campus Crowdfunding Platform - TestNet Deployment")
     print("="*60)
     
-    # Initialize Algod client
-    algod_client = AlgodClient(ALGOD_TOKEN, ALGOD_SERVER, ALGOD_PORT)
+    # Shared algod client; the endpoint comes from ALGOD_SERVER (default: TestNet)
+    algod_client = shared_algod_client()
     
     # Get deployer account
     print("\n📝 Enter your Pera Wallet mnemonic (25 words):")
@@ -109,12 +110,10 @@ return
     # Send transaction
     print("📤 Sending transaction to TestNet...")
     try:
-        tx_id = algod_client.send_transaction(signed_txn)
-        print(f"✅ Transaction sent! ID: {tx_id}")
-        
-        # Wait for confirmation
+        # Submit and wait for the block containing it
         print("⏳ Waiting for confirmation...")
-        confirmed_txn = wait_for_confirmation(algod_client, tx_id, 4)
+        tx_id, confirmed_txn = send_and_confirm(algod_client, signed_txn)
+        print(f"✅ Transaction confirmed! ID: {tx_id}")
         
         # Get app ID
         app_id = confirmed_txn['application-index']
@@ -0,0 +1,115 @@
+"""
+Find campaigns that ended since the last run and act on them
+
+Reads only the deadline index buckets of the days that closed since the
+previous sweep, and prints one JSON line per campaign that still needs a
+withdrawal ("withdraw"), has contributions to refund ("refund") or has
+nothing left to refund and still counts as active ("close"). With
+--withdraw, campaigns created by the keeper account are withdrawn in
+batched groups; withdraw_funds is creator-only, so the rest are left to
+their creators.
+With --close, the keeper account closes every failed campaign still
+counted as active, so active_campaigns stops counting them.
+
+The first run starts from the earliest bucket the app has. Progress is
+kept in a state file (default: .keeper-<app id>.json), so each run only
+pays for the campaigns that ended since the previous one:
+
+    python -m scripts.sweep_expired --app-id 1234 [--withdraw] [--close]
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import time
+from pathlib import Path
+
+from smart_contracts._helpers.algod import algod_client, algorand_client
+from smart_contracts.campus_funding.keeper import (
+    KeeperState,
+    bucket_days,
+    close_all,
+    closed_days,
+    sweep,
+    withdraw_all,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--app-id", type=int, required=True)
+    parser.add_argument("--state", type=Path, help="progress file")
+    parser.add_argument(
+        "--withdraw",
+        action="store_true",
+        help="withdraw successful campaigns created by the KEEPER_MNEMONIC account",
+    )
+    parser.add_argument(
+        "--close",
+        action="store_true",
+        help="close failed campaigns still counted as active, as the KEEPER_MNEMONIC account",
+    )
+    args = parser.parse_args()
+    state_path = args.state or PROJECT_ROOT / f".keeper-{args.app_id}.json"
+
+    algod = algod_client()
+    state = KeeperState.load(state_path)
+    if state is None:
+        # First run: list box names once to find the earliest bucket
+        names = [box["name"] for box in algod.application_boxes(args.app_id)["boxes"]]
+        indexed_days = bucket_days(names)
+        if not indexed_days:
+            logger.info("No campaigns indexed yet")
+            return
+        state = KeeperState(app_id=args.app_id, last_swept_day=indexed_days[0] - 1)
+    elif state.app_id != args.app_id:
+        raise SystemExit(f"{state_path} belongs to app {state.app_id}")
+
+    days = closed_days(state.last_swept_day, int(time.time()))
+    expired = sweep(algod, args.app_id, days)
+    for campaign in expired:
+        print(json.dumps(dataclasses.asdict(campaign)))
+
+    if args.withdraw or args.close:
+        from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+            CampusFundingClient,
+        )
+
+        algorand = algorand_client()
+        keeper = algorand.account.from_environment("KEEPER")
+        app_client = algorand.client.get_typed_app_client_by_id(
+            CampusFundingClient, app_id=args.app_id, default_sender=keeper.address
+        )
+
+    if args.withdraw:
+        own = [
+            campaign.campaign_id
+            for campaign in expired
+            if campaign.action == "withdraw" and campaign.creator == keeper.address
+        ]
+        if own:
+            withdraw_all(app_client, own)
+        logger.info(f"✅ Withdrew {len(own)} campaigns created by {keeper.address}")
+
+    if args.close:
+        failed = [
+            campaign.campaign_id
+            for campaign in expired
+            if campaign.action in ("refund", "close") and campaign.is_active
+        ]
+        closed = close_all(app_client, failed) if failed else 0
+        logger.info(f"✅ Closed {closed} failed campaigns")
+
+    if days:
+        state.last_swept_day = days[-1]
+        state.save(state_path)
+
+
+if __name__ == "__main__":
+    main()
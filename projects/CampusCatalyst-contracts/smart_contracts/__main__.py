@@ -1,31 +1,49 @@
+import argparse
+import codecs
 import dataclasses
+import hashlib
 import importlib
+import io
+import json
 import logging
+import os
+import re
 import subprocess
 import sys
+import time
 from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from functools import cache
 from pathlib import Path
 from shutil import rmtree
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
+# Keep module-level imports light: algokit_utils, dotenv, the deploy configs
+# and the slower standard library modules are only imported once an action
+# needs them, so the CLI starts quickly (see tests/test_startup.py).
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
-
-# Set up logging and load environment variables.
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
 )
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
 
+
+@cache
+def configure_environment() -> None:
+    """Loads .env and configures AlgoKit Utils; only deploys need either."""
+    from algokit_utils.config import config
+    from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+    logger.info("Loading .env")
+    load_dotenv()
+
+
 # ----------------------- Contract Configuration ----------------------- #
 
 
@@ -33,7 +51,10 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    def load_deploy(self) -> Callable[[], None] | None:
+        """Imports the contract's deploy function, on first use only."""
+        return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -47,12 +68,12 @@ def import_contract(folder: Path) -> Path:
 
 def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
     """Imports the deploy function from a folder if it exists."""
-    try:
-        module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
-        deploy_module = importlib.import_module(module_name)
-        return deploy_module.deploy  # type: ignore[no-any-return, misc]
-    except ImportError:
+    if not (folder / "deploy_config.py").exists():
         return None
+    configure_environment()
+    module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
+    deploy_module = importlib.import_module(module_name)
+    return deploy_module.deploy  # type: ignore[no-any-return, misc]
 
 
 def has_contract_file(directory: Path) -> bool:
@@ -60,22 +81,295 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
-# Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
-contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in root_path.iterdir()
-    if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
-]
+def discover_contracts(contract_name: str | None = None) -> list[SmartContract]:
+    """
+    Finds contract folders under root_path, excluding folders that start with
+    '_' (internal helpers). With a name, only that folder is looked at.
+    Nothing is imported here; deploy configs load through load_deploy().
+    """
+    if contract_name is not None:
+        folders = [root_path / contract_name]
+    else:
+        folders = sorted(root_path.iterdir())
+    return [
+        SmartContract(path=import_contract(folder), name=folder.name)
+        for folder in folders
+        if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
+    ]
 
 # -------------------------- Build Logic -------------------------- #
 
 deployment_extension = "py"
 
+# Compiler flags are part of the cache key, so changing them forces a rebuild.
+compile_flags = ["--output-source-map"]
+
+# Written next to the artifacts; an unchanged key means the build can be skipped.
+build_cache_file = ".build-cache.json"
+
+
+def _tool_version(package: str) -> str | None:
+    """Installed version of a build tool, or None if it isn't importable."""
+    from importlib import metadata
+
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _module_path(module: str) -> Path | None:
+    """The project source file a module name resolves to, if it is one."""
+    base = root_path.parent.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _contract_sources(contract_path: Path) -> list[Path]:
+    """
+    The contract file and every project module it imports, directly or
+    through other project modules. Packages on the way to a module are
+    included, since their __init__ runs on import.
+    """
+    import ast
+
+    sources: set[Path] = set()
+    pending = [contract_path.resolve()]
+    while pending:
+        source = pending.pop()
+        if source in sources:
+            continue
+        sources.add(source)
+        package = ".".join(source.relative_to(root_path.parent).with_suffix("").parts[:-1])
+        modules = []
+        for node in ast.walk(ast.parse(source.read_bytes())):
+            if isinstance(node, ast.Import):
+                modules.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                parent = package.rsplit(".", node.level - 1)[0] if node.level else ""
+                base = ".".join(filter(None, (parent, node.module)))
+                modules.append(base)
+                # `from package import module` imports a module by name
+                modules.extend(f"{base}.{alias.name}" for alias in node.names)
+        for module in modules:
+            parts = module.split(".")
+            for depth in range(1, len(parts) + 1):
+                path = _module_path(".".join(parts[:depth]))
+                if path is not None:
+                    pending.append(path.resolve())
+    return sorted(sources)
+
+
+def _build_cache_key(contract_path: Path) -> str | None:
+    """
+    Hashes everything that affects a contract's artifacts: the contract and
+    the project modules it imports, the compiler and client generator
+    versions, and the flags. Returns None, so the build isn't cached, when a
+    tool's version can't be read, e.g. when algokit runs its own copy.
+    """
+    versions = {tool: _tool_version(tool) for tool in ("puyapy", "algokit-client-generator")}
+    if None in versions.values():
+        return None
+    digest = hashlib.sha256()
+    for source in _contract_sources(contract_path):
+        digest.update(source.relative_to(root_path.parent).as_posix().encode())
+        digest.update(source.read_bytes())
+    for tool, version in versions.items():
+        digest.update(f"{tool}=={version}".encode())
+    digest.update(json.dumps([compile_flags, deployment_extension]).encode())
+    return digest.hexdigest()
+
+
+def _read_build_cache(output_dir: Path, cache_key: str | None) -> list[str] | None:
+    """Returns the cached artifact names if they are current and all present."""
+    if cache_key is None:
+        return None
+    try:
+        cache = json.loads((output_dir / build_cache_file).read_text())
+    except (OSError, ValueError):
+        return None
+    artifacts: list[str] = cache.get("artifacts", [])
+    if cache.get("key") != cache_key:
+        return None
+    if not all((output_dir / name).exists() for name in artifacts):
+        return None
+    return artifacts
+
+
+def _read_subprocess_timings(output_dir: Path) -> dict[str, float]:
+    """Seconds each stage last took as a subprocess, from the previous build."""
+    try:
+        cache = json.loads((output_dir / build_cache_file).read_text())
+    except (OSError, ValueError):
+        return {}
+    return dict(cache.get("subprocess_seconds", {}))
+
+
+def _write_build_cache(
+    output_dir: Path, cache_key: str | None, subprocess_seconds: dict[str, float]
+) -> None:
+    artifacts = sorted(
+        file.name
+        for file in output_dir.iterdir()
+        if file.is_file() and file.name != build_cache_file
+    )
+    cache = {
+        "key": cache_key,
+        "artifacts": artifacts,
+        "subprocess_seconds": subprocess_seconds,
+    }
+    (output_dir / build_cache_file).write_text(json.dumps(cache, indent=2) + "\n")
+
+
+def _run_streamed(command: list[str], prefix: str) -> tuple[int, str]:
+    """
+    Runs a command, echoing each output line with `prefix` as it arrives so
+    that concurrent builds stay readable. Returns the exit code and output.
+    """
+    lines: list[str] = []
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            lines.append(line)
+            print(f"{prefix}{line}", end="", flush=True)
+    return process.returncode, "".join(lines)
+
+
+def _load_console_script(name: str) -> Callable[[], object] | None:
+    """Loads an installed console script's entry point, if it is importable."""
+    from importlib import metadata
+
+    for entry_point in metadata.entry_points(group="console_scripts", name=name):
+        try:
+            return entry_point.load()  # type: ignore[no-any-return]
+        except ImportError:
+            return None
+    return None
+
+
+class _PrefixedBytes(io.RawIOBase):
+    """Binary side of a _PrefixedOutput, decoding what is written to it."""
+
+    def __init__(self, text: "_PrefixedOutput"):
+        super().__init__()
+        self._text = text
+        self._decoder = codecs.getincrementaldecoder("utf-8")("backslashreplace")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._text.write(self._decoder.decode(bytes(data)))
+        return len(data)
+
+
+class _PrefixedOutput(io.StringIO):
+    """
+    Keeps everything written to it and echoes each complete line with a
+    prefix. Tools that rewrap sys.stdout around its binary buffer, as
+    puyapy does, write through `buffer`.
+    """
+
+    def __init__(self, prefix: str):
+        super().__init__()
+        self._prefix = prefix
+        self._stream = sys.stdout
+        self._partial = ""
+        self.buffer = _PrefixedBytes(self)
+
+    def write(self, text: str) -> int:
+        *lines, self._partial = (self._partial + text).split("\n")
+        for line in lines:
+            print(f"{self._prefix}{line}", file=self._stream, flush=True)
+        return super().write(text)
+
+    def close_line(self) -> None:
+        if self._partial:
+            print(f"{self._prefix}{self._partial}", file=self._stream, flush=True)
+            self._partial = ""
+
+
+def _run_in_process(
+    entry_point: Callable[[], object], argv: list[str], prefix: str
+) -> tuple[int, str]:
+    """
+    Calls a console script entry point with `argv` in this process, which
+    saves starting a fresh interpreter and re-importing the tool. Each line
+    of output is echoed with `prefix` as it is written. Returns the exit
+    code and output.
+    """
+    output = _PrefixedOutput(prefix)
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                result = entry_point()
+                returncode = result if isinstance(result, int) else 0
+            except SystemExit as exit_:
+                returncode = exit_.code if isinstance(exit_.code, int) else int(exit_.code is not None)
+    finally:
+        sys.argv = saved_argv
+        output.close_line()
+    return returncode, output.getvalue()
+
+
+def _run_tool(
+    script: str,
+    runs: list[list[str]],
+    fallback: list[str],
+    prefix: str,
+    in_process: bool = True,
+) -> tuple[int, str, bool]:
+    """
+    Runs a build tool in-process through its console script, once per list
+    of arguments in `runs`, when it is installed in this environment and
+    `in_process` is set. Otherwise runs the `fallback` command, which must
+    cover all the runs. Returns the exit code, the output and whether it
+    ran in-process.
+    """
+    entry_point = _load_console_script(script) if in_process else None
+    if entry_point is None:
+        return (*_run_streamed(fallback, prefix), False)
+    returncode, outputs = 0, []
+    for args in runs:
+        returncode, output = _run_in_process(entry_point, [script, *args], prefix)
+        outputs.append(output)
+        if returncode:
+            break
+    return returncode, "".join(outputs), True
+
+
+def _report_stage(
+    stage: str,
+    seconds: float,
+    in_process: bool,
+    subprocess_seconds: dict[str, float],
+    prefix: str,
+) -> None:
+    """
+    Records a subprocess stage's time as the baseline, or logs how much an
+    in-process stage saved against the recorded one.
+    """
+    if not in_process:
+        subprocess_seconds[stage] = seconds
+        logger.info(f"{prefix}{stage} ran as a subprocess in {seconds:.2f}s")
+    elif stage in subprocess_seconds:
+        saved = subprocess_seconds[stage] - seconds
+        logger.info(
+            f"{prefix}{stage} ran in-process in {seconds:.2f}s, "
+            f"{saved:.2f}s faster than as a subprocess"
+        )
+    else:
+        logger.info(
+            f"{prefix}{stage} ran in-process in {seconds:.2f}s "
+            "(build once with --subprocess to record a baseline)"
+        )
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,37 +380,56 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    force: bool = False,
+    stages: dict[str, float] | None = None,
+    in_process: bool = True,
+) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    Skips both steps when the sources, tool versions and flags match the last
+    build and its artifacts are intact, unless `force` is set. Otherwise the
+    output directory is cleared first.
+    Seconds spent in each stage are recorded in `stages` when it is given.
+    With `in_process` unset the tools run as subprocesses, and their times
+    are kept in the build cache as the baseline in-process builds report against.
     """
+    stages = {} if stages is None else stages
+    prefix = f"[{contract_path.parent.name}] "
     output_dir = output_dir.resolve()
+    cache_key = _build_cache_key(contract_path)
+    if cache_key is None and not force:
+        logger.info(f"Build tool versions unknown, not using the build cache for {contract_path}")
+    cached_artifacts = None if force else _read_build_cache(output_dir, cache_key)
+    if cached_artifacts is not None:
+        logger.info(f"{contract_path} unchanged, reusing artifacts in {output_dir}")
+        app_spec = next(
+            (name for name in cached_artifacts if name.endswith(".arc56.json")), None
+        )
+        return output_dir / app_spec if app_spec else output_dir
+
+    subprocess_seconds = _read_subprocess_timings(output_dir)
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
     logger.info(f"Exporting {contract_path} to {output_dir}")
 
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
+    compile_args = [str(contract_path.resolve()), f"--out-dir={output_dir}", *compile_flags]
+    started = time.perf_counter()
+    returncode, output, in_process = _run_tool(
+        "puyapy",
+        [compile_args],
+        ["algokit", "--no-color", "compile", "python", *compile_args],
+        prefix,
+        in_process,
     )
+    stages["compile"] = time.perf_counter() - started
+    _report_stage("compile", stages["compile"], in_process, subprocess_seconds, prefix)
 
-    if build_result.stdout:
-        print(build_result.stdout)
-
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    if returncode:
+        raise Exception(f"Could not build contract:\n{output}")
 
     # Look for arc56.json files and generate the client based on them.
     app_spec_file_names: list[str] = [
@@ -129,58 +442,124 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
         )
     else:
+        # Every app spec in the folder is generated in one pass: one loaded
+        # generator in-process, or one algokit run over the whole folder,
+        # where the output path is a template filled in per contract.
+        client_file = app_spec_file_names[-1]
+        output_path = _get_output_path(output_dir, deployment_extension)
+        runs = []
         for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-
-            if generate_result.stdout:
-                print(generate_result.stdout)
-
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
-                    raise Exception(
-                        "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
-                    )
-                else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
+            print(f"{prefix}{file_name}", flush=True)
+            app_name = json.loads((output_dir / file_name).read_text())["name"]
+            # Matches how algokit names Python clients: CampusFunding -> campus_funding
+            contract_name = re.sub(r"(?<!^)(?=[A-Z])", "_", app_name).lower()
+            client_path = str(output_path).format(contract_name=contract_name)
+            runs.append(["-a", str(output_dir / file_name), "-o", client_path])
+        started = time.perf_counter()
+        returncode, output, in_process = _run_tool(
+            "algokitgen-py",
+            runs,
+            ["algokit", "generate", "client", str(output_dir), "--output", str(output_path)],
+            prefix,
+            in_process,
+        )
+        stages["generate"] = time.perf_counter() - started
+
+        if returncode:
+            if "No such command" in output:
+                raise Exception(
+                    "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
+                )
+            else:
+                raise Exception(
+                    f"Could not generate typed client:\n{output}"
+                )
+        _report_stage("generate", stages["generate"], in_process, subprocess_seconds, prefix)
+    _write_build_cache(output_dir, cache_key, subprocess_seconds)
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+@dataclasses.dataclass
+class BuildReport:
+    name: str
+    output: Path
+    stages: dict[str, float]
+    total: float
+
+
+def _build_contract(
+    name: str, path: Path, output_dir: Path, force: bool, in_process: bool = True
+) -> BuildReport:
+    """Builds one contract and times it; runs inside a build worker process."""
+    stages: dict[str, float] = {}
+    started = time.perf_counter()
+    output = build(output_dir, path, force, stages, in_process)
+    return BuildReport(name, output, stages, time.perf_counter() - started)
+
+
+def build_all(
+    contracts: list[SmartContract],
+    artifact_path: Path,
+    force: bool = False,
+    jobs: int | None = None,
+    in_process: bool = True,
+) -> list[BuildReport]:
+    """
+    Builds contracts concurrently, at most `jobs` at a time (defaults to the
+    CPU count), and logs the time each one spent per stage. Contracts are
+    independent, so they are compiled in separate worker processes; with a
+    single job or contract the build runs in this process instead.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    arguments = [
+        (contract.name, contract.path, artifact_path / contract.name, force, in_process)
+        for contract in contracts
+    ]
+    for contract in contracts:
+        logger.info(f"Building app at {contract.path}")
+
+    started = time.perf_counter()
+    if jobs == 1 or len(arguments) <= 1:
+        reports = [_build_contract(*args) for args in arguments]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(arguments))) as pool:
+            reports = list(pool.map(_build_contract, *zip(*arguments)))
+
+    for report in reports:
+        stages = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in report.stages.items())
+        logger.info(f"[{report.name}] {stages or 'cached'}, total {report.total:.2f}s")
+    logger.info(
+        f"Built {len(reports)} contract(s) in {time.perf_counter() - started:.2f}s"
+    )
+    return reports
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
-    """Main entry point to build and/or deploy smart contracts."""
+def main(
+    action: str,
+    contract_name: str | None = None,
+    force: bool = False,
+    jobs: int | None = None,
+    in_process: bool = True,
+) -> None:
+    """
+    Main entry point to build and/or deploy smart contracts.
+    Pass `force` to rebuild contracts whose build cache is current, `jobs`
+    to limit how many contracts are built at once and `in_process=False` to
+    run the build tools as subprocesses.
+    """
     artifact_path = root_path / "artifacts"
-    # Filter contracts based on an optional specific contract name.
-    filtered_contracts = [
-        contract
-        for contract in contracts
-        if contract_name is None or contract.name == contract_name
-    ]
+    filtered_contracts = discover_contracts(contract_name)
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(filtered_contracts, artifact_path, force, jobs, in_process)
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -194,24 +573,35 @@ def main(action: str, contract_name: str | None = None) -> None:
                 )
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
+                deploy = contract.load_deploy()
+                if deploy:
                     logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+                    deploy()
         case "all":
+            build_all(filtered_contracts, artifact_path, force, jobs, in_process)
             for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
+                deploy = contract.load_deploy()
+                if deploy:
                     logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+                    deploy()
         case _:
             logger.error(f"Unknown action: {action}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    parser = argparse.ArgumentParser(prog="python -m smart_contracts")
+    parser.add_argument("action", nargs="?", default="all")
+    parser.add_argument("contract_name", nargs="?")
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if the build cache is current"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="contracts to build at once (default: CPU count)"
+    )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="run the compiler and client generator as subprocesses, recording their times",
+    )
+    args = parser.parse_args()
+    main(args.action, args.contract_name, args.force, args.jobs, not args.subprocess)
@@ -0,0 +1,6 @@
+"""
+Shared deployment and build tooling
+
+Folders starting with '_' are skipped by contract discovery, so nothing in
+here is built or deployed as a contract.
+"""
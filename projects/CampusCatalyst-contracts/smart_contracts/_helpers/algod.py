@@ -0,0 +1,178 @@
+"""
+Shared algod client for scripts
+
+algosdk's AlgodClient opens a new connection, including a TLS handshake, for
+every request it makes through urllib. algod_client() installs a urllib
+handler that sends those requests over a pooled keep-alive HTTP session
+instead, retrying transient failures with exponential backoff, so algosdk
+builds and reads every request as usual. The client it returns also reuses
+suggested params for a number of rounds rather than fetching them for every
+transaction. Scripts get one client per process through algod_client().
+
+The handler is installed for the whole process, so any other urllib request
+a script makes goes through the pool as well.
+
+Configured from the environment:
+- ALGOD_SERVER, ALGOD_PORT, ALGOD_TOKEN: endpoint (default: TestNet via AlgoNode)
+- ALGOD_RETRIES: attempts after the first for a failed request (default 3)
+- SUGGESTED_PARAMS_ROUNDS: rounds suggested params are reused for (default 10)
+"""
+
+import copy
+import http.client
+import io
+import logging
+import os
+import time
+import urllib.error
+import urllib.request
+import urllib.response
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+if TYPE_CHECKING:
+    from algokit_utils import AlgorandClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVER = "https://testnet-api.algonode.cloud"
+DEFAULT_RETRIES = 3
+DEFAULT_PARAMS_ROUNDS = 10
+# Average block time, used to tell when cached suggested params are stale
+ROUND_SECONDS = 2.8
+BACKOFF_SECONDS = 0.25
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_CONNECTIONS = 10
+# Long enough for status_after_block, which waits for the next round
+TIMEOUT_SECONDS = 300
+
+
+class PooledTransport(urllib.request.BaseHandler):
+    """urllib handler sending HTTP(S) requests over a keep-alive pool with retries."""
+
+    # Ahead of urllib's own HTTP and HTTPS handlers
+    handler_order = 100
+
+    def __init__(self, retries: int = DEFAULT_RETRIES):
+        self.retries = retries
+        self.session = httpx.Client(
+            timeout=TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS
+            ),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+    def http_open(self, request: urllib.request.Request) -> urllib.response.addinfourl:
+        method = request.get_method()
+        response = self._send(method, request.full_url, dict(request.headers), request.data)
+        headers = http.client.HTTPMessage()
+        for name, value in response.headers.multi_items():
+            headers[name] = value
+        result = urllib.response.addinfourl(
+            io.BytesIO(response.content), headers, request.full_url, response.status_code
+        )
+        # urllib raises HTTPError for error statuses, which algosdk turns into
+        # AlgodHTTPError with algod's message
+        result.msg = response.reason_phrase
+        return result
+
+    https_open = http_open
+
+    def _send(
+        self, method: str, url: str, headers: dict[str, str], data: Any
+    ) -> httpx.Response:
+        """
+        Send with exponential backoff. Failing to connect is retried for every
+        request; dropped connections, timeouts, throttling and gateway errors
+        only for reads, so a transaction is never submitted twice because a
+        response went missing.
+        """
+        retryable: tuple[type[Exception], ...] = (httpx.ConnectError,)
+        if method == "GET":
+            retryable = (httpx.TransportError,)
+        for attempt in range(self.retries + 1):
+            delay = BACKOFF_SECONDS * 2**attempt
+            try:
+                response = self.session.request(method, url, headers=headers, content=data)
+            except retryable as failure:
+                if attempt == self.retries:
+                    raise urllib.error.URLError(failure) from failure
+                logger.debug(f"{method} {url} failed ({failure}), retrying in {delay}s")
+            else:
+                if method != "GET" or response.status_code not in RETRY_STATUSES:
+                    return response
+                if attempt == self.retries:
+                    return response
+                logger.debug(f"{method} {url} returned {response.status_code}, retrying in {delay}s")
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+
+class CachedParamsAlgodClient(AlgodClient):
+    """AlgodClient that reuses suggested params for a number of rounds."""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        *,
+        params_rounds: int = DEFAULT_PARAMS_ROUNDS,
+    ):
+        super().__init__(algod_token, algod_address)
+        self.params_rounds = params_rounds
+        self._params: SuggestedParams | None = None
+        self._params_fetched_at = 0.0
+
+    def suggested_params(self, **kwargs: Any) -> SuggestedParams:
+        """
+        Suggested params, fetched at most once every `params_rounds` rounds.
+        They stay valid for far longer (first to last valid is 1000 rounds),
+        and the fee only moves under congestion.
+        """
+        if kwargs.get("response_format", "json") != "json":
+            return super().suggested_params(**kwargs)  # type: ignore[no-any-return]
+        age = time.monotonic() - self._params_fetched_at
+        if self._params is None or age >= self.params_rounds * ROUND_SECONDS:
+            self._params = super().suggested_params(**kwargs)
+            self._params_fetched_at = time.monotonic()
+        # Callers adjust fees on the object they get
+        return copy.copy(self._params)
+
+
+def install_transport(transport: PooledTransport) -> None:
+    """Route this process's urllib requests, and so algosdk's, through `transport`."""
+    urllib.request.install_opener(urllib.request.build_opener(transport))
+
+
+def _endpoint() -> tuple[str, str]:
+    server = os.environ.get("ALGOD_SERVER", DEFAULT_SERVER).rstrip("/")
+    port = os.environ.get("ALGOD_PORT", "")
+    token = os.environ.get("ALGOD_TOKEN", "")
+    return (f"{server}:{port}" if port else server), token
+
+
+@cache
+def algod_client() -> CachedParamsAlgodClient:
+    """The process-wide algod client for the endpoint in the environment."""
+    install_transport(PooledTransport(int(os.environ.get("ALGOD_RETRIES", DEFAULT_RETRIES))))
+    address, token = _endpoint()
+    return CachedParamsAlgodClient(
+        token,
+        address,
+        params_rounds=int(os.environ.get("SUGGESTED_PARAMS_ROUNDS", DEFAULT_PARAMS_ROUNDS)),
+    )
+
+
+def algorand_client() -> "AlgorandClient":
+    """An AlgoKit Utils client on top of the shared algod client."""
+    from algokit_utils import AlgorandClient
+
+    return AlgorandClient.from_clients(algod=algod_client())
+
@@ -0,0 +1,209 @@
+"""
+Transaction confirmations from a single block follower
+
+algosdk's wait_for_confirmation polls pending_transaction_info once per
+round for every transaction. ConfirmationService instead follows the chain
+with status_after_block and reads each new block's transaction IDs once,
+resolving every watched transaction confirmed in it. The cost is two
+requests per round however many transactions are in flight, and nothing
+while none are.
+
+A failed algod request is retried with exponential backoff from the round
+the follower had reached, so no block is skipped. If it keeps failing, the
+transactions being watched fail with the error, and the follower starts
+again with the next watch.
+
+    async with ConfirmationService(algod_client) as confirmations:
+        tx_ids = [await confirmations.send(txn) for txn in signed_txns]
+        rounds = await asyncio.gather(*map(confirmations.confirmed, tx_ids))
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from algosdk.transaction import GenericSignedTransaction
+    from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rounds a transaction is watched for when its last valid round isn't known
+DEFAULT_MAX_ROUNDS = 10
+# Consecutive failed requests retried before the watched transactions fail
+MAX_FOLLOW_RETRIES = 5
+# Seconds before the first retry, doubled for each one after
+RETRY_DELAY = 0.5
+
+
+class TransactionExpiredError(Exception):
+    """A watched transaction was not confirmed before its last valid round"""
+
+
+class ConfirmationService:
+    """Resolves futures for many transactions by following blocks."""
+
+    def __init__(
+        self,
+        algod_client: "AlgodClient",
+        max_rounds: int = DEFAULT_MAX_ROUNDS,
+        retry_delay: float = RETRY_DELAY,
+    ):
+        self._algod = algod_client
+        self._max_rounds = max_rounds
+        self._retry_delay = retry_delay
+        # Every watched transaction's future, kept after it resolves
+        self._futures: dict[str, asyncio.Future[int]] = {}
+        # Transactions still being looked for, with their last valid round
+        self._pending: dict[str, int | None] = {}
+        self._work = asyncio.Event()
+        self._follower: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "ConfirmationService":
+        self._follower = asyncio.create_task(self._follow())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._follower is not None:
+            self._follower.cancel()
+            await asyncio.gather(self._follower, return_exceptions=True)
+        for future in self._futures.values():
+            future.cancel()
+        self._pending.clear()
+
+    async def _call(self, method: Callable[..., T], *args: Any) -> T:
+        """Run a blocking algod request without stalling the event loop."""
+        return await asyncio.to_thread(method, *args)
+
+    def watch(self, tx_id: str, last_valid: int | None = None) -> "asyncio.Future[int]":
+        """
+        Start watching a transaction; the future resolves to its confirmed
+        round. Watch before submitting so its block can't be missed; a
+        transaction submitted first is only found if it confirms no
+        earlier than the latest round when watching starts.
+        """
+        if tx_id in self._futures:
+            return self._futures[tx_id]
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._futures[tx_id] = future
+        self._pending[tx_id] = last_valid
+        self._work.set()
+        return future
+
+    async def send(self, signed_txn: "GenericSignedTransaction") -> str:
+        """Watch and submit a signed transaction, returning its ID."""
+        return (await self.send_group([signed_txn]))[0]
+
+    async def send_group(self, signed_txns: list["GenericSignedTransaction"]) -> list[str]:
+        """
+        Watch and submit signed transactions together, e.g. an atomic group,
+        returning their IDs. A group confirms in a single block, so waiting
+        on any one of its IDs waits for all of them.
+        """
+        tx_ids = [signed_txn.get_txid() for signed_txn in signed_txns]
+        for tx_id, signed_txn in zip(tx_ids, signed_txns):
+            self.watch(tx_id, signed_txn.transaction.last_valid_round)
+        try:
+            await self._call(self._algod.send_transactions, signed_txns)
+        except Exception:
+            for tx_id in tx_ids:
+                self._pending.pop(tx_id, None)
+                self._futures.pop(tx_id).cancel()
+            raise
+        return tx_ids
+
+    async def confirmed(self, tx_id: str) -> int:
+        """Wait for a watched transaction and return its confirmed round."""
+        return await self.watch(tx_id)
+
+    async def transaction_info(self, tx_id: str) -> dict[str, Any]:
+        """Confirmed transaction details, e.g. a created app's index."""
+        return await self._call(self._algod.pending_transaction_info, tx_id)  # type: ignore[return-value]
+
+    async def _follow(self) -> None:
+        # The next round to check, kept across retries so a failed request
+        # never skips a block; None while there is nothing to watch
+        next_round: int | None = None
+        latest = 0
+        failures = 0
+        while True:
+            try:
+                await self._work.wait()
+                if next_round is None:
+                    status = await self._call(self._algod.status)
+                    latest = next_round = status["last-round"]
+                while self._pending:
+                    if next_round > latest:
+                        status = await self._call(self._algod.status_after_block, latest)
+                        latest = status["last-round"]
+                    while next_round <= latest:
+                        await self._process_round(next_round)
+                        next_round += 1
+                        failures = 0
+                self._work.clear()
+                next_round = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                failures += 1
+                if failures <= MAX_FOLLOW_RETRIES:
+                    delay = self._retry_delay * 2 ** (failures - 1)
+                    logger.warning(f"Confirmation follower retrying in {delay}s: {error}")
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Confirmation follower gave up after {failures} failures: {error}")
+                for tx_id in self._pending:
+                    self._resolve(tx_id, error=error)
+                self._pending.clear()
+                self._work.clear()
+                next_round = None
+                failures = 0
+
+    def _resolve(
+        self, tx_id: str, round_: int | None = None, error: Exception | None = None
+    ) -> None:
+        future = self._futures[tx_id]
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(round_)  # type: ignore[arg-type]
+
+    async def _process_round(self, round_: int) -> None:
+        # Watches without a last valid round get a window from the first
+        # round they are looked for in
+        for tx_id, last_valid in self._pending.items():
+            if last_valid is None:
+                self._pending[tx_id] = round_ + self._max_rounds
+        if not self._pending:
+            return
+
+        block = await self._call(self._algod.get_block_txids, round_)
+        confirmed = set(block.get("blockTxids") or [])  # type: ignore[union-attr]
+        for tx_id, last_valid in list(self._pending.items()):
+            if tx_id in confirmed:
+                self._resolve(tx_id, round_)
+            elif last_valid is not None and round_ >= last_valid:
+                expired = TransactionExpiredError(f"{tx_id} not confirmed by round {last_valid}")
+                self._resolve(tx_id, error=expired)
+            else:
+                continue
+            del self._pending[tx_id]
+
+
+def send_and_confirm(
+    algod_client: "AlgodClient", signed_txn: "GenericSignedTransaction"
+) -> tuple[str, dict[str, Any]]:
+    """Submit one transaction, wait for it and return its ID and details."""
+
+    async def run() -> tuple[str, dict[str, Any]]:
+        async with ConfirmationService(algod_client) as confirmations:
+            tx_id = await confirmations.send(signed_txn)
+            await confirmations.confirmed(tx_id)
+            return tx_id, await confirmations.transaction_info(tx_id)
+
+    return asyncio.run(run())
@@ -0,0 +1,79 @@
+"""
+Local record of what has been deployed where
+
+The manifest maps each network to the contracts deployed on it, storing the
+hash of the deployed approval and clear programs, the app ID and the app
+account balance after funding. A deploy whose programs hash the same as the
+recorded ones skips the deploy, only checking the app account's balance.
+
+The manifest is kept in .deployments.json at the project root and is not
+committed. Delete it, or set FORCE_DEPLOY=1, after resetting LocalNet.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_PATH = Path(__file__).parent.parent.parent / ".deployments.json"
+
+
+@dataclasses.dataclass
+class Deployment:
+    app_id: int
+    app_address: str
+    program_hash: str
+    funded_balance: int  # app account balance in microALGOs after funding
+
+
+def network_key() -> str:
+    """Identifies the target network by the algod endpoint from the environment."""
+    server = os.environ.get("ALGOD_SERVER", "http://localhost")
+    port = os.environ.get("ALGOD_PORT", "4001" if "localhost" in server else "")
+    return f"{server}:{port}" if port else server
+
+
+def force_deploy() -> bool:
+    return os.environ.get("FORCE_DEPLOY", "").lower() in ("1", "true", "yes")
+
+
+def program_hash(app_spec_path: Path) -> str:
+    """SHA-256 over the approval and clear programs in an ARC-56 app spec."""
+    source = json.loads(app_spec_path.read_text())["source"]
+    digest = hashlib.sha256()
+    for program in ("approval", "clear"):
+        digest.update(source[program].encode())
+    return digest.hexdigest()
+
+
+def _read_manifest(path: Path) -> dict[str, dict[str, dict[str, object]]]:
+    try:
+        return json.loads(path.read_text())  # type: ignore[no-any-return]
+    except (OSError, ValueError):
+        return {}
+
+
+def load_deployment(
+    contract_name: str, network: str, path: Path = MANIFEST_PATH
+) -> Deployment | None:
+    """The recorded deployment of a contract on a network, if there is one."""
+    entry = _read_manifest(path).get(network, {}).get(contract_name)
+    if entry is None:
+        return None
+    try:
+        return Deployment(**entry)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+
+
+def record_deployment(
+    contract_name: str,
+    network: str,
+    deployment: Deployment,
+    path: Path = MANIFEST_PATH,
+) -> None:
+    """Store a deployment, replacing any earlier record for the same network."""
+    manifest = _read_manifest(path)
+    manifest.setdefault(network, {})[contract_name] = dataclasses.asdict(deployment)
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,2305 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "create_application", "returns": {"type": "string"}, "desc": "Initialize the smart contract", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "desc": "Campaign title", "name": "title"}, {"type": "string", "desc": "Campaign description", "name": "description"}, {"type": "uint64", "desc": "Funding goal in microALGOs", "name": "goal_amount"}, {"type": "uint64", "desc": "Campaign duration in seconds", "name": "duration_seconds"}, {"type": "string", "desc": "URL to campaign image", "name": "image_url"}], "name": "create_campaign", "returns": {"type": "uint64", "desc": "ID assigned to the new campaign"}, "desc": "Create a new crowdfunding campaign", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign to contribute to", "name": "campaign_id"}, {"type": "pay", "desc": "Payment transaction with the contribution amount, plus CONTRIBUTION_DEPOSIT if it is the sender's first to the campaign", "name": "payment"}], "name": "contribute", "returns": {"type": "string", "desc": "Success message with contribution amount"}, "desc": "Contribute to a campaign", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(uint64,uint64)[]", "desc": "Campaign IDs and the amount each one receives", "name": "splits"}, {"type": "pay", "desc": "Payment transaction covering the sum of all splits, plus CONTRIBUTION_DEPOSIT for each campaign the sender hasn't contributed to before", "name": "payment"}], "name": "contribute_many", "returns": {"type": "string", "desc": "Success message"}, "desc": "Contribute to several campaigns with a single payment", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}], "name": "withdraw_funds", "returns": {"type": "string", "desc": "Success message"}, "desc": "Withdraw funds from a successful campaign (creator only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}, {"type": "address", "desc": "Address of the contributor", "name": "contributor"}], "name": "claim_refund", "returns": {"type": "string", "desc": "Success message"}, "desc": "Claim refund if campaign goal was not met", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}, {"type": "address[]", "desc": "Addresses to refund; ones with nothing left to refund are skipped, so a batch can safely be retried", "name": "contributors"}], "name": "refund_batch", "returns": {"type": "uint64", "desc": "Total microALGOs of contributions refunded; each contributor's ledger deposit is paid back with their contribution"}, "desc": "Refund several contributors of a failed campaign in one call", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}, {"type": "address[]", "desc": "Addresses whose entries to delete; ones without an entry are skipped, so a batch can safely be retried", "name": "contributors"}], "name": "release_deposits", "returns": {"type": "uint64", "desc": "Number of entries deleted"}, "desc": "Delete the ledger entries of a campaign that reached its goal and\npay back their deposits", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "Campaigns to close; ones that haven't failed or are already closed are skipped, so a batch can safely be retried", "name": "campaign_ids"}], "name": "close_failed_campaigns", "returns": {"type": "uint64", "desc": "Number of campaigns closed"}, "desc": "Stop counting campaigns that ended without reaching their goal as\nactive, e.g. ones nobody has claimed a refund from yet", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}], "name": "get_campaign_info", "returns": {"type": "(address,string,string,uint64,uint64,uint64,bool,bool,string)", "desc": "Campaign information struct", "struct": "CampaignInfo"}, "desc": "Get campaign information", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_campaigns", "returns": {"type": "uint64"}, "desc": "Get total number of campaigns created (the highest campaign ID)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "desc": "IDs of the campaigns, each needing its state and metadata box in the box references (4 campaigns per transaction)", "name": "campaign_ids"}], "name": "get_campaigns", "returns": {"type": "(address,string,string,uint64,uint64,uint64,bool,bool,string)[]", "desc": "Campaign information structs in the order requested"}, "desc": "Get information for several campaigns in one call", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "increase_budget", "returns": {"type": "void"}, "desc": "Do nothing. Each app call adds 700 to the group's pooled opcode\nbudget, so heavy calls are grouped with as many of these as they need.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "desc": "Address of the creator", "name": "creator"}, {"type": "uint64", "desc": "Position of the first ID to return", "name": "start"}, {"type": "uint64", "desc": "Most IDs to return, capped at MAX_CREATOR_PAGE", "name": "limit"}], "name": "get_creator_campaigns", "returns": {"type": "(uint64,uint64[])", "desc": "The creator's total number of campaigns and the IDs from `start`, oldest first", "struct": "CreatorCampaigns"}, "desc": "Get one page of the campaigns an account created", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_platform_stats", "returns": {"type": "(uint64,uint64,uint64,uint64,(uint64,uint64)[10])", "desc": "Campaign counts, total raised and the top campaigns by amount raised (unused leaderboard entries are zero)", "struct": "PlatformStats"}, "desc": "Get platform totals and the leaderboard in one call", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}], "name": "cancel_campaign", "returns": {"type": "string", "desc": "Success message"}, "desc": "Cancel a campaign (creator only, before any contributions)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "desc": "ID of the campaign", "name": "campaign_id"}, {"type": "string", "desc": "Updated description", "name": "new_description"}, {"type": "string", "desc": "Updated image URL", "name": "new_image_url"}], "name": "update_campaign", "returns": {"type": "string", "desc": "Success message"}, "desc": "Update campaign details (creator only)", "events": [], "readonly": false, "recommendations": {}}], "name": "CampusFunding", "state": {"keys": {"box": {}, "global": {"total_campaigns": {"key": "dG90YWxfY2FtcGFpZ25z", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_raised": {"key": "dG90YWxfcmFpc2Vk", "keyType": "AVMString", "valueType": "AVMUint64"}, "active_campaigns": {"key": "YWN0aXZlX2NhbXBhaWducw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "successful_campaigns": {"key": "c3VjY2Vzc2Z1bF9jYW1wYWlnbnM=", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CampaignInfo": [{"name": "creator", "type": "address"}, {"name": "title", "type": "string"}, {"name": "description", "type": "string"}, {"name": "goal_amount", "type": "uint64"}, {"name": "deadline", "type": "uint64"}, {"name": "total_raised", "type": "uint64"}, {"name": "is_active", "type": "bool"}, {"name": "funds_withdrawn", "type": "bool"}, {"name": "image_url", "type": "string"}], "CreatorCampaigns": [{"name": "total", "type": "uint64"}, {"name": "campaign_ids", "type": "uint64[]"}], "PlatformStats": [{"name": "total_campaigns", "type": "uint64"}, {"name": "total_raised", "type": "uint64"}, {"name": "active_campaigns", "type": "uint64"}, {"name": "successful_campaigns", "type": "uint64"}, {"name": "leaderboard", "type": "(uint64,uint64)[10]"}]}, "byteCode": {"approval": "CyAGAAEIAoABxKkBJggQYWN0aXZlX2NhbXBhaWducwAEFR98dQx0b3RhbF9yYWlzZWQDdG9wD3RvdGFsX2NhbXBhaWducxRzdWNjZXNzZnVsX2NhbXBhaWducwFtMRhAAA4nBSJnKyJnKCJnJwYiZzEZFEQxGEEAeoIQBLZOHDkEBLlMnAR1HB2ZBBW9rwkEWlO0FQQPkPELBIi1CckE2DZIHQQEeb2xBAhtCU0ELwOBsQShdbA1BC10KoAE1LeBAwSEVp/BBIoRRV42GgCOEAJkAzQDogSHBRoFdQXcBkMGvQbPBtsAAQelCHQIpAkHACNDgAT8rcJcNhoAjgEAAQCALhUffHUAKENhbXB1cyBDcm93ZGZ1bmRpbmcgUGxhdGZvcm0gSW5pdGlhbGl6ZWSwI0OKAwEpSYv9Fov+UEm+QAAEIowAiYsDF4wAiwK8SCEFjAGL/0EAByEFiwAIjAGxiwGyCIv+sgcjshAisgGziYoBAYv/IoEgukkVgSASRImKAgAiFov+vk0XSSMIFov+TL9JIQQKFov+TFBMIQQYJAtJQAAQiwAkuUiL/xaLAIsBTwK7iYsBJAiLAEzTQv/qigEAi/8WSb1FAUQyB0sBgSgkuhcNREmBMCS6F0yBICS6FwxEiYoBAIv/Fkm9RQFEMgdLAYEoJLoXDURJgTAkuhdMgSAkuhcPRImKAgAiKUcCJwS9RQFAAAcnBIGgAblIgQqMAiKMAYsBgQoMQQAViwGBEAsnBEwkuheL/hJBAGOLAYwCiwKBChJBABOBCYwCJwSBmAEkuheL/w9BAAGJiwJBAC2LAiMJSYwDgRALJwRMgRC6SYwAJFuL/w9AABKLAoEQCycETIsAu4sDjAJC/86LAoEQC4v+Fov/FlAnBE4Cu4mLASMIjAFC/3uKAQGL/xZJvkQnB08CUL4pTgJNSwFXACBLASJZSwIlWUsDTwJLAlJLA4EEWUsETwNLAlJLBVcgCEsGVygISwdXMAhLCIHAA1OAAQAiTwJUTwmBwQNTgAEAIk8CVEsJFU8KTwhPAlJPCIACAD9QSwgVgT8ISRZXBgJPAkxQSwgVTwIITE8HUE8GUE8FUE8DIlNPBCNPAlRQTBZXBgJQTwNQTwJQTFCJNhoBSSJZJQhLARVJTwISRDYaAkkiWSUISwEVSU8CEkQ2GgNJFSQSRDYaBEkVJBJEFzYaBUkiWSUISwEVEkQiJwVlRCMIJwVLAWdJFjIHTwQIMQBLARYiFk8CTwdQTwJQTFCAAYBQSwKBOblISwJMv4EGTwcISRZXBgKAAgAGTFBMTwYIFlcGAlBPBlBPBVBPBFBJFUmBgAgORCcHSwRQSU8CuUhMv4GAowUKFoABZExQSwKI/XiAAWMxAFBPAoj9bSIoZUQjCChMZypMULAjQzYaAUkVJBJEF0kxFiMJSU4CSTgQIxJESTgHMgoSRDgASU8CFkxQvUUBQQA9IksCOAhJSwINREwJSwNJTgJLA08CiAZciP2hgB0VH3x1ABdDb250cmlidXRpb24gc3VjY2Vzc2Z1bLAjQyEFQv+/IkkpRwM2GgFHAiJZSU4CgRALJQhMFRJEMRYjCUcCOBAjEkQ4BzIKEkQiSUlLBAxBAIhLBFcCAElFDEsBgRALgRBYSSJbSU4CRQokW0lFC0RLAzgASUUMTBZMUL1FAUEAVCJLCUlPAghLAwhFA0sISwtPAogFvEUHSSMISUUHSwQSQQAOSwdLB4j870sFRQFC/5lLBYEQC0sLTIEQWCJbSUsJSU4DD0QTQf/gSwdLB4j8yEL/1iEFQv+oSwI4CEsCEkSAHhUffHUAGENvbnRyaWJ1dGlvbnMgc3VjY2Vzc2Z1bLAjQzYaAUkVJBJEF0kWSU4CSb1FAURJiPvkMQBLARJETwKI/E5LAYEwJLoXTwKBOCO6SSNTFESxTLIITLIHI7IQIrIBsyJTQQAJIihlRCMJKExnRwKBOCO6I0lUSwGBOE8Cu0mBOCO6IklUgThMu4AiFR98dQAcRnVuZHMgd2l0aGRyYXduIHN1Y2Nlc3NmdWxsebAjQzYaAUkVJBJEFzYaAkkVgSASREsBiPuhSwGIBRJISwEWSwFQvUUBRCIrZUROAiOI+vkJK0xngCEVH3x1ABtSZWZ1bmQgY2xhaW1lZCBzdWNjZXNzZnVsbHmwI0M2GgFJFSQSRBdJNhoCSU4CSSJZSU4DgSALJQhMFRJESYj7OogErUgiSUlLAwxBACNLA1cCAEsBSU4CgSALgSBYSwZMI4j6iEsDCEUDIwhFAUL/1iIrZURLAklOAgkrTGcWKkxQsCNDIjYaAUkVJBJEF0k2GgJJTgJJIllJTgOBIAslCEwVEkSI+vgiSUlLAwxBADJLA1cCAEsBgSALgSBYSUUHSwUWTFC9RQFBAA9LBEsGIoj6GUhLASMIRQJJIwhFAUL/x0sBFipMULAjQyIpNhoBRwIiWUlOAiQLJQhMFRJEIklJSwMMQQBUSwNXAgBLASQLW0lFBhZJRQe9RQFAABoiQQAOSwSIA8hBAAZLASMIRQJJIwhFAUL/yDIHSwaBKCS6Fw5BAAQiQv/WSwVJgTAkuhdMgSAkuhcMQv/ESwEWKkxQsCNDNhoBSRUkEkQXiPr1KkxQsCNDIicFZUQWKkxQsCNDIkcCKUcDNhoBRwIiWUlOAiQLJQhMFRJEgAIAACJJSwMMQQCfSwNXAgBLASQLW4j6sksCSSJZSU4DRQtXAgBFDYACAAJMUEUKKUULJQtFBSJFBksFSwUMQQAbSwpLBklOAlklCBZXBgJLC0xQRQslCEUGQv/dSwoVRQciRQZLBSUMQQAcSwhLBklOAllLCAgWVwYCSwtMUEULJQhFBkL/3UsHIwgWVwYCSwpQSwtLBksJUlBLCVcCAFBFAkkjCEUBQv9aKksCULAjQyIpRwQ2GgFJFUmBIBJENhoCSRUkEkQXSU4CTgM2GgNJFSQSRBdOA4EgEkSAAWNPAlBJTgIiFky+TRdJTgIiTgIMQQAdSwFLBQlJRQJLBA1BAARLA0UBSYFkDUEABIFkRQFHAhZXBgJFDEsFSU8CCEULRQhLB0sKDEEAQ0sHSSEEGElFCyEETAlJRQlLC08CCUlFCA1BAARLBUUHSwdJIQQKFksETFBLCiQLSwlJTgMkC7pLDUxQRQ0IRQhC/7VLARaAAgAKUEsLUCpMULAjQ4GgAa8nBL5NIicFZUQWIitlRBYiKGVEFiInBmVEFk8DTwNQTwJQTFBMUCpMULAjQzYaAUkVJBJEFxZJvUUBRDEASwGI98gSREmBMCS6FxRESYE4I7pJIlNEIklUgThMuyIoZUQjCShMZ4AlFR98dQAfQ2FtcGFpZ24gY2FuY2VsbGVkIHN1Y2Nlc3NmdWxsebAjQzYaAUkVJBJEFzYaAkkiWSUISwEVSU8CEkQ2GgNJIlklCEsBFRJETwMWSb1FAUQxAEsBiPdGEkRJgTgjuiJTRCcHTFBJTgRJvilOAk1JJVlLASJLAlhPBlBLAoEEWUsDFU8ESwJPAlJPAkxQSwFPAwlPAk8FCEwJFlcGAlwESYEEWSJMWE8CUElOAhVJTgJJgYAIDkRMvUQTQQAFSwJLAdNLAksCv4AjFR98dQAdQ2FtcGFpZ24gdXBkYXRlZCBzdWNjZXNzZnVsbHmwI0OKAwGL/RZHAr1FAURJgTgjuiJTRDIHSwGBKCS6Fw5ESYEwJLoXSYv/CElOAxZLAoEwTwK7TIEgJLoXSU4CIitlRIv/CCtMZwxBABOLAYsCD0EACyInBmVEIwgnBkxniwCL/lAiFksBvk0Xi/8IFr+LAYwAiYoBAYv/FkmBOCO6IlNAAAMiTImLAEmBOCO6IklUgThMuyIoZUQjCShMZyNMiQ==", "clear": "C4EBQw=="}, "desc": "\n    Campus Crowdfunding Platform Smart Contract\n\n    Features:\n    - Create campaigns with title, description, goal, and deadline\n    - Accept contributions in ALGO\n    - Track campaign progress\n    - Escrow functionality: funds released only if goal met by deadline\n    - Refund mechanism if goal not met\n    - Campaign creator can withdraw funds after successful campaign\n\n    Storage:\n    - itob(campaign_id) -> CampaignState (57 bytes, updated in place)\n    - \"m\" + itob(campaign_id) -> CampaignMetadata (sized to the text)\n    - itob(campaign_id) + address -> contributed microALGOs (8 bytes), its MBR\n      paid by the contributor as a deposit returned when the entry is deleted\n    - \"d\" + itob(deadline day) -> number of campaigns ending that day (8 bytes)\n    - \"d\" + itob(deadline day) + itob(page) -> up to 128 of their IDs (8 bytes each)\n    - \"c\" + creator address -> number of campaigns the creator made (8 bytes)\n    - \"c\" + creator address + itob(page) -> up to 128 of their IDs (8 bytes each)\n    - \"top\" -> leaderboard of the 10 campaigns that raised the most (160 bytes)\n\n    Campaign IDs are assigned sequentially from 1, so every campaign is\n    in the range 1..total_campaigns.\n\n    Platform totals are kept in global state and updated by the calls that\n    change them, so they never need a scan of the boxes.\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAyIDEyOCAyMTcwMAogICAgYnl0ZWNibG9jayAiYWN0aXZlX2NhbXBhaWducyIgMHggMHgxNTFmN2M3NSAidG90YWxfcmFpc2VkIiAweDc0NmY3MCAidG90YWxfY2FtcGFpZ25zIiAic3VjY2Vzc2Z1bF9jYW1wYWlnbnMiIDB4NmQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozNzQtMzc1CiAgICAvLyAjIEdsb2JhbCBzdGF0ZSB0byB0cmFjayB0b3RhbCBjYW1wYWlnbnMgYW5kIGhhbmQgb3V0IElEcwogICAgLy8gc2VsZi50b3RhbF9jYW1wYWlnbnMgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA1IC8vICJ0b3RhbF9jYW1wYWlnbnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozNzYtMzc3CiAgICAvLyAjIENvbnRyaWJ1dGlvbnMgcmVjZWl2ZWQgYWNyb3NzIGFsbCBjYW1wYWlnbnMsIGxlc3MgcmVmdW5kcywgaW4gbWljcm9BTEdPcwogICAgLy8gc2VsZi50b3RhbF9yYWlzZWQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlY18zIC8vICJ0b3RhbF9yYWlzZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozNzgtMzc5CiAgICAvLyAjIENhbXBhaWducyBub3QgeWV0IGNhbmNlbGxlZCwgd2l0aGRyYXduIG9yIGNsb3NlZCBhZnRlciBtaXNzaW5nIHRoZWlyIGdvYWwKICAgIC8vIHNlbGYuYWN0aXZlX2NhbXBhaWducyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzAgLy8gImFjdGl2ZV9jYW1wYWlnbnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozODAtMzgxCiAgICAvLyAjIENhbXBhaWducyB3aG9zZSBjb250cmlidXRpb25zIGhhdmUgcmVhY2hlZCB0aGVpciBnb2FsCiAgICAvLyBzZWxmLnN1Y2Nlc3NmdWxfY2FtcGFpZ25zID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgNiAvLyAic3VjY2Vzc2Z1bF9jYW1wYWlnbnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gY2xhc3MgQ2FtcHVzRnVuZGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAyMgogICAgcHVzaGJ5dGVzcyAweGI2NGUxYzM5IDB4MDRiOTRjOWMgMHg3NTFjMWQ5OSAweDE1YmRhZjA5IDB4NWE1M2I0MTUgMHgwZjkwZjEwYiAweDg4YjUwOWM5IDB4ZDgzNjQ4MWQgMHgwNDc5YmRiMSAweDA4NmQwOTRkIDB4MmYwMzgxYjEgMHhhMTc1YjAzNSAweDJkNzQyYTgwIDB4ZDRiNzgxMDMgMHg4NDU2OWZjMSAweDhhMTE0NTVlIC8vIG1ldGhvZCAiY3JlYXRlX2NhbXBhaWduKHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NCxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJjb250cmlidXRlKHVpbnQ2NCxwYXkpc3RyaW5nIiwgbWV0aG9kICJjb250cmlidXRlX21hbnkoKHVpbnQ2NCx1aW50NjQpW10scGF5KXN0cmluZyIsIG1ldGhvZCAid2l0aGRyYXdfZnVuZHModWludDY0KXN0cmluZyIsIG1ldGhvZCAiY2xhaW1fcmVmdW5kKHVpbnQ2NCxhZGRyZXNzKXN0cmluZyIsIG1ldGhvZCAicmVmdW5kX2JhdGNoKHVpbnQ2NCxhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJyZWxlYXNlX2RlcG9zaXRzKHVpbnQ2NCxhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJjbG9zZV9mYWlsZWRfY2FtcGFpZ25zKHVpbnQ2NFtdKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2NhbXBhaWduX2luZm8odWludDY0KShhZGRyZXNzLHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NCx1aW50NjQsYm9vbCxib29sLHN0cmluZykiLCBtZXRob2QgImdldF90b3RhbF9jYW1wYWlnbnMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2NhbXBhaWducyh1aW50NjRbXSkoYWRkcmVzcyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCx1aW50NjQsdWludDY0LGJvb2wsYm9vbCxzdHJpbmcpW10iLCBtZXRob2QgImluY3JlYXNlX2J1ZGdldCgpdm9pZCIsIG1ldGhvZCAiZ2V0X2NyZWF0b3JfY2FtcGFpZ25zKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkodWludDY0LHVpbnQ2NFtdKSIsIG1ldGhvZCAiZ2V0X3BsYXRmb3JtX3N0YXRzKCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LCh1aW50NjQsdWludDY0KVsxMF0pIiwgbWV0aG9kICJjYW5jZWxfY2FtcGFpZ24odWludDY0KXN0cmluZyIsIG1ldGhvZCAidXBkYXRlX2NhbXBhaWduKHVpbnQ2NCxzdHJpbmcsc3RyaW5nKXN0cmluZyIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZV9jYW1wYWlnbiBjb250cmlidXRlIGNvbnRyaWJ1dGVfbWFueSB3aXRoZHJhd19mdW5kcyBjbGFpbV9yZWZ1bmQgcmVmdW5kX2JhdGNoIHJlbGVhc2VfZGVwb3NpdHMgY2xvc2VfZmFpbGVkX2NhbXBhaWducyBnZXRfY2FtcGFpZ25faW5mbyBnZXRfdG90YWxfY2FtcGFpZ25zIGdldF9jYW1wYWlnbnMgbWFpbl9pbmNyZWFzZV9idWRnZXRfcm91dGVAMTYgZ2V0X2NyZWF0b3JfY2FtcGFpZ25zIGdldF9wbGF0Zm9ybV9zdGF0cyBjYW5jZWxfY2FtcGFpZ24gdXBkYXRlX2NhbXBhaWduCiAgICBlcnIKCm1haW5faW5jcmVhc2VfYnVkZ2V0X3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc1MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9Ob09wQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjM0MwogICAgLy8gY2xhc3MgQ2FtcHVzRnVuZGluZyhBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4ZmNhZGMyNWMgLy8gbWV0aG9kICJjcmVhdGVfYXBwbGljYXRpb24oKXN0cmluZyIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2FwcGxpY2F0aW9uX3JvdXRlQDIzCiAgICBlcnIKCm1haW5fY3JlYXRlX2FwcGxpY2F0aW9uX3JvdXRlQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjM4MwogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiTm9PcCJdLCBjcmVhdGU9InJlcXVpcmUiKQogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDI4NDM2MTZkNzA3NTczMjA0MzcyNmY3NzY0NjY3NTZlNjQ2OTZlNjcyMDUwNmM2MTc0NjY2ZjcyNmQyMDQ5NmU2OTc0Njk2MTZjNjk3YTY1NjQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5zZXR0bGVfY29udHJpYnV0aW9uKGNhbXBhaWduX2lkOiB1aW50NjQsIGNvbnRyaWJ1dG9yOiBieXRlcywgcmVmdW5kOiB1aW50NjQpIC0+IHVpbnQ2NDoKc2V0dGxlX2NvbnRyaWJ1dGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNTktMTYwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHNldHRsZV9jb250cmlidXRpb24oY2FtcGFpZ25faWQ6IFVJbnQ2NCwgY29udHJpYnV0b3I6IEFjY291bnQsIHJlZnVuZDogYm9vbCkgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICBieXRlY18xIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNDgKICAgIC8vIHJldHVybiBvcC5pdG9iKGNhbXBhaWduX2lkKSArIGNvbnRyaWJ1dG9yLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNjcKICAgIC8vIGNvbnRyaWJ1dGVkLCBleGlzdHMgPSBjb250cmlidXRpb25fYm94Lm1heWJlKCkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNjgKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBibnogc2V0dGxlX2NvbnRyaWJ1dGlvbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNjkKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKc2V0dGxlX2NvbnRyaWJ1dGlvbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTcwCiAgICAvLyBhbW91bnQgPSBvcC5idG9pKGNvbnRyaWJ1dGVkKQogICAgZnJhbWVfZGlnIDMKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE3Mi0xNzMKICAgIC8vICMgQ2xlYXIgdGhlIGVudHJ5IGJlZm9yZSBwYXlpbmcgb3V0OyBkZWxldGluZyBhbHNvIHJlbGVhc2VzIGl0cyBNQlIKICAgIC8vIGNvbnRyaWJ1dGlvbl9ib3guZGVsZXRlKCkKICAgIGZyYW1lX2RpZyAyCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNzUKICAgIC8vIHBheW91dCA9IFVJbnQ2NChDT05UUklCVVRJT05fREVQT1NJVCkKICAgIGludGMgNSAvLyAyMTcwMAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTc2CiAgICAvLyBpZiByZWZ1bmQ6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IHNldHRsZV9jb250cmlidXRpb25fYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTc1CiAgICAvLyBwYXlvdXQgPSBVSW50NjQoQ09OVFJJQlVUSU9OX0RFUE9TSVQpCiAgICBpbnRjIDUgLy8gMjE3MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNzcKICAgIC8vIHBheW91dCArPSBhbW91bnQKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBmcmFtZV9idXJ5IDEKCnNldHRsZV9jb250cmlidXRpb25fYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE3OC0xODIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1jb250cmlidXRvciwKICAgIC8vICAgICBhbW91bnQ9cGF5b3V0LAogICAgLy8gICAgIGZlZT0wLCAgIyBDYWxsZXIgcGF5cyBmZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTc4CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTgxCiAgICAvLyBmZWU9MCwgICMgQ2FsbGVyIHBheXMgZmVlCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNzgtMTgyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9Y29udHJpYnV0b3IsCiAgICAvLyAgICAgYW1vdW50PXBheW91dCwKICAgIC8vICAgICBmZWU9MCwgICMgQ2FsbGVyIHBheXMgZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gcmV0dXJuIGFtb3VudAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LnJlYWRfY3JlYXRvcihrZXk6IGJ5dGVzKSAtPiBieXRlczoKcmVhZF9jcmVhdG9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIwNS0yMDYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVhZF9jcmVhdG9yKGtleTogQnl0ZXMpIC0+IEFjY291bnQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMDgKICAgIC8vIHJldHVybiBBY2NvdW50KG9wLkJveC5leHRyYWN0KGtleSwgQ1JFQVRPUl9PRkZTRVQsIDMyKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hpbnQgMzIKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LmFwcGVuZF90b19wYWdlZF9pbmRleChrZXk6IGJ5dGVzLCBjYW1wYWlnbl9pZDogdWludDY0KSAtPiB2b2lkOgphcHBlbmRfdG9fcGFnZWRfaW5kZXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjI5LTIzMAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhcHBlbmRfdG9fcGFnZWRfaW5kZXgoa2V5OiBCeXRlcywgY2FtcGFpZ25faWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIzMwogICAgLy8gY291bnQgPSBvcC5idG9pKGNvdW50X2JveC5nZXQoZGVmYXVsdD1vcC5pdG9iKDApKSkKICAgIGludGNfMCAvLyAwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9nZXQKICAgIHNlbGVjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gY291bnRfYm94LnB1dChvcC5pdG9iKGNvdW50ICsgMSkpCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMzYKICAgIC8vIHBhZ2VfYm94ID0gQm94UmVmKGtleT1pbmRleF9wYWdlX2tleShrZXksIGNvdW50IC8vIElOREVYX1BBR0VfSURTKSkKICAgIGR1cAogICAgaW50YyA0IC8vIDEyOAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gcmV0dXJuIGtleSArIG9wLml0b2IocGFnZSkKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjM3CiAgICAvLyBvZmZzZXQgPSAoY291bnQgJSBJTkRFWF9QQUdFX0lEUykgKiA4CiAgICBpbnRjIDQgLy8gMTI4CiAgICAlCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjM4CiAgICAvLyBpZiBvZmZzZXQgPT0gMDoKICAgIGJueiBhcHBlbmRfdG9fcGFnZWRfaW5kZXhfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMzkKICAgIC8vIHBhZ2VfYm94LmNyZWF0ZShzaXplPVVJbnQ2NCg4KSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2NyZWF0ZQogICAgcG9wCgphcHBlbmRfdG9fcGFnZWRfaW5kZXhfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gcGFnZV9ib3gucmVwbGFjZShvZmZzZXQsIG9wLml0b2IoY2FtcGFpZ25faWQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKYXBwZW5kX3RvX3BhZ2VkX2luZGV4X2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI0MQogICAgLy8gcGFnZV9ib3gucmVzaXplKG9mZnNldCArIDgpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBib3hfcmVzaXplCiAgICBiIGFwcGVuZF90b19wYWdlZF9pbmRleF9hZnRlcl9pZl9lbHNlQDMKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuYXNzZXJ0X3JlZnVuZHNfb3BlbihjYW1wYWlnbl9pZDogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfcmVmdW5kc19vcGVuOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI0NS0yNDYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X3JlZnVuZHNfb3BlbihjYW1wYWlnbl9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjQ4CiAgICAvLyBzdGF0ZV9rZXkgPSBvcC5pdG9iKGNhbXBhaWduX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjQ5CiAgICAvLyBhc3NlcnQgQm94UmVmKGtleT1zdGF0ZV9rZXkpLCAiQ2FtcGFpZ24gZG9lcyBub3QgZXhpc3QiCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjUxLTI1MgogICAgLy8gIyBWZXJpZnkgY2FtcGFpZ24gaGFzIGVuZGVkCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChERUFETElORV9PRkZTRVQpKSwgIkNhbXBhaWduIHN0aWxsIGFjdGl2ZSIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjUxLTI1MgogICAgLy8gIyBWZXJpZnkgY2FtcGFpZ24gaGFzIGVuZGVkCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChERUFETElORV9PRkZTRVQpKSwgIkNhbXBhaWduIHN0aWxsIGFjdGl2ZSIKICAgIHB1c2hpbnQgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI1MS0yNTIKICAgIC8vICMgVmVyaWZ5IGNhbXBhaWduIGhhcyBlbmRlZAogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gcmVhZF91aW50NjQoc3RhdGVfa2V5LCBVSW50NjQoREVBRExJTkVfT0ZGU0VUKSksICJDYW1wYWlnbiBzdGlsbCBhY3RpdmUiCiAgICA+CiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gc3RpbGwgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyNTQtMjU1CiAgICAvLyAjIFZlcmlmeSBnb2FsIHdhcyBOT1QgbWV0CiAgICAvLyB0b3RhbF9yYWlzZWQgPSByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChUT1RBTF9SQUlTRURfT0ZGU0VUKSkKICAgIHB1c2hpbnQgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gYXNzZXJ0IHRvdGFsX3JhaXNlZCA8IHJlYWRfdWludDY0KHN0YXRlX2tleSwgVUludDY0KEdPQUxfQU1PVU5UX09GRlNFVCkpLCAiR29hbCB3YXMgcmVhY2hlZCwgbm8gcmVmdW5kcyIKICAgIHB1c2hpbnQgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gYXNzZXJ0IHRvdGFsX3JhaXNlZCA8IHJlYWRfdWludDY0KHN0YXRlX2tleSwgVUludDY0KEdPQUxfQU1PVU5UX09GRlNFVCkpLCAiR29hbCB3YXMgcmVhY2hlZCwgbm8gcmVmdW5kcyIKICAgIDwKICAgIGFzc2VydCAvLyBHb2FsIHdhcyByZWFjaGVkLCBubyByZWZ1bmRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuYXNzZXJ0X2dvYWxfcmVhY2hlZChjYW1wYWlnbl9pZDogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfZ29hbF9yZWFjaGVkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI1OS0yNjAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X2dvYWxfcmVhY2hlZChjYW1wYWlnbl9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjYyCiAgICAvLyBzdGF0ZV9rZXkgPSBvcC5pdG9iKGNhbXBhaWduX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjYzCiAgICAvLyBhc3NlcnQgQm94UmVmKGtleT1zdGF0ZV9rZXkpLCAiQ2FtcGFpZ24gZG9lcyBub3QgZXhpc3QiCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjY1LTI2NgogICAgLy8gIyBWZXJpZnkgY2FtcGFpZ24gaGFzIGVuZGVkCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChERUFETElORV9PRkZTRVQpKSwgIkNhbXBhaWduIHN0aWxsIGFjdGl2ZSIKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjY1LTI2NgogICAgLy8gIyBWZXJpZnkgY2FtcGFpZ24gaGFzIGVuZGVkCiAgICAvLyBhc3NlcnQgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChERUFETElORV9PRkZTRVQpKSwgIkNhbXBhaWduIHN0aWxsIGFjdGl2ZSIKICAgIHB1c2hpbnQgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI2NS0yNjYKICAgIC8vICMgVmVyaWZ5IGNhbXBhaWduIGhhcyBlbmRlZAogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gcmVhZF91aW50NjQoc3RhdGVfa2V5LCBVSW50NjQoREVBRExJTkVfT0ZGU0VUKSksICJDYW1wYWlnbiBzdGlsbCBhY3RpdmUiCiAgICA+CiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gc3RpbGwgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyNjgtMjY5CiAgICAvLyAjIFZlcmlmeSBnb2FsIHdhcyBtZXQKICAgIC8vIHRvdGFsX3JhaXNlZCA9IHJlYWRfdWludDY0KHN0YXRlX2tleSwgVUludDY0KFRPVEFMX1JBSVNFRF9PRkZTRVQpKQogICAgcHVzaGludCA0OAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3Qoa2V5LCBvZmZzZXQsIDgpKQogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjcwCiAgICAvLyBhc3NlcnQgdG90YWxfcmFpc2VkID49IHJlYWRfdWludDY0KHN0YXRlX2tleSwgVUludDY0KEdPQUxfQU1PVU5UX09GRlNFVCkpLCAiR29hbCBub3QgcmVhY2hlZCIKICAgIHB1c2hpbnQgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gYXNzZXJ0IHRvdGFsX3JhaXNlZCA+PSByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChHT0FMX0FNT1VOVF9PRkZTRVQpKSwgIkdvYWwgbm90IHJlYWNoZWQiCiAgICA+PQogICAgYXNzZXJ0IC8vIEdvYWwgbm90IHJlYWNoZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC51cGRhdGVfbGVhZGVyYm9hcmQoY2FtcGFpZ25faWQ6IHVpbnQ2NCwgdG90YWxfcmFpc2VkOiB1aW50NjQpIC0+IHZvaWQ6CnVwZGF0ZV9sZWFkZXJib2FyZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyODUtMjg2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHVwZGF0ZV9sZWFkZXJib2FyZChjYW1wYWlnbl9pZDogVUludDY0LCB0b3RhbF9yYWlzZWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gbGVhZGVyYm9hcmQgPSBCb3hSZWYoa2V5PUxFQURFUkJPQVJEX0tFWSkKICAgIGJ5dGVjIDQgLy8gMHg3NDZmNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyOTIKICAgIC8vIGlmIG5vdCBsZWFkZXJib2FyZDoKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IHVwZGF0ZV9sZWFkZXJib2FyZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyOTEKICAgIC8vIGxlYWRlcmJvYXJkID0gQm94UmVmKGtleT1MRUFERVJCT0FSRF9LRVkpCiAgICBieXRlYyA0IC8vIDB4NzQ2ZjcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjkzCiAgICAvLyBsZWFkZXJib2FyZC5jcmVhdGUoc2l6ZT1VSW50NjQoTEVBREVSQk9BUkRfU0laRSkpCiAgICBwdXNoaW50IDE2MAogICAgYm94X2NyZWF0ZQogICAgcG9wCgp1cGRhdGVfbGVhZGVyYm9hcmRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI5NS0yOTYKICAgIC8vICMgVGhlIGNhbXBhaWduJ3MgY3VycmVudCBwb3NpdGlvbiwgZWxzZSB0aGUgbGFzdCBvbmUgaWYgaXQgbm93IGJlYXRzIGl0CiAgICAvLyBwb3NpdGlvbiA9IFVJbnQ2NChMRUFERVJCT0FSRF9MRU5HVEgpCiAgICBwdXNoaW50IDEwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyOTcKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UoTEVBREVSQk9BUkRfTEVOR1RIKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKCnVwZGF0ZV9sZWFkZXJib2FyZF9mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Mjk3CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKExFQURFUkJPQVJEX0xFTkdUSCk6CiAgICBmcmFtZV9kaWcgMQogICAgcHVzaGludCAxMAogICAgPAogICAgYnogdXBkYXRlX2xlYWRlcmJvYXJkX2FmdGVyX2ZvckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Mjk4CiAgICAvLyBpZiBvcC5idG9pKGxlYWRlcmJvYXJkLmV4dHJhY3QoaW5kZXggKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFLCA4KSkgPT0gY2FtcGFpZ25faWQ6CiAgICBmcmFtZV9kaWcgMQogICAgcHVzaGludCAxNgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gbGVhZGVyYm9hcmQgPSBCb3hSZWYoa2V5PUxFQURFUkJPQVJEX0tFWSkKICAgIGJ5dGVjIDQgLy8gMHg3NDZmNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyOTgKICAgIC8vIGlmIG9wLmJ0b2kobGVhZGVyYm9hcmQuZXh0cmFjdChpbmRleCAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIDgpKSA9PSBjYW1wYWlnbl9pZDoKICAgIHN3YXAKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgZnJhbWVfZGlnIC0yCiAgICA9PQogICAgYnogdXBkYXRlX2xlYWRlcmJvYXJkX2FmdGVyX2lmX2Vsc2VANgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMgoKdXBkYXRlX2xlYWRlcmJvYXJkX2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gaWYgcG9zaXRpb24gPT0gTEVBREVSQk9BUkRfTEVOR1RIOgogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgMTAKICAgID09CiAgICBieiB1cGRhdGVfbGVhZGVyYm9hcmRfd2hpbGVfdG9wQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzAyCiAgICAvLyBwb3NpdGlvbiA9IFVJbnQ2NChMRUFERVJCT0FSRF9MRU5HVEggLSAxKQogICAgcHVzaGludCA5CiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyOTEKICAgIC8vIGxlYWRlcmJvYXJkID0gQm94UmVmKGtleT1MRUFERVJCT0FSRF9LRVkpCiAgICBieXRlYyA0IC8vIDB4NzQ2ZjcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzAzCiAgICAvLyBsb3dlc3QgPSBvcC5idG9pKGxlYWRlcmJvYXJkLmV4dHJhY3QocG9zaXRpb24gKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFICsgOCwgOCkpCiAgICBwdXNoaW50IDE1MgogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzA0CiAgICAvLyBpZiB0b3RhbF9yYWlzZWQgPD0gbG93ZXN0OgogICAgZnJhbWVfZGlnIC0xCiAgICA+PQogICAgYnogdXBkYXRlX2xlYWRlcmJvYXJkX3doaWxlX3RvcEAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMwNQogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCnVwZGF0ZV9sZWFkZXJib2FyZF93aGlsZV90b3BAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzA3LTMwOAogICAgLy8gIyBTaGlmdCBlbnRyaWVzIHdpdGggc21hbGxlciB0b3RhbHMgZG93biBvbmUgcGxhY2UKICAgIC8vIHdoaWxlIHBvc2l0aW9uID4gMDoKICAgIGZyYW1lX2RpZyAyCiAgICBieiB1cGRhdGVfbGVhZGVyYm9hcmRfYWZ0ZXJfd2hpbGVAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMDkKICAgIC8vIGFib3ZlID0gbGVhZGVyYm9hcmQuZXh0cmFjdCgocG9zaXRpb24gLSAxKSAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIExFQURFUkJPQVJEX0VOVFJZX1NJWkUpCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBwdXNoaW50IDE2CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjkxCiAgICAvLyBsZWFkZXJib2FyZCA9IEJveFJlZihrZXk9TEVBREVSQk9BUkRfS0VZKQogICAgYnl0ZWMgNCAvLyAweDc0NmY3MAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gYWJvdmUgPSBsZWFkZXJib2FyZC5leHRyYWN0KChwb3NpdGlvbiAtIDEpICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgTEVBREVSQk9BUkRfRU5UUllfU0laRSkKICAgIHN3YXAKICAgIHB1c2hpbnQgMTYKICAgIGJveF9leHRyYWN0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18yIC8vIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMTAKICAgIC8vIGlmIG9wLmJ0b2kob3AuZXh0cmFjdChhYm92ZSwgOCwgOCkpID49IHRvdGFsX3JhaXNlZDoKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgID49CiAgICBibnogdXBkYXRlX2xlYWRlcmJvYXJkX2FmdGVyX3doaWxlQDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzEyCiAgICAvLyBsZWFkZXJib2FyZC5yZXBsYWNlKHBvc2l0aW9uICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgYWJvdmUpCiAgICBmcmFtZV9kaWcgMgogICAgcHVzaGludCAxNgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gbGVhZGVyYm9hcmQgPSBCb3hSZWYoa2V5PUxFQURFUkJPQVJEX0tFWSkKICAgIGJ5dGVjIDQgLy8gMHg3NDZmNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMTIKICAgIC8vIGxlYWRlcmJvYXJkLnJlcGxhY2UocG9zaXRpb24gKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFLCBhYm92ZSkKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcmVwbGFjZQogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMgogICAgYiB1cGRhdGVfbGVhZGVyYm9hcmRfd2hpbGVfdG9wQDEzCgp1cGRhdGVfbGVhZGVyYm9hcmRfYWZ0ZXJfd2hpbGVAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzE1CiAgICAvLyBwb3NpdGlvbiAqIExFQURFUkJPQVJEX0VOVFJZX1NJWkUsIG9wLml0b2IoY2FtcGFpZ25faWQpICsgb3AuaXRvYih0b3RhbF9yYWlzZWQpCiAgICBmcmFtZV9kaWcgMgogICAgcHVzaGludCAxNgogICAgKgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gbGVhZGVyYm9hcmQgPSBCb3hSZWYoa2V5PUxFQURFUkJPQVJEX0tFWSkKICAgIGJ5dGVjIDQgLy8gMHg3NDZmNzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMTQtMzE2CiAgICAvLyBsZWFkZXJib2FyZC5yZXBsYWNlKAogICAgLy8gICAgIHBvc2l0aW9uICogTEVBREVSQk9BUkRfRU5UUllfU0laRSwgb3AuaXRvYihjYW1wYWlnbl9pZCkgKyBvcC5pdG9iKHRvdGFsX3JhaXNlZCkKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCnVwZGF0ZV9sZWFkZXJib2FyZF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Mjk3CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKExFQURFUkJPQVJEX0xFTkdUSCk6CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiB1cGRhdGVfbGVhZGVyYm9hcmRfZm9yX2hlYWRlckAzCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LmxvYWRfY2FtcGFpZ25faW5mbyhjYW1wYWlnbl9pZDogdWludDY0KSAtPiBieXRlczoKbG9hZF9jYW1wYWlnbl9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMxOS0zMjAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hZF9jYW1wYWlnbl9pbmZvKGNhbXBhaWduX2lkOiBVSW50NjQpIC0+IENhbXBhaWduSW5mbzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gc3RhdGVfYnl0ZXMsIGV4aXN0cyA9IEJveFJlZihrZXk9b3AuaXRvYihjYW1wYWlnbl9pZCkpLm1heWJlKCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzIzCiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiQ2FtcGFpZ24gZG9lcyBub3QgZXhpc3QiCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNDIKICAgIC8vIHJldHVybiBCeXRlcyhNRVRBREFUQV9LRVlfUFJFRklYKSArIG9wLml0b2IoY2FtcGFpZ25faWQpCiAgICBieXRlYyA3IC8vIDB4NmQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzI2LTMyNwogICAgLy8gIyBFdmVyeSBjYW1wYWlnbiB3aXRoIGEgc3RhdGUgYm94IGhhcyBhIG1ldGFkYXRhIGJveAogICAgLy8gbWV0YWRhdGFfYnl0ZXMgPSBCb3hSZWYoa2V5PW1ldGFkYXRhX2tleShjYW1wYWlnbl9pZCkpLmdldChkZWZhdWx0PUJ5dGVzKCkpCiAgICBib3hfZ2V0CiAgICBieXRlY18xIC8vIDB4CiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMzEKICAgIC8vIGNyZWF0b3I9c3RhdGUuY3JlYXRvciwKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMzIKICAgIC8vIHRpdGxlPW1ldGFkYXRhLnRpdGxlLAogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGludGNfMyAvLyAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMzMKICAgIC8vIGRlc2NyaXB0aW9uPW1ldGFkYXRhLmRlc2NyaXB0aW9uLAogICAgZGlnIDMKICAgIHB1c2hpbnQgNAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyA0CiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzM0CiAgICAvLyBnb2FsX2Ftb3VudD1zdGF0ZS5nb2FsX2Ftb3VudCwKICAgIGRpZyA1CiAgICBleHRyYWN0IDMyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMzUKICAgIC8vIGRlYWRsaW5lPXN0YXRlLmRlYWRsaW5lLAogICAgZGlnIDYKICAgIGV4dHJhY3QgNDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMzNgogICAgLy8gdG90YWxfcmFpc2VkPXN0YXRlLnRvdGFsX3JhaXNlZCwKICAgIGRpZyA3CiAgICBleHRyYWN0IDQ4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTozMzcKICAgIC8vIGlzX2FjdGl2ZT1zdGF0ZS5pc19hY3RpdmUsCiAgICBkaWcgOAogICAgcHVzaGludCA0NDgKICAgIGdldGJpdAogICAgcHVzaGJ5dGVzIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMzOAogICAgLy8gZnVuZHNfd2l0aGRyYXduPXN0YXRlLmZ1bmRzX3dpdGhkcmF3biwKICAgIHVuY292ZXIgOQogICAgcHVzaGludCA0NDkKICAgIGdldGJpdAogICAgcHVzaGJ5dGVzIDB4MDAKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjMzOQogICAgLy8gaW1hZ2VfdXJsPW1ldGFkYXRhLmltYWdlX3VybCwKICAgIGRpZyA5CiAgICBsZW4KICAgIHVuY292ZXIgMTAKICAgIHVuY292ZXIgOAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MzMwLTM0MAogICAgLy8gcmV0dXJuIENhbXBhaWduSW5mbygKICAgIC8vICAgICBjcmVhdG9yPXN0YXRlLmNyZWF0b3IsCiAgICAvLyAgICAgdGl0bGU9bWV0YWRhdGEudGl0bGUsCiAgICAvLyAgICAgZGVzY3JpcHRpb249bWV0YWRhdGEuZGVzY3JpcHRpb24sCiAgICAvLyAgICAgZ29hbF9hbW91bnQ9c3RhdGUuZ29hbF9hbW91bnQsCiAgICAvLyAgICAgZGVhZGxpbmU9c3RhdGUuZGVhZGxpbmUsCiAgICAvLyAgICAgdG90YWxfcmFpc2VkPXN0YXRlLnRvdGFsX3JhaXNlZCwKICAgIC8vICAgICBpc19hY3RpdmU9c3RhdGUuaXNfYWN0aXZlLAogICAgLy8gICAgIGZ1bmRzX3dpdGhkcmF3bj1zdGF0ZS5mdW5kc193aXRoZHJhd24sCiAgICAvLyAgICAgaW1hZ2VfdXJsPW1ldGFkYXRhLmltYWdlX3VybCwKICAgIC8vICkKICAgIHVuY292ZXIgOAogICAgcHVzaGJ5dGVzIDB4MDAzZgogICAgY29uY2F0CiAgICBkaWcgOAogICAgbGVuCiAgICBwdXNoaW50IDYzCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDgKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBzd2FwCiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIHVuY292ZXIgNAogICAgaW50Y18xIC8vIDEKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5jcmVhdGVfY2FtcGFpZ25bcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfY2FtcGFpZ246CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Mzg4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQxMC00MTEKICAgIC8vICMgQXNzaWduIHRoZSBuZXh0IGNhbXBhaWduIElECiAgICAvLyBjYW1wYWlnbl9pZCA9IHNlbGYudG90YWxfY2FtcGFpZ25zLnZhbHVlICsgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInRvdGFsX2NhbXBhaWducyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jYW1wYWlnbnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQxMgogICAgLy8gc2VsZi50b3RhbF9jYW1wYWlnbnMudmFsdWUgPSBjYW1wYWlnbl9pZAogICAgYnl0ZWMgNSAvLyAidG90YWxfY2FtcGFpZ25zIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDEzCiAgICAvLyBzdGF0ZV9ib3ggPSBCb3hSZWYoa2V5PW9wLml0b2IoY2FtcGFpZ25faWQpKQogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDE1LTQxNgogICAgLy8gIyBDYWxjdWxhdGUgZGVhZGxpbmUKICAgIC8vIGRlYWRsaW5lID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgKyBkdXJhdGlvbl9zZWNvbmRzCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICB1bmNvdmVyIDQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0MjAKICAgIC8vIGNyZWF0b3I9QWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0MjIKICAgIC8vIGRlYWRsaW5lPUFSQzRVSW50NjQoZGVhZGxpbmUpLAogICAgZGlnIDEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0MjMKICAgIC8vIHRvdGFsX3JhaXNlZD1BUkM0VUludDY0KFVJbnQ2NCgwKSksCiAgICBpbnRjXzAgLy8gMAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQxOC00MjYKICAgIC8vICMgU3RvcmUgdGhlIGhvdCByZWNvcmQKICAgIC8vIHN0YXRlID0gQ2FtcGFpZ25TdGF0ZSgKICAgIC8vICAgICBjcmVhdG9yPUFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgZ29hbF9hbW91bnQ9QVJDNFVJbnQ2NChnb2FsX2Ftb3VudCksCiAgICAvLyAgICAgZGVhZGxpbmU9QVJDNFVJbnQ2NChkZWFkbGluZSksCiAgICAvLyAgICAgdG90YWxfcmFpc2VkPUFSQzRVSW50NjQoVUludDY0KDApKSwKICAgIC8vICAgICBpc19hY3RpdmU9Qm9vbChUcnVlKSwKICAgIC8vICAgICBmdW5kc193aXRoZHJhd249Qm9vbChGYWxzZSksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg4MAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDI3CiAgICAvLyBzdGF0ZV9ib3guY3JlYXRlKHNpemU9VUludDY0KFNUQVRFX0JPWF9TSVpFKSkKICAgIGRpZyAyCiAgICBwdXNoaW50IDU3CiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0MjgKICAgIC8vIHN0YXRlX2JveC5wdXQoc3RhdGUuYnl0ZXMpCiAgICBkaWcgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQzMC00MzUKICAgIC8vICMgU3RvcmUgdGhlIHRleHQgaW4gYSBib3ggc2l6ZWQgdG8gdGhlIGVuY29kZWQgbWV0YWRhdGEKICAgIC8vIG1ldGFkYXRhID0gQ2FtcGFpZ25NZXRhZGF0YSgKICAgIC8vICAgICB0aXRsZT1BUkM0U3RyaW5nKHRpdGxlKSwKICAgIC8vICAgICBkZXNjcmlwdGlvbj1BUkM0U3RyaW5nKGRlc2NyaXB0aW9uKSwKICAgIC8vICAgICBpbWFnZV91cmw9QVJDNFN0cmluZyhpbWFnZV91cmwpLAogICAgLy8gKQogICAgcHVzaGludCA2CiAgICB1bmNvdmVyIDcKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHB1c2hieXRlcyAweDAwMDYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgdW5jb3ZlciA2CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDM3CiAgICAvLyBhc3NlcnQgbWV0YWRhdGFfYnl0ZXMubGVuZ3RoIDw9IE1BWF9DQU1QQUlHTl9CT1hfU0laRSwgIkNhbXBhaWduIGRhdGEgdG9vIGxhcmdlIgogICAgZHVwCiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCAxMDI0CiAgICA8PQogICAgYXNzZXJ0IC8vIENhbXBhaWduIGRhdGEgdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTQyCiAgICAvLyByZXR1cm4gQnl0ZXMoTUVUQURBVEFfS0VZX1BSRUZJWCkgKyBvcC5pdG9iKGNhbXBhaWduX2lkKQogICAgYnl0ZWMgNyAvLyAweDZkCiAgICBkaWcgNAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDM5CiAgICAvLyBtZXRhZGF0YV9ib3guY3JlYXRlKHNpemU9bWV0YWRhdGFfYnl0ZXMubGVuZ3RoKQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gbWV0YWRhdGFfYm94LnB1dChtZXRhZGF0YV9ieXRlcykKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMTQKICAgIC8vIHJldHVybiBCeXRlcyhERUFETElORV9CVUNLRVRfUFJFRklYKSArIG9wLml0b2IoZGVhZGxpbmUgLy8gREVBRExJTkVfQlVDS0VUX1NFQ09ORFMpCiAgICBwdXNoaW50IDg2NDAwCiAgICAvCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg2NAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDQyLTQ0NAogICAgLy8gIyBJbmRleCBieSBkZWFkbGluZSBkYXkgc28gZW5kZWQgY2FtcGFpZ25zIGNhbiBiZSBmb3VuZCB3aXRob3V0IGEgc2NhbiwKICAgIC8vICMgYW5kIGJ5IGNyZWF0b3Igc28gYW4gYWNjb3VudCdzIGNhbXBhaWducyBjYW4gYmUgbGlzdGVkIGRpcmVjdGx5CiAgICAvLyBhcHBlbmRfdG9fcGFnZWRfaW5kZXgoZGVhZGxpbmVfYnVja2V0X2tleShkZWFkbGluZSksIGNhbXBhaWduX2lkKQogICAgZGlnIDIKICAgIGNhbGxzdWIgYXBwZW5kX3RvX3BhZ2VkX2luZGV4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjIwCiAgICAvLyByZXR1cm4gQnl0ZXMoQ1JFQVRPUl9JTkRFWF9QUkVGSVgpICsgY3JlYXRvci5ieXRlcwogICAgcHVzaGJ5dGVzIDB4NjMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0NDUKICAgIC8vIGFwcGVuZF90b19wYWdlZF9pbmRleChjcmVhdG9yX2luZGV4X2tleShUeG4uc2VuZGVyKSwgY2FtcGFpZ25faWQpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjIwCiAgICAvLyByZXR1cm4gQnl0ZXMoQ1JFQVRPUl9JTkRFWF9QUkVGSVgpICsgY3JlYXRvci5ieXRlcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDQ1CiAgICAvLyBhcHBlbmRfdG9fcGFnZWRfaW5kZXgoY3JlYXRvcl9pbmRleF9rZXkoVHhuLnNlbmRlciksIGNhbXBhaWduX2lkKQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGFwcGVuZF90b19wYWdlZF9pbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ0NwogICAgLy8gc2VsZi5hY3RpdmVfY2FtcGFpZ25zLnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJhY3RpdmVfY2FtcGFpZ25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjdGl2ZV9jYW1wYWlnbnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWNfMCAvLyAiYWN0aXZlX2NhbXBhaWducyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Mzg4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5jb250cmlidXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY29udHJpYnV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0NTEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ2OC00NjkKICAgIC8vICMgVmVyaWZ5IHBheW1lbnQgdHJhbnNhY3Rpb24KICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QiCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0NzAKICAgIC8vIGRlcG9zaXQgPSBsZWRnZXJfZGVwb3NpdChjYW1wYWlnbl9pZCwgcGF5bWVudC5zZW5kZXIpCiAgICBndHhucyBTZW5kZXIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTQ4CiAgICAvLyByZXR1cm4gb3AuaXRvYihjYW1wYWlnbl9pZCkgKyBjb250cmlidXRvci5ieXRlcwogICAgaXRvYgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTU0CiAgICAvLyBpZiBCb3hSZWYoa2V5PWNvbnRyaWJ1dGlvbl9rZXkoY2FtcGFpZ25faWQsIGNvbnRyaWJ1dG9yKSk6CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGNvbnRyaWJ1dGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTU1CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAoKY29udHJpYnV0ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5sZWRnZXJfZGVwb3NpdEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ3MQogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID4gZGVwb3NpdCwgIkNvbnRyaWJ1dGlvbiBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwIgogICAgZGlnIDIKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBkaWcgMgogICAgPgogICAgYXNzZXJ0IC8vIENvbnRyaWJ1dGlvbiBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDczCiAgICAvLyBuZXdfdG90YWwgPSBzZWxmLl9hZGRfY29udHJpYnV0aW9uKGNhbXBhaWduX2lkLCBwYXltZW50LnNlbmRlciwgcGF5bWVudC5hbW91bnQgLSBkZXBvc2l0KQogICAgc3dhcAogICAgLQogICAgZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgZGlnIDMKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfYWRkX2NvbnRyaWJ1dGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ3NAogICAgLy8gdXBkYXRlX2xlYWRlcmJvYXJkKGNhbXBhaWduX2lkLCBuZXdfdG90YWwpCiAgICBjYWxsc3ViIHVwZGF0ZV9sZWFkZXJib2FyZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ1MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMTc0MzZmNmU3NDcyNjk2Mjc1NzQ2OTZmNmUyMDczNzU2MzYzNjU3MzczNjY3NTZjCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmNvbnRyaWJ1dGVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE1NgogICAgLy8gcmV0dXJuIFVJbnQ2NChDT05UUklCVVRJT05fREVQT1NJVCkKICAgIGludGMgNSAvLyAyMTcwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gZGVwb3NpdCA9IGxlZGdlcl9kZXBvc2l0KGNhbXBhaWduX2lkLCBwYXltZW50LnNlbmRlcikKICAgIGIgY29udHJpYnV0ZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5sZWRnZXJfZGVwb3NpdEA0CgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LkNhbXB1c0Z1bmRpbmcuY29udHJpYnV0ZV9tYW55W3JvdXRpbmddKCkgLT4gdm9pZDoKY29udHJpYnV0ZV9tYW55OgogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NDc4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAxNgogICAgKgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PHNtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5Db250cmlidXRpb25TcGxpdD4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwbiAyCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUwNC01MDUKICAgIC8vICMgVmVyaWZ5IHBheW1lbnQgdHJhbnNhY3Rpb24KICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJQYXltZW50IG11c3QgYmUgdG8gY29udHJhY3QiCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIHRvIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTA3CiAgICAvLyB0b3RhbCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MDgKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2Uoc3BsaXRzLmxlbmd0aCk6CiAgICBkdXAKCmNvbnRyaWJ1dGVfbWFueV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTA4CiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHNwbGl0cy5sZW5ndGgpOgogICAgZHVwCiAgICBkaWcgNAogICAgPAogICAgYnogY29udHJpYnV0ZV9tYW55X2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUwOQogICAgLy8gY2FtcGFpZ25faWQgPSBzcGxpdHNbaW5kZXhdLmNhbXBhaWduX2lkLm5hdGl2ZQogICAgZGlnIDQKICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIGRpZyAxCiAgICBwdXNoaW50IDE2CiAgICAqCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MDktNTEwCiAgICAvLyBjYW1wYWlnbl9pZCA9IHNwbGl0c1tpbmRleF0uY2FtcGFpZ25faWQubmF0aXZlCiAgICAvLyBhbW91bnQgPSBzcGxpdHNbaW5kZXhdLmFtb3VudC5uYXRpdmUKICAgIGludGNfMiAvLyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTEwCiAgICAvLyBhbW91bnQgPSBzcGxpdHNbaW5kZXhdLmFtb3VudC5uYXRpdmUKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MTEKICAgIC8vIGFzc2VydCBhbW91bnQgPiAwLCAiQ29udHJpYnV0aW9uIG11c3QgYmUgZ3JlYXRlciB0aGFuIDAiCiAgICBhc3NlcnQgLy8gQ29udHJpYnV0aW9uIG11c3QgYmUgZ3JlYXRlciB0aGFuIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MTIKICAgIC8vIHRvdGFsICs9IGFtb3VudCArIGxlZGdlcl9kZXBvc2l0KGNhbXBhaWduX2lkLCBwYXltZW50LnNlbmRlcikKICAgIGRpZyAzCiAgICBndHhucyBTZW5kZXIKICAgIGR1cAogICAgYnVyeSAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gcmV0dXJuIG9wLml0b2IoY2FtcGFpZ25faWQpICsgY29udHJpYnV0b3IuYnl0ZXMKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gaWYgQm94UmVmKGtleT1jb250cmlidXRpb25fa2V5KGNhbXBhaWduX2lkLCBjb250cmlidXRvcikpOgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBjb250cmlidXRlX21hbnlfYWZ0ZXJfaWZfZWxzZUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKCmNvbnRyaWJ1dGVfbWFueV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5sZWRnZXJfZGVwb3NpdEAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MTIKICAgIC8vIHRvdGFsICs9IGFtb3VudCArIGxlZGdlcl9kZXBvc2l0KGNhbXBhaWduX2lkLCBwYXltZW50LnNlbmRlcikKICAgIGRpZyA5CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgKwogICAgZGlnIDMKICAgICsKICAgIGJ1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUxMwogICAgLy8gbmV3X3RvdGFsID0gc2VsZi5fYWRkX2NvbnRyaWJ1dGlvbihjYW1wYWlnbl9pZCwgcGF5bWVudC5zZW5kZXIsIGFtb3VudCkKICAgIGRpZyA4CiAgICBkaWcgMTEKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfYWRkX2NvbnRyaWJ1dGlvbgogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTE0CiAgICAvLyBpZiBpbmRleCArIDEgPT0gc3BsaXRzLmxlbmd0aDoKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGR1cAogICAgYnVyeSA3CiAgICBkaWcgNAogICAgPT0KICAgIGJ6IGNvbnRyaWJ1dGVfbWFueV9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUxNQogICAgLy8gdXBkYXRlX2xlYWRlcmJvYXJkKGNhbXBhaWduX2lkLCBuZXdfdG90YWwpCiAgICBkaWcgNwogICAgZGlnIDcKICAgIGNhbGxzdWIgdXBkYXRlX2xlYWRlcmJvYXJkCgpjb250cmlidXRlX21hbnlfYWZ0ZXJfaWZfZWxzZUA4OgogICAgZGlnIDUKICAgIGJ1cnkgMQogICAgYiBjb250cmlidXRlX21hbnlfZm9yX2hlYWRlckAyCgpjb250cmlidXRlX21hbnlfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTE3CiAgICAvLyBuZXh0X2lkID0gc3BsaXRzW2luZGV4ICsgMV0uY2FtcGFpZ25faWQubmF0aXZlCiAgICBkaWcgNQogICAgcHVzaGludCAxNgogICAgKgogICAgZGlnIDExCiAgICBzd2FwCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUxOAogICAgLy8gYXNzZXJ0IG5leHRfaWQgPj0gY2FtcGFpZ25faWQsICJTcGxpdHMgbXVzdCBiZSBzb3J0ZWQgYnkgY2FtcGFpZ24gSUQiCiAgICBkdXAKICAgIGRpZyA5CiAgICBkdXAKICAgIGNvdmVyIDMKICAgID49CiAgICBhc3NlcnQgLy8gU3BsaXRzIG11c3QgYmUgc29ydGVkIGJ5IGNhbXBhaWduIElECiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTE5CiAgICAvLyBpZiBuZXh0X2lkICE9IGNhbXBhaWduX2lkOgogICAgIT0KICAgIGJ6IGNvbnRyaWJ1dGVfbWFueV9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MjAKICAgIC8vIHVwZGF0ZV9sZWFkZXJib2FyZChjYW1wYWlnbl9pZCwgbmV3X3RvdGFsKQogICAgZGlnIDcKICAgIGRpZyA3CiAgICBjYWxsc3ViIHVwZGF0ZV9sZWFkZXJib2FyZAogICAgYiBjb250cmlidXRlX21hbnlfYWZ0ZXJfaWZfZWxzZUA4Cgpjb250cmlidXRlX21hbnlfYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNTYKICAgIC8vIHJldHVybiBVSW50NjQoQ09OVFJJQlVUSU9OX0RFUE9TSVQpCiAgICBpbnRjIDUgLy8gMjE3MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MTIKICAgIC8vIHRvdGFsICs9IGFtb3VudCArIGxlZGdlcl9kZXBvc2l0KGNhbXBhaWduX2lkLCBwYXltZW50LnNlbmRlcikKICAgIGIgY29udHJpYnV0ZV9tYW55X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LmxlZGdlcl9kZXBvc2l0QDE0Cgpjb250cmlidXRlX21hbnlfYWZ0ZXJfZm9yQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUyMi01MjMKICAgIC8vICMgVmVyaWZ5IHNwbGl0cyBhbmQgZGVwb3NpdHMgYWNjb3VudCBmb3IgdGhlIHdob2xlIHBheW1lbnQKICAgIC8vIGFzc2VydCB0b3RhbCA9PSBwYXltZW50LmFtb3VudCwgIlNwbGl0cyBtdXN0IGFkZCB1cCB0byBwYXltZW50IgogICAgZGlnIDIKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDIKICAgID09CiAgICBhc3NlcnQgLy8gU3BsaXRzIG11c3QgYWRkIHVwIHRvIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo0NzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDE4NDM2ZjZlNzQ3MjY5NjI3NTc0Njk2ZjZlNzMyMDczNzU2MzYzNjU3MzczNjY3NTZjCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy53aXRoZHJhd19mdW5kc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CndpdGhkcmF3X2Z1bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU3MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTg0LTU4NQogICAgLy8gIyBMb2FkIGNhbXBhaWduCiAgICAvLyBzdGF0ZV9ib3ggPSBCb3hSZWYoa2V5PW9wLml0b2IoY2FtcGFpZ25faWQpKQogICAgZHVwCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1ODYKICAgIC8vIGFzc2VydCBzdGF0ZV9ib3gsICJDYW1wYWlnbiBkb2VzIG5vdCBleGlzdCIKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1ODgtNTg5CiAgICAvLyAjIFZlcmlmeSBjYWxsZXIgaXMgY2FtcGFpZ24gY3JlYXRvcgogICAgLy8gY3JlYXRvciA9IHJlYWRfY3JlYXRvcihzdGF0ZV9ib3gua2V5KQogICAgZHVwCiAgICBjYWxsc3ViIHJlYWRfY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU5MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gY3JlYXRvciwgIk9ubHkgY3JlYXRvciBjYW4gd2l0aGRyYXciCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIHdpdGhkcmF3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTkyLTU5MwogICAgLy8gIyBWZXJpZnkgY2FtcGFpZ24gaGFzIGVuZGVkIGFuZCB0aGUgZ29hbCB3YXMgbWV0CiAgICAvLyBhc3NlcnRfZ29hbF9yZWFjaGVkKGNhbXBhaWduX2lkKQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGFzc2VydF9nb2FsX3JlYWNoZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGRpZyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTk0CiAgICAvLyB0b3RhbF9yYWlzZWQgPSByZWFkX3VpbnQ2NChzdGF0ZV9ib3gua2V5LCBVSW50NjQoVE9UQUxfUkFJU0VEX09GRlNFVCkpCiAgICBwdXNoaW50IDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxOTUKICAgIC8vIHJldHVybiBvcC5nZXRiaXQob3AuQm94LmV4dHJhY3Qoa2V5LCBGTEFHU19PRkZTRVQsIDEpLCBiaXQpCiAgICB1bmNvdmVyIDIKICAgIHB1c2hpbnQgNTYKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTk2LTU5NwogICAgLy8gIyBWZXJpZnkgZnVuZHMgbm90IGFscmVhZHkgd2l0aGRyYXduCiAgICAvLyBhc3NlcnQgbm90IHJlYWRfZmxhZyhzdGF0ZV9ib3gua2V5LCBVSW50NjQoRlVORFNfV0lUSERSQVdOX0JJVCkpLCAiRnVuZHMgYWxyZWFkeSB3aXRoZHJhd24iCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gcmV0dXJuIG9wLmdldGJpdChvcC5Cb3guZXh0cmFjdChrZXksIEZMQUdTX09GRlNFVCwgMSksIGJpdCkKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU5Ni01OTcKICAgIC8vICMgVmVyaWZ5IGZ1bmRzIG5vdCBhbHJlYWR5IHdpdGhkcmF3bgogICAgLy8gYXNzZXJ0IG5vdCByZWFkX2ZsYWcoc3RhdGVfYm94LmtleSwgVUludDY0KEZVTkRTX1dJVEhEUkFXTl9CSVQpKSwgIkZ1bmRzIGFscmVhZHkgd2l0aGRyYXduIgogICAgIQogICAgYXNzZXJ0IC8vIEZ1bmRzIGFscmVhZHkgd2l0aGRyYXduCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTk5LTYwNAogICAgLy8gIyBUcmFuc2ZlciBmdW5kcyB0byBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9Y3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfcmFpc2VkLAogICAgLy8gICAgIGZlZT0wLCAgIyBDYWxsZXIgcGF5cyBmZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTk5LTYwMAogICAgLy8gIyBUcmFuc2ZlciBmdW5kcyB0byBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjAzCiAgICAvLyBmZWU9MCwgICMgQ2FsbGVyIHBheXMgZmVlCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1OTktNjA0CiAgICAvLyAjIFRyYW5zZmVyIGZ1bmRzIHRvIGNyZWF0b3IKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1jcmVhdG9yLAogICAgLy8gICAgIGFtb3VudD10b3RhbF9yYWlzZWQsCiAgICAvLyAgICAgZmVlPTAsICAjIENhbGxlciBwYXlzIGZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MDYtNjA3CiAgICAvLyAjIE1hcmsgZnVuZHMgYXMgd2l0aGRyYXduCiAgICAvLyBpZiByZWFkX2ZsYWcoc3RhdGVfYm94LmtleSwgVUludDY0KElTX0FDVElWRV9CSVQpKToKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0KQogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjA2LTYwNwogICAgLy8gIyBNYXJrIGZ1bmRzIGFzIHdpdGhkcmF3bgogICAgLy8gaWYgcmVhZF9mbGFnKHN0YXRlX2JveC5rZXksIFVJbnQ2NChJU19BQ1RJVkVfQklUKSk6CiAgICBieiB3aXRoZHJhd19mdW5kc19hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MDgKICAgIC8vIHNlbGYuYWN0aXZlX2NhbXBhaWducy52YWx1ZSAtPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiYWN0aXZlX2NhbXBhaWducyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY3RpdmVfY2FtcGFpZ25zIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gImFjdGl2ZV9jYW1wYWlnbnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKd2l0aGRyYXdfZnVuZHNfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gZmxhZ3MgPSBvcC5zZXRiaXRfYnl0ZXMob3AuQm94LmV4dHJhY3Qoa2V5LCBGTEFHU19PRkZTRVQsIDEpLCBiaXQsIHZhbHVlKQogICAgZHVwbiAyCiAgICBwdXNoaW50IDU2CiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MDkKICAgIC8vIHdyaXRlX2ZsYWcoc3RhdGVfYm94LmtleSwgVUludDY0KEZVTkRTX1dJVEhEUkFXTl9CSVQpLCBUcnVlKQogICAgaW50Y18xIC8vIDEKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gZmxhZ3MgPSBvcC5zZXRiaXRfYnl0ZXMob3AuQm94LmV4dHJhY3Qoa2V5LCBGTEFHU19PRkZTRVQsIDEpLCBiaXQsIHZhbHVlKQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjAyCiAgICAvLyBvcC5Cb3gucmVwbGFjZShrZXksIEZMQUdTX09GRlNFVCwgZmxhZ3MpCiAgICBkaWcgMQogICAgcHVzaGludCA1NgogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gZmxhZ3MgPSBvcC5zZXRiaXRfYnl0ZXMob3AuQm94LmV4dHJhY3Qoa2V5LCBGTEFHU19PRkZTRVQsIDEpLCBiaXQsIHZhbHVlKQogICAgZHVwCiAgICBwdXNoaW50IDU2CiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MTAKICAgIC8vIHdyaXRlX2ZsYWcoc3RhdGVfYm94LmtleSwgVUludDY0KElTX0FDVElWRV9CSVQpLCBGYWxzZSkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMDEKICAgIC8vIGZsYWdzID0gb3Auc2V0Yml0X2J5dGVzKG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0LCB2YWx1ZSkKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gb3AuQm94LnJlcGxhY2Uoa2V5LCBGTEFHU19PRkZTRVQsIGZsYWdzKQogICAgcHVzaGludCA1NgogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NzMKICAgIC8vIEBhYmltZXRob2QoKQogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDFjNDY3NTZlNjQ3MzIwNzc2OTc0Njg2NDcyNjE3NzZlMjA3Mzc1NjM2MzY1NzM3MzY2NzU2YzZjNzkKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5DYW1wdXNGdW5kaW5nLmNsYWltX3JlZnVuZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNsYWltX3JlZnVuZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjYyOAogICAgLy8gYXNzZXJ0X3JlZnVuZHNfb3BlbihjYW1wYWlnbl9pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIGFzc2VydF9yZWZ1bmRzX29wZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MjkKICAgIC8vIHNlbGYuX2Nsb3NlX2ZhaWxlZChjYW1wYWlnbl9pZCkKICAgIGRpZyAxCiAgICBjYWxsc3ViIF9jbG9zZV9mYWlsZWQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gcmV0dXJuIG9wLml0b2IoY2FtcGFpZ25faWQpICsgY29udHJpYnV0b3IuYnl0ZXMKICAgIGRpZyAxCiAgICBpdG9iCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjMxLTYzMgogICAgLy8gIyBWZXJpZnkgdGhlIGNvbnRyaWJ1dG9yIGhhcyBhbiBlbnRyeTsgc2V0dGxpbmcgZGVsZXRlcyBpdAogICAgLy8gYXNzZXJ0IEJveFJlZihrZXk9Y29udHJpYnV0aW9uX2tleShjYW1wYWlnbl9pZCwgY29udHJpYnV0b3IpKSwgIk5vIGNvbnRyaWJ1dGlvbiB0byByZWZ1bmQiCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBObyBjb250cmlidXRpb24gdG8gcmVmdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjMzCiAgICAvLyBzZWxmLnRvdGFsX3JhaXNlZC52YWx1ZSAtPSBzZXR0bGVfY29udHJpYnV0aW9uKGNhbXBhaWduX2lkLCBjb250cmlidXRvciwgVHJ1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9yYWlzZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcmFpc2VkIGV4aXN0cwogICAgY292ZXIgMgogICAgaW50Y18xIC8vIDEKICAgIGNhbGxzdWIgc2V0dGxlX2NvbnRyaWJ1dGlvbgogICAgLQogICAgYnl0ZWNfMyAvLyAidG90YWxfcmFpc2VkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2MTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDFiNTI2NTY2NzU2ZTY0MjA2MzZjNjE2OTZkNjU2NDIwNzM3NTYzNjM2NTczNzM2Njc1NmM2Yzc5CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5yZWZ1bmRfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpyZWZ1bmRfYmF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjM3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHB1c2hpbnQgMzIKICAgICoKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjU1CiAgICAvLyBhc3NlcnRfcmVmdW5kc19vcGVuKGNhbXBhaWduX2lkKQogICAgZHVwCiAgICBjYWxsc3ViIGFzc2VydF9yZWZ1bmRzX29wZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2NTYKICAgIC8vIHNlbGYuX2Nsb3NlX2ZhaWxlZChjYW1wYWlnbl9pZCkKICAgIGNhbGxzdWIgX2Nsb3NlX2ZhaWxlZAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjU4CiAgICAvLyByZWZ1bmRlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGR1cAoKcmVmdW5kX2JhdGNoX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2NTkKICAgIC8vIGZvciBjb250cmlidXRvciBpbiBjb250cmlidXRvcnM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiByZWZ1bmRfYmF0Y2hfYWZ0ZXJfZm9yQDUKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAzMgogICAgKgogICAgcHVzaGludCAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjYwCiAgICAvLyByZWZ1bmRlZCArPSBzZXR0bGVfY29udHJpYnV0aW9uKGNhbXBhaWduX2lkLCBjb250cmlidXRvci5uYXRpdmUsIFRydWUpCiAgICBkaWcgNgogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgIGNhbGxzdWIgc2V0dGxlX2NvbnRyaWJ1dGlvbgogICAgZGlnIDMKICAgICsKICAgIGJ1cnkgMwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiByZWZ1bmRfYmF0Y2hfZm9yX2hlYWRlckAyCgpyZWZ1bmRfYmF0Y2hfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjYxCiAgICAvLyBzZWxmLnRvdGFsX3JhaXNlZC52YWx1ZSAtPSByZWZ1bmRlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3JhaXNlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9yYWlzZWQgZXhpc3RzCiAgICBkaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAtCiAgICBieXRlY18zIC8vICJ0b3RhbF9yYWlzZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjYzNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LkNhbXB1c0Z1bmRpbmcucmVsZWFzZV9kZXBvc2l0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlbGVhc2VfZGVwb3NpdHM6CiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjY2NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBwdXNoaW50IDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjY4MgogICAgLy8gYXNzZXJ0X2dvYWxfcmVhY2hlZChjYW1wYWlnbl9pZCkKICAgIGNhbGxzdWIgYXNzZXJ0X2dvYWxfcmVhY2hlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjY4NAogICAgLy8gcmVsZWFzZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKCnJlbGVhc2VfZGVwb3NpdHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjY4NQogICAgLy8gZm9yIGNvbnRyaWJ1dG9yIGluIGNvbnRyaWJ1dG9yczoKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IHJlbGVhc2VfZGVwb3NpdHNfYWZ0ZXJfZm9yQDcKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIHB1c2hpbnQgMzIKICAgICoKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBidXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNDgKICAgIC8vIHJldHVybiBvcC5pdG9iKGNhbXBhaWduX2lkKSArIGNvbnRyaWJ1dG9yLmJ5dGVzCiAgICBkaWcgNQogICAgaXRvYgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Njg3CiAgICAvLyBpZiBCb3hSZWYoa2V5PWNvbnRyaWJ1dGlvbl9rZXkoY2FtcGFpZ25faWQsIGFjY291bnQpKToKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogcmVsZWFzZV9kZXBvc2l0c19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2ODgKICAgIC8vIHNldHRsZV9jb250cmlidXRpb24oY2FtcGFpZ25faWQsIGFjY291bnQsIEZhbHNlKQogICAgZGlnIDQKICAgIGRpZyA2CiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBzZXR0bGVfY29udHJpYnV0aW9uCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2ODkKICAgIC8vIHJlbGVhc2VkICs9IDEKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAyCgpyZWxlYXNlX2RlcG9zaXRzX2FmdGVyX2lmX2Vsc2VANToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiByZWxlYXNlX2RlcG9zaXRzX2Zvcl9oZWFkZXJAMgoKcmVsZWFzZV9kZXBvc2l0c19hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo2NjUKICAgIC8vIEBhYmltZXRob2QoKQogICAgZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5jbG9zZV9mYWlsZWRfY2FtcGFpZ25zW3JvdXRpbmddKCkgLT4gdm9pZDoKY2xvc2VfZmFpbGVkX2NhbXBhaWduczoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NjkzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3MTAKICAgIC8vIGNsb3NlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGR1cAoKY2xvc2VfZmFpbGVkX2NhbXBhaWduc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NzExCiAgICAvLyBmb3IgY2FtcGFpZ25faWQgaW4gY2FtcGFpZ25faWRzOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogY2xvc2VfZmFpbGVkX2NhbXBhaWduc19hZnRlcl9mb3JAOAogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3MTIKICAgIC8vIGlmIGhhc19mYWlsZWQoY2FtcGFpZ25faWQubmF0aXZlKSBhbmQgc2VsZi5fY2xvc2VfZmFpbGVkKGNhbXBhaWduX2lkLm5hdGl2ZSk6CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyNzYKICAgIC8vIHN0YXRlX2tleSA9IG9wLml0b2IoY2FtcGFpZ25faWQpCiAgICBpdG9iCiAgICBkdXAKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI3NwogICAgLy8gaWYgbm90IEJveFJlZihrZXk9c3RhdGVfa2V5KToKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYm56IGNsb3NlX2ZhaWxlZF9jYW1wYWlnbnNfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAoKY2xvc2VfZmFpbGVkX2NhbXBhaWduc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5oYXNfZmFpbGVkQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjcxMgogICAgLy8gaWYgaGFzX2ZhaWxlZChjYW1wYWlnbl9pZC5uYXRpdmUpIGFuZCBzZWxmLl9jbG9zZV9mYWlsZWQoY2FtcGFpZ25faWQubmF0aXZlKToKICAgIGJ6IGNsb3NlX2ZhaWxlZF9jYW1wYWlnbnNfYWZ0ZXJfaWZfZWxzZUA2CiAgICBkaWcgNAogICAgY2FsbHN1YiBfY2xvc2VfZmFpbGVkCiAgICBieiBjbG9zZV9mYWlsZWRfY2FtcGFpZ25zX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjcxMwogICAgLy8gY2xvc2VkICs9IDEKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAyCgpjbG9zZV9mYWlsZWRfY2FtcGFpZ25zX2FmdGVyX2lmX2Vsc2VANjoKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBjbG9zZV9mYWlsZWRfY2FtcGFpZ25zX2Zvcl9oZWFkZXJAMgoKY2xvc2VfZmFpbGVkX2NhbXBhaWduc19hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gaWYgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gcmVhZF91aW50NjQoc3RhdGVfa2V5LCBVSW50NjQoREVBRExJTkVfT0ZGU0VUKSk6CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBkaWcgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gaWYgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gcmVhZF91aW50NjQoc3RhdGVfa2V5LCBVSW50NjQoREVBRExJTkVfT0ZGU0VUKSk6CiAgICBwdXNoaW50IDQwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyNzkKICAgIC8vIGlmIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDw9IHJlYWRfdWludDY0KHN0YXRlX2tleSwgVUludDY0KERFQURMSU5FX09GRlNFVCkpOgogICAgPD0KICAgIGJ6IGNsb3NlX2ZhaWxlZF9jYW1wYWlnbnNfYWZ0ZXJfaWZfZWxzZUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjcxMgogICAgLy8gaWYgaGFzX2ZhaWxlZChjYW1wYWlnbl9pZC5uYXRpdmUpIGFuZCBzZWxmLl9jbG9zZV9mYWlsZWQoY2FtcGFpZ25faWQubmF0aXZlKToKICAgIGIgY2xvc2VfZmFpbGVkX2NhbXBhaWduc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5oYXNfZmFpbGVkQDE0CgpjbG9zZV9mYWlsZWRfY2FtcGFpZ25zX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBkaWcgNQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjgxCiAgICAvLyB0b3RhbF9yYWlzZWQgPSByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChUT1RBTF9SQUlTRURfT0ZGU0VUKSkKICAgIHB1c2hpbnQgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gcmV0dXJuIHRvdGFsX3JhaXNlZCA8IHJlYWRfdWludDY0KHN0YXRlX2tleSwgVUludDY0KEdPQUxfQU1PVU5UX09GRlNFVCkpCiAgICBwdXNoaW50IDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyODIKICAgIC8vIHJldHVybiB0b3RhbF9yYWlzZWQgPCByZWFkX3VpbnQ2NChzdGF0ZV9rZXksIFVJbnQ2NChHT0FMX0FNT1VOVF9PRkZTRVQpKQogICAgPAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjcxMgogICAgLy8gaWYgaGFzX2ZhaWxlZChjYW1wYWlnbl9pZC5uYXRpdmUpIGFuZCBzZWxmLl9jbG9zZV9mYWlsZWQoY2FtcGFpZ25faWQubmF0aXZlKToKICAgIGIgY2xvc2VfZmFpbGVkX2NhbXBhaWduc19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5oYXNfZmFpbGVkQDE0CgpjbG9zZV9mYWlsZWRfY2FtcGFpZ25zX2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjY5MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBkaWcgMQogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5DYW1wdXNGdW5kaW5nLmdldF9jYW1wYWlnbl9pbmZvW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2NhbXBhaWduX2luZm86CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NzE2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NzI3CiAgICAvLyByZXR1cm4gbG9hZF9jYW1wYWlnbl9pbmZvKGNhbXBhaWduX2lkKQogICAgY2FsbHN1YiBsb2FkX2NhbXBhaWduX2luZm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3MTYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5nZXRfdG90YWxfY2FtcGFpZ25zW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3RvdGFsX2NhbXBhaWduczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3MzIKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsX2NhbXBhaWducy52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInRvdGFsX2NhbXBhaWducyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jYW1wYWlnbnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NzI5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LkNhbXB1c0Z1bmRpbmcuZ2V0X2NhbXBhaWduc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9jYW1wYWlnbnM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAyCiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3MzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NDYKICAgIC8vIGNhbXBhaWducyA9IER5bmFtaWNBcnJheVtDYW1wYWlnbkluZm9dKCkKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIGludGNfMCAvLyAwCgpnZXRfY2FtcGFpZ25zX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NDcKICAgIC8vIGZvciBjYW1wYWlnbl9pZCBpbiBjYW1wYWlnbl9pZHM6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfY2FtcGFpZ25zX2FmdGVyX2ZvckA1CiAgICBkaWcgMwogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc0OAogICAgLy8gY2FtcGFpZ25zLmFwcGVuZChsb2FkX2NhbXBhaWduX2luZm8oY2FtcGFpZ25faWQubmF0aXZlKSkKICAgIGV4dHJhY3RfdWludDY0CiAgICBjYWxsc3ViIGxvYWRfY2FtcGFpZ25faW5mbwogICAgZGlnIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGJ1cnkgMTEKICAgIGV4dHJhY3QgMiAwCiAgICBidXJ5IDEzCiAgICBwdXNoYnl0ZXMgMHgwMDAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ1cnkgMTAKICAgIGJ5dGVjXzEgLy8gMHgKICAgIGJ1cnkgMTEKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBidXJ5IDUKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDYKCmdldF9jYW1wYWlnbnNfZm9yX2hlYWRlckA3OgogICAgZGlnIDUKICAgIGRpZyA1CiAgICA8CiAgICBieiBnZXRfY2FtcGFpZ25zX2FmdGVyX2ZvckA5CiAgICBkaWcgMTAKICAgIGRpZyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGRpZyAxMQogICAgc3dhcAogICAgY29uY2F0CiAgICBidXJ5IDExCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgYnVyeSA2CiAgICBiIGdldF9jYW1wYWlnbnNfZm9yX2hlYWRlckA3CgpnZXRfY2FtcGFpZ25zX2FmdGVyX2ZvckA5OgogICAgZGlnIDEwCiAgICBsZW4KICAgIGJ1cnkgNwogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNgoKZ2V0X2NhbXBhaWduc19mb3JfaGVhZGVyQDEwOgogICAgZGlnIDUKICAgIGludGNfMyAvLyAyCiAgICA8CiAgICBieiBnZXRfY2FtcGFpZ25zX2FmdGVyX2ZvckAxMgogICAgZGlnIDgKICAgIGRpZyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgOAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGRpZyAxMQogICAgc3dhcAogICAgY29uY2F0CiAgICBidXJ5IDExCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgYnVyeSA2CiAgICBiIGdldF9jYW1wYWlnbnNfZm9yX2hlYWRlckAxMAoKZ2V0X2NhbXBhaWduc19hZnRlcl9mb3JAMTI6CiAgICBkaWcgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc0OAogICAgLy8gY2FtcGFpZ25zLmFwcGVuZChsb2FkX2NhbXBhaWduX2luZm8oY2FtcGFpZ25faWQubmF0aXZlKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZGlnIDEwCiAgICBjb25jYXQKICAgIGRpZyAxMQogICAgZGlnIDYKICAgIGRpZyA5CiAgICBzdWJzdHJpbmczCiAgICBjb25jYXQKICAgIGRpZyA5CiAgICBleHRyYWN0IDIgMAogICAgY29uY2F0CiAgICBidXJ5IDIKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBnZXRfY2FtcGFpZ25zX2Zvcl9oZWFkZXJAMgoKZ2V0X2NhbXBhaWduc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3MzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgZGlnIDIKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LkNhbXB1c0Z1bmRpbmcuZ2V0X2NyZWF0b3JfY2FtcGFpZ25zW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2NyZWF0b3JfY2FtcGFpZ25zOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gNAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc1OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGR1cAogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NzQKICAgIC8vIGtleSA9IGNyZWF0b3JfaW5kZXhfa2V5KEFjY291bnQoY3JlYXRvci5ieXRlcykpCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjIwCiAgICAvLyByZXR1cm4gQnl0ZXMoQ1JFQVRPUl9JTkRFWF9QUkVGSVgpICsgY3JlYXRvci5ieXRlcwogICAgcHVzaGJ5dGVzIDB4NjMKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NzUKICAgIC8vIHRvdGFsID0gb3AuYnRvaShCb3hSZWYoa2V5PWtleSkuZ2V0KGRlZmF1bHQ9b3AuaXRvYigwKSkpCiAgICBpbnRjXzAgLy8gMAogICAgaXRvYgogICAgc3dhcAogICAgYm94X2dldAogICAgc2VsZWN0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NzcKICAgIC8vIGNvdW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc3OAogICAgLy8gaWYgc3RhcnQgPCB0b3RhbDoKICAgIDwKICAgIGJ6IGdldF9jcmVhdG9yX2NhbXBhaWduc19hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NzkKICAgIC8vIGNvdW50ID0gdG90YWwgLSBzdGFydAogICAgZGlnIDEKICAgIGRpZyA1CiAgICAtCiAgICBkdXAKICAgIGJ1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc4MAogICAgLy8gaWYgbGltaXQgPCBjb3VudDoKICAgIGRpZyA0CiAgICA+CiAgICBieiBnZXRfY3JlYXRvcl9jYW1wYWlnbnNfYWZ0ZXJfaWZfZWxzZUA0CiAgICBkaWcgMwogICAgYnVyeSAxCgpnZXRfY3JlYXRvcl9jYW1wYWlnbnNfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc4MgogICAgLy8gaWYgY291bnQgPiBNQVhfQ1JFQVRPUl9QQUdFOgogICAgZHVwCiAgICBwdXNoaW50IDEwMAogICAgPgogICAgYnogZ2V0X2NyZWF0b3JfY2FtcGFpZ25zX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc4MwogICAgLy8gY291bnQgPSBVSW50NjQoTUFYX0NSRUFUT1JfUEFHRSkKICAgIHB1c2hpbnQgMTAwCiAgICBidXJ5IDEKCmdldF9jcmVhdG9yX2NhbXBhaWduc19hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Nzg0LTc4NgogICAgLy8gIyBBbiBBUkMtNCB1aW50NjRbXSBpcyBhIHVpbnQxNiBsZW5ndGggZm9sbG93ZWQgYnkgdGhlIHBhY2tlZCB2YWx1ZXMsCiAgICAvLyAjIHdoaWNoIGlzIGhvdyB0aGUgaW5kZXggcGFnZXMgc3RvcmUgdGhlbQogICAgLy8gaWRzID0gb3AuZXh0cmFjdChvcC5pdG9iKGNvdW50KSwgNiwgMikKICAgIGR1cG4gMgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGJ1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3ODgKICAgIC8vIGVuZCA9IHN0YXJ0ICsgY291bnQKICAgIGRpZyA1CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgKwogICAgYnVyeSAxMQogICAgYnVyeSA4CgpnZXRfY3JlYXRvcl9jYW1wYWlnbnNfd2hpbGVfdG9wQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6Nzg5CiAgICAvLyB3aGlsZSBwb3NpdGlvbiA8IGVuZDoKICAgIGRpZyA3CiAgICBkaWcgMTAKICAgIDwKICAgIGJ6IGdldF9jcmVhdG9yX2NhbXBhaWduc19hZnRlcl93aGlsZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc5MAogICAgLy8gb2Zmc2V0ID0gcG9zaXRpb24gJSBJTkRFWF9QQUdFX0lEUwogICAgZGlnIDcKICAgIGR1cAogICAgaW50YyA0IC8vIDEyOAogICAgJQogICAgZHVwCiAgICBidXJ5IDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NzkxCiAgICAvLyB0YWtlbiA9IElOREVYX1BBR0VfSURTIC0gb2Zmc2V0CiAgICBpbnRjIDQgLy8gMTI4CiAgICBzd2FwCiAgICAtCiAgICBkdXAKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc5MgogICAgLy8gaWYgZW5kIC0gcG9zaXRpb24gPCB0YWtlbjoKICAgIGRpZyAxMQogICAgdW5jb3ZlciAyCiAgICAtCiAgICBkdXAKICAgIGJ1cnkgOAogICAgPgogICAgYnogZ2V0X2NyZWF0b3JfY2FtcGFpZ25zX2FmdGVyX2lmX2Vsc2VAMTEKICAgIGRpZyA1CiAgICBidXJ5IDcKCmdldF9jcmVhdG9yX2NhbXBhaWduc19hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc5NAogICAgLy8gcGFnZV9rZXkgPSBpbmRleF9wYWdlX2tleShrZXksIHBvc2l0aW9uIC8vIElOREVYX1BBR0VfSURTKQogICAgZGlnIDcKICAgIGR1cAogICAgaW50YyA0IC8vIDEyOAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIyNgogICAgLy8gcmV0dXJuIGtleSArIG9wLml0b2IocGFnZSkKICAgIGl0b2IKICAgIGRpZyA0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3OTUKICAgIC8vIGlkcyArPSBvcC5Cb3guZXh0cmFjdChwYWdlX2tleSwgb2Zmc2V0ICogOCwgdGFrZW4gKiA4KQogICAgZGlnIDEwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZGlnIDkKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGJveF9leHRyYWN0CiAgICBkaWcgMTMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnVyeSAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojc5NgogICAgLy8gcG9zaXRpb24gKz0gdGFrZW4KICAgICsKICAgIGJ1cnkgOAogICAgYiBnZXRfY3JlYXRvcl9jYW1wYWlnbnNfd2hpbGVfdG9wQDgKCmdldF9jcmVhdG9yX2NhbXBhaWduc19hZnRlcl93aGlsZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3OTgKICAgIC8vIHRvdGFsPUFSQzRVSW50NjQodG90YWwpLAogICAgZGlnIDEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3OTctODAwCiAgICAvLyByZXR1cm4gQ3JlYXRvckNhbXBhaWducygKICAgIC8vICAgICB0b3RhbD1BUkM0VUludDY0KHRvdGFsKSwKICAgIC8vICAgICBjYW1wYWlnbl9pZHM9RHluYW1pY0FycmF5W0FSQzRVSW50NjRdLmZyb21fYnl0ZXMoaWRzKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwMGEKICAgIGNvbmNhdAogICAgZGlnIDExCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo3NTgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzIgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5nZXRfcGxhdGZvcm1fc3RhdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcGxhdGZvcm1fc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6ODExCiAgICAvLyBsZWFkZXJib2FyZCA9IEJveFJlZihrZXk9TEVBREVSQk9BUkRfS0VZKS5nZXQoZGVmYXVsdD1vcC5iemVybyhMRUFERVJCT0FSRF9TSVpFKSkKICAgIHB1c2hpbnQgMTYwCiAgICBiemVybwogICAgYnl0ZWMgNCAvLyAweDc0NmY3MAogICAgYm94X2dldAogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6ODEzCiAgICAvLyB0b3RhbF9jYW1wYWlnbnM9QVJDNFVJbnQ2NChzZWxmLnRvdGFsX2NhbXBhaWducy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAidG90YWxfY2FtcGFpZ25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NhbXBhaWducyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4MTQKICAgIC8vIHRvdGFsX3JhaXNlZD1BUkM0VUludDY0KHNlbGYudG90YWxfcmFpc2VkLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9yYWlzZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcmFpc2VkIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjgxNQogICAgLy8gYWN0aXZlX2NhbXBhaWducz1BUkM0VUludDY0KHNlbGYuYWN0aXZlX2NhbXBhaWducy52YWx1ZSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiYWN0aXZlX2NhbXBhaWducyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY3RpdmVfY2FtcGFpZ25zIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjgxNgogICAgLy8gc3VjY2Vzc2Z1bF9jYW1wYWlnbnM9QVJDNFVJbnQ2NChzZWxmLnN1Y2Nlc3NmdWxfY2FtcGFpZ25zLnZhbHVlKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJzdWNjZXNzZnVsX2NhbXBhaWducyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdWNjZXNzZnVsX2NhbXBhaWducyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4MTItODE4CiAgICAvLyByZXR1cm4gUGxhdGZvcm1TdGF0cygKICAgIC8vICAgICB0b3RhbF9jYW1wYWlnbnM9QVJDNFVJbnQ2NChzZWxmLnRvdGFsX2NhbXBhaWducy52YWx1ZSksCiAgICAvLyAgICAgdG90YWxfcmFpc2VkPUFSQzRVSW50NjQoc2VsZi50b3RhbF9yYWlzZWQudmFsdWUpLAogICAgLy8gICAgIGFjdGl2ZV9jYW1wYWlnbnM9QVJDNFVJbnQ2NChzZWxmLmFjdGl2ZV9jYW1wYWlnbnMudmFsdWUpLAogICAgLy8gICAgIHN1Y2Nlc3NmdWxfY2FtcGFpZ25zPUFSQzRVSW50NjQoc2VsZi5zdWNjZXNzZnVsX2NhbXBhaWducy52YWx1ZSksCiAgICAvLyAgICAgbGVhZGVyYm9hcmQ9U3RhdGljQXJyYXlbTGVhZGVyYm9hcmRFbnRyeSwgdHlwaW5nLkxpdGVyYWxbMTBdXS5mcm9tX2J5dGVzKGxlYWRlcmJvYXJkKSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjgwMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jYW1wdXNfZnVuZGluZy5jb250cmFjdC5DYW1wdXNGdW5kaW5nLmNhbmNlbF9jYW1wYWlnbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmNhbmNlbF9jYW1wYWlnbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4MjAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjgzMS04MzIKICAgIC8vICMgTG9hZCBjYW1wYWlnbgogICAgLy8gc3RhdGVfYm94ID0gQm94UmVmKGtleT1vcC5pdG9iKGNhbXBhaWduX2lkKSkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4MzMKICAgIC8vIGFzc2VydCBzdGF0ZV9ib3gsICJDYW1wYWlnbiBkb2VzIG5vdCBleGlzdCIKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4MzUtODM2CiAgICAvLyAjIFZlcmlmeSBjYWxsZXIgaXMgY2FtcGFpZ24gY3JlYXRvcgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gcmVhZF9jcmVhdG9yKHN0YXRlX2JveC5rZXkpLCAiT25seSBjcmVhdG9yIGNhbiBjYW5jZWwiCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgY2FsbHN1YiByZWFkX2NyZWF0b3IKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBjcmVhdG9yIGNhbiBjYW5jZWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjgzOC04MzkKICAgIC8vICMgVmVyaWZ5IG5vIGNvbnRyaWJ1dGlvbnMgeWV0CiAgICAvLyBhc3NlcnQgcmVhZF91aW50NjQoc3RhdGVfYm94LmtleSwgVUludDY0KFRPVEFMX1JBSVNFRF9PRkZTRVQpKSA9PSAwLCAiQ2Fubm90IGNhbmNlbCBjYW1wYWlnbiB3aXRoIGNvbnRyaWJ1dGlvbnMiCiAgICBwdXNoaW50IDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4MzgtODM5CiAgICAvLyAjIFZlcmlmeSBubyBjb250cmlidXRpb25zIHlldAogICAgLy8gYXNzZXJ0IHJlYWRfdWludDY0KHN0YXRlX2JveC5rZXksIFVJbnQ2NChUT1RBTF9SQUlTRURfT0ZGU0VUKSkgPT0gMCwgIkNhbm5vdCBjYW5jZWwgY2FtcGFpZ24gd2l0aCBjb250cmlidXRpb25zIgogICAgIQogICAgYXNzZXJ0IC8vIENhbm5vdCBjYW5jZWwgY2FtcGFpZ24gd2l0aCBjb250cmlidXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0KQogICAgZHVwCiAgICBwdXNoaW50IDU2CiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojg0MS04NDIKICAgIC8vICMgVmVyaWZ5IG5vdCBhbHJlYWR5IGNhbmNlbGxlZCwgc28gaXQncyBvbmx5IGNvdW50ZWQgb25jZQogICAgLy8gYXNzZXJ0IHJlYWRfZmxhZyhzdGF0ZV9ib3gua2V5LCBVSW50NjQoSVNfQUNUSVZFX0JJVCkpLCAiQ2FtcGFpZ24gaXMgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0KQogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6ODQxLTg0MgogICAgLy8gIyBWZXJpZnkgbm90IGFscmVhZHkgY2FuY2VsbGVkLCBzbyBpdCdzIG9ubHkgY291bnRlZCBvbmNlCiAgICAvLyBhc3NlcnQgcmVhZF9mbGFnKHN0YXRlX2JveC5rZXksIFVJbnQ2NChJU19BQ1RJVkVfQklUKSksICJDYW1wYWlnbiBpcyBub3QgYWN0aXZlIgogICAgYXNzZXJ0IC8vIENhbXBhaWduIGlzIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4NDQtODQ1CiAgICAvLyAjIE1hcmsgYXMgaW5hY3RpdmUKICAgIC8vIHdyaXRlX2ZsYWcoc3RhdGVfYm94LmtleSwgVUludDY0KElTX0FDVElWRV9CSVQpLCBGYWxzZSkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMDEKICAgIC8vIGZsYWdzID0gb3Auc2V0Yml0X2J5dGVzKG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0LCB2YWx1ZSkKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gb3AuQm94LnJlcGxhY2Uoa2V5LCBGTEFHU19PRkZTRVQsIGZsYWdzKQogICAgcHVzaGludCA1NgogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4NDYKICAgIC8vIHNlbGYuYWN0aXZlX2NhbXBhaWducy52YWx1ZSAtPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiYWN0aXZlX2NhbXBhaWducyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY3RpdmVfY2FtcGFpZ25zIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGJ5dGVjXzAgLy8gImFjdGl2ZV9jYW1wYWlnbnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjgyMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMWY0MzYxNmQ3MDYxNjk2NzZlMjA2MzYxNmU2MzY1NmM2YzY1NjQyMDczNzU2MzYzNjU3MzczNjY3NTZjNmM3OQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LkNhbXB1c0Z1bmRpbmcudXBkYXRlX2NhbXBhaWduW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX2NhbXBhaWduOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojg1MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojg2OC04NjkKICAgIC8vICMgTG9hZCBjYW1wYWlnbgogICAgLy8gc3RhdGVfYm94ID0gQm94UmVmKGtleT1vcC5pdG9iKGNhbXBhaWduX2lkKSkKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojg3MAogICAgLy8gYXNzZXJ0IHN0YXRlX2JveCwgIkNhbXBhaWduIGRvZXMgbm90IGV4aXN0IgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBDYW1wYWlnbiBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojg3Mi04NzMKICAgIC8vICMgVmVyaWZ5IGNhbGxlciBpcyBjYW1wYWlnbiBjcmVhdG9yCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSByZWFkX2NyZWF0b3Ioc3RhdGVfYm94LmtleSksICJPbmx5IGNyZWF0b3IgY2FuIHVwZGF0ZSIKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBjYWxsc3ViIHJlYWRfY3JlYXRvcgogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGNyZWF0b3IgY2FuIHVwZGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gcmV0dXJuIG9wLmdldGJpdChvcC5Cb3guZXh0cmFjdChrZXksIEZMQUdTX09GRlNFVCwgMSksIGJpdCkKICAgIGR1cAogICAgcHVzaGludCA1NgogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6ODc1LTg3NgogICAgLy8gIyBWZXJpZnkgY2FtcGFpZ24gaXMgc3RpbGwgYWN0aXZlCiAgICAvLyBhc3NlcnQgcmVhZF9mbGFnKHN0YXRlX2JveC5rZXksIFVJbnQ2NChJU19BQ1RJVkVfQklUKSksICJDYW1wYWlnbiBpcyBub3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxOTUKICAgIC8vIHJldHVybiBvcC5nZXRiaXQob3AuQm94LmV4dHJhY3Qoa2V5LCBGTEFHU19PRkZTRVQsIDEpLCBiaXQpCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4NzUtODc2CiAgICAvLyAjIFZlcmlmeSBjYW1wYWlnbiBpcyBzdGlsbCBhY3RpdmUKICAgIC8vIGFzc2VydCByZWFkX2ZsYWcoc3RhdGVfYm94LmtleSwgVUludDY0KElTX0FDVElWRV9CSVQpKSwgIkNhbXBhaWduIGlzIG5vdCBhY3RpdmUiCiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gaXMgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gcmV0dXJuIEJ5dGVzKE1FVEFEQVRBX0tFWV9QUkVGSVgpICsgb3AuaXRvYihjYW1wYWlnbl9pZCkKICAgIGJ5dGVjIDcgLy8gMHg2ZAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4ODEKICAgIC8vIG1ldGFkYXRhID0gQ2FtcGFpZ25NZXRhZGF0YS5mcm9tX2J5dGVzKG1ldGFkYXRhX2JveC5nZXQoZGVmYXVsdD1CeXRlcygpKSkKICAgIGR1cAogICAgYm94X2dldAogICAgYnl0ZWNfMSAvLyAweAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6ODgyCiAgICAvLyBtZXRhZGF0YS5kZXNjcmlwdGlvbiA9IEFSQzRTdHJpbmcobmV3X2Rlc2NyaXB0aW9uKQogICAgZHVwCiAgICBpbnRjXzMgLy8gMgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgZGlnIDIKICAgIGV4dHJhY3QzCiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIHB1c2hpbnQgNAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAzCiAgICBsZW4KICAgIHVuY292ZXIgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICB1bmNvdmVyIDMKICAgIC0KICAgIHVuY292ZXIgMgogICAgdW5jb3ZlciA1CiAgICArCiAgICBzd2FwCiAgICAtCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5Ojg4MwogICAgLy8gbWV0YWRhdGEuaW1hZ2VfdXJsID0gQVJDNFN0cmluZyhuZXdfaW1hZ2VfdXJsKQogICAgZHVwCiAgICBwdXNoaW50IDQKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgZXh0cmFjdDMKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4ODcKICAgIC8vIGFzc2VydCBtZXRhZGF0YV9ieXRlcy5sZW5ndGggPD0gTUFYX0NBTVBBSUdOX0JPWF9TSVpFLCAiQ2FtcGFpZ24gZGF0YSB0b28gbGFyZ2UiCiAgICBsZW4KICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBwdXNoaW50IDEwMjQKICAgIDw9CiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gZGF0YSB0b28gbGFyZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4ODgKICAgIC8vIGlmIG1ldGFkYXRhX2J5dGVzLmxlbmd0aCAhPSBtZXRhZGF0YV9ib3gubGVuZ3RoOgogICAgc3dhcAogICAgYm94X2xlbgogICAgYXNzZXJ0IC8vIGNoZWNrIEJveFJlZiBleGlzdHMKICAgICE9CiAgICBieiB1cGRhdGVfY2FtcGFpZ25fYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6ODg5CiAgICAvLyBtZXRhZGF0YV9ib3gucmVzaXplKG1ldGFkYXRhX2J5dGVzLmxlbmd0aCkKICAgIGRpZyAyCiAgICBkaWcgMQogICAgYm94X3Jlc2l6ZQoKdXBkYXRlX2NhbXBhaWduX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4OTAKICAgIC8vIG1ldGFkYXRhX2JveC5wdXQobWV0YWRhdGFfYnl0ZXMpCiAgICBkaWcgMgogICAgZGlnIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo4NTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDFkNDM2MTZkNzA2MTY5Njc2ZTIwNzU3MDY0NjE3NDY1NjQyMDczNzU2MzYzNjU3MzczNjY3NTZjNmM3OQogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNhbXB1c19mdW5kaW5nLmNvbnRyYWN0LkNhbXB1c0Z1bmRpbmcuX2FkZF9jb250cmlidXRpb24oY2FtcGFpZ25faWQ6IHVpbnQ2NCwgY29udHJpYnV0b3I6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpfYWRkX2NvbnRyaWJ1dGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MjctNTI4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9hZGRfY29udHJpYnV0aW9uKHNlbGYsIGNhbXBhaWduX2lkOiBVSW50NjQsIGNvbnRyaWJ1dG9yOiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTMzLTUzNAogICAgLy8gIyBMb2FkIGNhbXBhaWduCiAgICAvLyBzdGF0ZV9ib3ggPSBCb3hSZWYoa2V5PW9wLml0b2IoY2FtcGFpZ25faWQpKQogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MzUKICAgIC8vIGFzc2VydCBzdGF0ZV9ib3gsICJDYW1wYWlnbiBkb2VzIG5vdCBleGlzdCIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIENhbXBhaWduIGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0KQogICAgZHVwCiAgICBwdXNoaW50IDU2CiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MzctNTM4CiAgICAvLyAjIFZlcmlmeSBjYW1wYWlnbiBpcyBhY3RpdmUgYW5kIG5vdCBleHBpcmVkCiAgICAvLyBhc3NlcnQgcmVhZF9mbGFnKHN0YXRlX2JveC5rZXksIFVJbnQ2NChJU19BQ1RJVkVfQklUKSksICJDYW1wYWlnbiBpcyBub3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxOTUKICAgIC8vIHJldHVybiBvcC5nZXRiaXQob3AuQm94LmV4dHJhY3Qoa2V5LCBGTEFHU19PRkZTRVQsIDEpLCBiaXQpCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MzctNTM4CiAgICAvLyAjIFZlcmlmeSBjYW1wYWlnbiBpcyBhY3RpdmUgYW5kIG5vdCBleHBpcmVkCiAgICAvLyBhc3NlcnQgcmVhZF9mbGFnKHN0YXRlX2JveC5rZXksIFVJbnQ2NChJU19BQ1RJVkVfQklUKSksICJDYW1wYWlnbiBpcyBub3QgYWN0aXZlIgogICAgYXNzZXJ0IC8vIENhbXBhaWduIGlzIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1MzkKICAgIC8vIGFzc2VydCBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSByZWFkX3VpbnQ2NChzdGF0ZV9ib3gua2V5LCBVSW50NjQoREVBRExJTkVfT0ZGU0VUKSksICJDYW1wYWlnbiBoYXMgZW5kZWQiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDw9IHJlYWRfdWludDY0KHN0YXRlX2JveC5rZXksIFVJbnQ2NChERUFETElORV9PRkZTRVQpKSwgIkNhbXBhaWduIGhhcyBlbmRlZCIKICAgIHB1c2hpbnQgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjUzOQogICAgLy8gYXNzZXJ0IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDw9IHJlYWRfdWludDY0KHN0YXRlX2JveC5rZXksIFVJbnQ2NChERUFETElORV9PRkZTRVQpKSwgIkNhbXBhaWduIGhhcyBlbmRlZCIKICAgIDw9CiAgICBhc3NlcnQgLy8gQ2FtcGFpZ24gaGFzIGVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChrZXksIG9mZnNldCwgOCkpCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NDEtNTQyCiAgICAvLyAjIFVwZGF0ZSB0b3RhbCByYWlzZWQgaW4gcGxhY2UKICAgIC8vIG9sZF90b3RhbCA9IHJlYWRfdWludDY0KHN0YXRlX2JveC5rZXksIFVJbnQ2NChUT1RBTF9SQUlTRURfT0ZGU0VUKSkKICAgIHB1c2hpbnQgNDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgb2Zmc2V0LCA4KSkKICAgIGludGNfMiAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU0MwogICAgLy8gbmV3X3RvdGFsID0gb2xkX3RvdGFsICsgYW1vdW50CiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgZHVwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTQ0CiAgICAvLyBzdGF0ZV9ib3gucmVwbGFjZShUT1RBTF9SQUlTRURfT0ZGU0VULCBvcC5pdG9iKG5ld190b3RhbCkpCiAgICBpdG9iCiAgICBkaWcgMgogICAgcHVzaGludCA0OAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3Qoa2V5LCBvZmZzZXQsIDgpKQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU0Ni01NDcKICAgIC8vICMgVXBkYXRlIHBsYXRmb3JtIHRvdGFsczsgYSBjYW1wYWlnbiBjb3VudHMgYXMgc3VjY2Vzc2Z1bCBvbmNlCiAgICAvLyBnb2FsX2Ftb3VudCA9IHJlYWRfdWludDY0KHN0YXRlX2JveC5rZXksIFVJbnQ2NChHT0FMX0FNT1VOVF9PRkZTRVQpKQogICAgcHVzaGludCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3Qoa2V5LCBvZmZzZXQsIDgpKQogICAgaW50Y18yIC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NDgKICAgIC8vIHNlbGYudG90YWxfcmFpc2VkLnZhbHVlICs9IGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3JhaXNlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9yYWlzZWQgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3JhaXNlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTQ5CiAgICAvLyBpZiBvbGRfdG90YWwgPCBnb2FsX2Ftb3VudCBhbmQgbmV3X3RvdGFsID49IGdvYWxfYW1vdW50OgogICAgPAogICAgYnogX2FkZF9jb250cmlidXRpb25fYWZ0ZXJfaWZfZWxzZUAzCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgID49CiAgICBieiBfYWRkX2NvbnRyaWJ1dGlvbl9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NTAKICAgIC8vIHNlbGYuc3VjY2Vzc2Z1bF9jYW1wYWlnbnMudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInN1Y2Nlc3NmdWxfY2FtcGFpZ25zIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN1Y2Nlc3NmdWxfY2FtcGFpZ25zIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gInN1Y2Nlc3NmdWxfY2FtcGFpZ25zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCl9hZGRfY29udHJpYnV0aW9uX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToxNDgKICAgIC8vIHJldHVybiBvcC5pdG9iKGNhbXBhaWduX2lkKSArIGNvbnRyaWJ1dG9yLmJ5dGVzCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NTUKICAgIC8vIGNvbnRyaWJ1dGVkID0gb3AuYnRvaShjb250cmlidXRpb25fYm94LmdldChkZWZhdWx0PW9wLml0b2IoMCkpKQogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIGRpZyAxCiAgICBib3hfZ2V0CiAgICBzZWxlY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NTYKICAgIC8vIGNvbnRyaWJ1dGlvbl9ib3gucHV0KG9wLml0b2IoY29udHJpYnV0ZWQgKyBhbW91bnQpKQogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTU3CiAgICAvLyByZXR1cm4gbmV3X3RvdGFsCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY2FtcHVzX2Z1bmRpbmcuY29udHJhY3QuQ2FtcHVzRnVuZGluZy5fY2xvc2VfZmFpbGVkKGNhbXBhaWduX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKX2Nsb3NlX2ZhaWxlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NTktNTYwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jbG9zZV9mYWlsZWQoc2VsZiwgY2FtcGFpZ25faWQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU2NgogICAgLy8gc3RhdGVfa2V5ID0gb3AuaXRvYihjYW1wYWlnbl9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0KQogICAgcHVzaGludCA1NgogICAgaW50Y18xIC8vIDEKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTY3CiAgICAvLyBpZiBub3QgcmVhZF9mbGFnKHN0YXRlX2tleSwgVUludDY0KElTX0FDVElWRV9CSVQpKToKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MTk1CiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0KQogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTY3CiAgICAvLyBpZiBub3QgcmVhZF9mbGFnKHN0YXRlX2tleSwgVUludDY0KElTX0FDVElWRV9CSVQpKToKICAgIGJueiBfY2xvc2VfZmFpbGVkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU2OAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgcmV0c3ViCgpfY2xvc2VfZmFpbGVkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMDEKICAgIC8vIGZsYWdzID0gb3Auc2V0Yml0X2J5dGVzKG9wLkJveC5leHRyYWN0KGtleSwgRkxBR1NfT0ZGU0VULCAxKSwgYml0LCB2YWx1ZSkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHB1c2hpbnQgNTYKICAgIGludGNfMSAvLyAxCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NhbXB1c19mdW5kaW5nL2NvbnRyYWN0LnB5OjU2OQogICAgLy8gd3JpdGVfZmxhZyhzdGF0ZV9rZXksIFVJbnQ2NChJU19BQ1RJVkVfQklUKSwgRmFsc2UpCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6MjAxCiAgICAvLyBmbGFncyA9IG9wLnNldGJpdF9ieXRlcyhvcC5Cb3guZXh0cmFjdChrZXksIEZMQUdTX09GRlNFVCwgMSksIGJpdCwgdmFsdWUpCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weToyMDIKICAgIC8vIG9wLkJveC5yZXBsYWNlKGtleSwgRkxBR1NfT0ZGU0VULCBmbGFncykKICAgIHB1c2hpbnQgNTYKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY2FtcHVzX2Z1bmRpbmcvY29udHJhY3QucHk6NTcwCiAgICAvLyBzZWxmLmFjdGl2ZV9jYW1wYWlnbnMudmFsdWUgLT0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImFjdGl2ZV9jYW1wYWlnbnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWN0aXZlX2NhbXBhaWducyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlY18wIC8vICJhY3RpdmVfY2FtcGFpZ25zIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jYW1wdXNfZnVuZGluZy9jb250cmFjdC5weTo1NzEKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzEgLy8gMQogICAgc3dhcAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [384, 2239], "errorMessage": "Address length is 32 bytes"}, {"pc": [1005, 2698], "errorMessage": "Campaign data too large"}, {"pc": [460, 497, 694, 1417, 2466, 2596, 2767], "errorMessage": "Campaign does not exist"}, {"pc": [2786], "errorMessage": "Campaign has ended"}, {"pc": [2492, 2613, 2775], "errorMessage": "Campaign is not active"}, {"pc": [471, 508], "errorMessage": "Campaign still active"}, {"pc": [2483], "errorMessage": "Cannot cancel campaign with contributions"}, {"pc": [1113, 1249], "errorMessage": "Contribution must be greater than 0"}, {"pc": [1450], "errorMessage": "Funds already withdrawn"}, {"pc": [522], "errorMessage": "Goal not reached"}, {"pc": [485], "errorMessage": "Goal was reached, no refunds"}, {"pc": [1584], "errorMessage": "No contribution to refund"}, {"pc": [2475], "errorMessage": "Only creator can cancel"}, {"pc": [2605], "errorMessage": "Only creator can update"}, {"pc": [1427], "errorMessage": "Only creator can withdraw"}, {"pc": [1089, 1210], "errorMessage": "Payment must be to contract"}, {"pc": [1363], "errorMessage": "Splits must add up to payment"}, {"pc": [1336], "errorMessage": "Splits must be sorted by campaign ID"}, {"pc": [2701], "errorMessage": "check BoxRef exists"}, {"pc": [1048, 1473, 2426, 2503, 2908], "errorMessage": "check self.active_campaigns exists"}, {"pc": [2432, 2843], "errorMessage": "check self.successful_campaigns exists"}, {"pc": [918, 1987, 2416], "errorMessage": "check self.total_campaigns exists"}, {"pc": [1588, 1723, 2421, 2820], "errorMessage": "check self.total_raised exists"}, {"pc": [1235, 1326, 1700, 1796], "errorMessage": "index access is out of bounds"}, {"pc": [857, 873, 906, 1181, 1655, 1759, 1851, 2007, 2565, 2581], "errorMessage": "invalid array length header"}, {"pc": [1667, 1771], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [1862, 2018], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint64>"}, {"pc": [867, 883, 913, 2575, 2588], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [1193], "errorMessage": "invalid number of bytes for arc4.dynamic_array<smart_contracts.campus_funding.contract.ContributionSplit>"}, {"pc": [1563, 2210], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [891, 899, 1067, 1406, 1553, 1644, 1748, 1972, 2218, 2232, 2459, 2558], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [1082, 1204], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class CampaignInfo:
+    """Struct for CampaignInfo"""
+    creator: str
+    title: str
+    description: str
+    goal_amount: int
+    deadline: int
+    total_raised: int
+    is_active: bool
+    funds_withdrawn: bool
+    image_url: str
+
+@dataclasses.dataclass(frozen=True)
+class CreatorCampaigns:
+    """Struct for CreatorCampaigns"""
+    total: int
+    campaign_ids: list[int]
+
+@dataclasses.dataclass(frozen=True)
+class PlatformStats:
+    """Struct for PlatformStats"""
+    total_campaigns: int
+    total_raised: int
+    active_campaigns: int
+    successful_campaigns: int
+    leaderboard: tuple[tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int]]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateCampaignArgs:
+    """Dataclass for create_campaign arguments"""
+    title: str
+    description: str
+    goal_amount: int
+    duration_seconds: int
+    image_url: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_campaign(string,string,uint64,uint64,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ContributeArgs:
+    """Dataclass for contribute arguments"""
+    campaign_id: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "contribute(uint64,pay)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ContributeManyArgs:
+    """Dataclass for contribute_many arguments"""
+    splits: list[tuple[int, int]]
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "contribute_many((uint64,uint64)[],pay)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class WithdrawFundsArgs:
+    """Dataclass for withdraw_funds arguments"""
+    campaign_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "withdraw_funds(uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimRefundArgs:
+    """Dataclass for claim_refund arguments"""
+    campaign_id: int
+    contributor: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim_refund(uint64,address)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RefundBatchArgs:
+    """Dataclass for refund_batch arguments"""
+    campaign_id: int
+    contributors: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "refund_batch(uint64,address[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReleaseDepositsArgs:
+    """Dataclass for release_deposits arguments"""
+    campaign_id: int
+    contributors: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "release_deposits(uint64,address[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CloseFailedCampaignsArgs:
+    """Dataclass for close_failed_campaigns arguments"""
+    campaign_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "close_failed_campaigns(uint64[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCampaignInfoArgs:
+    """Dataclass for get_campaign_info arguments"""
+    campaign_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCampaignsArgs:
+    """Dataclass for get_campaigns arguments"""
+    campaign_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCreatorCampaignsArgs:
+    """Dataclass for get_creator_campaigns arguments"""
+    creator: str
+    start: int
+    limit: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CancelCampaignArgs:
+    """Dataclass for cancel_campaign arguments"""
+    campaign_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "cancel_campaign(uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class UpdateCampaignArgs:
+    """Dataclass for update_campaign arguments"""
+    campaign_id: int
+    new_description: str
+    new_image_url: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "update_campaign(uint64,string,string)string"
+
+
+class CampusFundingParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_campaign(
+        self,
+        args: tuple[str, str, int, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def contribute(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | ContributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "contribute(uint64,pay)string",
+            "args": method_args,
+        }))
+
+    def contribute_many(
+        self,
+        args: tuple[list[tuple[int, int]], algokit_utils.AppMethodCallTransactionArgument] | ContributeManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "contribute_many((uint64,uint64)[],pay)string",
+            "args": method_args,
+        }))
+
+    def withdraw_funds(
+        self,
+        args: tuple[int] | WithdrawFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_funds(uint64)string",
+            "args": method_args,
+        }))
+
+    def claim_refund(
+        self,
+        args: tuple[int, str] | ClaimRefundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_refund(uint64,address)string",
+            "args": method_args,
+        }))
+
+    def refund_batch(
+        self,
+        args: tuple[int, list[str]] | RefundBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "refund_batch(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
+    def release_deposits(
+        self,
+        args: tuple[int, list[str]] | ReleaseDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "release_deposits(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
+    def close_failed_campaigns(
+        self,
+        args: tuple[list[int]] | CloseFailedCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_failed_campaigns(uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def get_campaign_info(
+        self,
+        args: tuple[int] | GetCampaignInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)",
+            "args": method_args,
+        }))
+
+    def get_total_campaigns(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_campaigns()uint64",
+        }))
+
+    def get_campaigns(
+        self,
+        args: tuple[list[int]] | GetCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]",
+            "args": method_args,
+        }))
+
+    def increase_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "increase_budget()void",
+        }))
+
+    def get_creator_campaigns(
+        self,
+        args: tuple[str, int, int] | GetCreatorCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])",
+            "args": method_args,
+        }))
+
+    def get_platform_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10])",
+        }))
+
+    def cancel_campaign(
+        self,
+        args: tuple[int] | CancelCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel_campaign(uint64)string",
+            "args": method_args,
+        }))
+
+    def update_campaign(
+        self,
+        args: tuple[int, str, str] | UpdateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update_campaign(uint64,string,string)string",
+            "args": method_args,
+        }))
+
+    def create_application(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_application()string",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class CampusFundingCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_campaign(
+        self,
+        args: tuple[str, str, int, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def contribute(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | ContributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "contribute(uint64,pay)string",
+            "args": method_args,
+        }))
+
+    def contribute_many(
+        self,
+        args: tuple[list[tuple[int, int]], algokit_utils.AppMethodCallTransactionArgument] | ContributeManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "contribute_many((uint64,uint64)[],pay)string",
+            "args": method_args,
+        }))
+
+    def withdraw_funds(
+        self,
+        args: tuple[int] | WithdrawFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_funds(uint64)string",
+            "args": method_args,
+        }))
+
+    def claim_refund(
+        self,
+        args: tuple[int, str] | ClaimRefundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_refund(uint64,address)string",
+            "args": method_args,
+        }))
+
+    def refund_batch(
+        self,
+        args: tuple[int, list[str]] | RefundBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "refund_batch(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
+    def release_deposits(
+        self,
+        args: tuple[int, list[str]] | ReleaseDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "release_deposits(uint64,address[])uint64",
+            "args": method_args,
+        }))
+
+    def close_failed_campaigns(
+        self,
+        args: tuple[list[int]] | CloseFailedCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_failed_campaigns(uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def get_campaign_info(
+        self,
+        args: tuple[int] | GetCampaignInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)",
+            "args": method_args,
+        }))
+
+    def get_total_campaigns(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_campaigns()uint64",
+        }))
+
+    def get_campaigns(
+        self,
+        args: tuple[list[int]] | GetCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]",
+            "args": method_args,
+        }))
+
+    def increase_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "increase_budget()void",
+        }))
+
+    def get_creator_campaigns(
+        self,
+        args: tuple[str, int, int] | GetCreatorCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])",
+            "args": method_args,
+        }))
+
+    def get_platform_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10])",
+        }))
+
+    def cancel_campaign(
+        self,
+        args: tuple[int] | CancelCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel_campaign(uint64)string",
+            "args": method_args,
+        }))
+
+    def update_campaign(
+        self,
+        args: tuple[int, str, str] | UpdateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update_campaign(uint64,string,string)string",
+            "args": method_args,
+        }))
+
+    def create_application(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_application()string",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class CampusFundingSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_campaign(
+        self,
+        args: tuple[str, str, int, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_campaign(string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def contribute(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | ContributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "contribute(uint64,pay)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def contribute_many(
+        self,
+        args: tuple[list[tuple[int, int]], algokit_utils.AppMethodCallTransactionArgument] | ContributeManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "contribute_many((uint64,uint64)[],pay)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def withdraw_funds(
+        self,
+        args: tuple[int] | WithdrawFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_funds(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def claim_refund(
+        self,
+        args: tuple[int, str] | ClaimRefundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_refund(uint64,address)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def refund_batch(
+        self,
+        args: tuple[int, list[str]] | RefundBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "refund_batch(uint64,address[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def release_deposits(
+        self,
+        args: tuple[int, list[str]] | ReleaseDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "release_deposits(uint64,address[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def close_failed_campaigns(
+        self,
+        args: tuple[list[int]] | CloseFailedCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "close_failed_campaigns(uint64[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_campaign_info(
+        self,
+        args: tuple[int] | GetCampaignInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CampaignInfo]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CampaignInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CampaignInfo], parsed_response)
+
+    def get_total_campaigns(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_total_campaigns()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_campaigns(
+        self,
+        args: tuple[list[int]] | GetCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[str, str, str, int, int, int, bool, bool, str]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[str, str, str, int, int, int, bool, bool, str]]], parsed_response)
+
+    def increase_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "increase_budget()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_creator_campaigns(
+        self,
+        args: tuple[str, int, int] | GetCreatorCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CreatorCampaigns]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CreatorCampaigns, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CreatorCampaigns], parsed_response)
+
+    def get_platform_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[PlatformStats]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10])",
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PlatformStats, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[PlatformStats], parsed_response)
+
+    def cancel_campaign(
+        self,
+        args: tuple[int] | CancelCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel_campaign(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def update_campaign(
+        self,
+        args: tuple[int, str, str] | UpdateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "update_campaign(uint64,string,string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_application(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_application()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    total_campaigns: int
+    total_raised: int
+    active_campaigns: int
+    successful_campaigns: int
+
+class CampusFundingState:
+    """Methods to access state for the current CampusFunding app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def total_campaigns(self) -> int:
+        """Get the current value of the total_campaigns key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_campaigns")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_raised(self) -> int:
+        """Get the current value of the total_raised key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_raised")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def active_campaigns(self) -> int:
+        """Get the current value of the active_campaigns key in global_state state"""
+        value = self.app_client.state.global_state.get_value("active_campaigns")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def successful_campaigns(self) -> int:
+        """Get the current value of the successful_campaigns key in global_state state"""
+        value = self.app_client.state.global_state.get_value("successful_campaigns")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class CampusFundingClient:
+    """Client for interacting with CampusFunding smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = CampusFundingParams(self.app_client)
+        self.create_transaction = CampusFundingCreateTransactionParams(self.app_client)
+        self.send = CampusFundingSend(self.app_client)
+        self.state = CampusFundingState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "CampusFundingClient":
+        return CampusFundingClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "CampusFundingClient":
+        return CampusFundingClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "CampusFundingClient":
+        return CampusFundingClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "CampusFundingComposer":
+        return CampusFundingComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_campaign(string,string,uint64,uint64,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["contribute(uint64,pay)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["contribute_many((uint64,uint64)[],pay)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw_funds(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_refund(uint64,address)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["refund_batch(uint64,address[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["release_deposits(uint64,address[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["close_failed_campaigns(uint64[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CampaignInfo | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_total_campaigns()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[str, str, str, int, int, int, bool, bool, str]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["increase_budget()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CreatorCampaigns | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> PlatformStats | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["cancel_campaign(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["update_campaign(uint64,string,string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_application()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | CampaignInfo | CreatorCampaigns | None | PlatformStats | int | list[tuple[str, str, str, int, int, int, bool, bool, str]] | str:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class CampusFundingMethodCallCreateParams(
+    algokit_utils.AppClientCreateSchema, algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for creating CampusFunding contract using ABI"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallCreateParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallCreateParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class CampusFundingFactory(algokit_utils.TypedAppFactoryProtocol[CampusFundingMethodCallCreateParams, None, None]):
+    """Factory for deploying and managing CampusFundingClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = CampusFundingFactoryParams(self.app_factory)
+        self.create_transaction = CampusFundingFactoryCreateTransaction(self.app_factory)
+        self.send = CampusFundingFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: CampusFundingMethodCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[CampusFundingClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return CampusFundingClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CampusFundingClient:
+        """Get an app client by creator address and name"""
+        return CampusFundingClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CampusFundingClient:
+        """Get an app client by app ID"""
+        return CampusFundingClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class CampusFundingFactoryParams:
+    """Parameters for creating transactions for CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CampusFundingFactoryCreateParams(app_factory)
+        self.update = CampusFundingFactoryUpdateParams(app_factory)
+        self.delete = CampusFundingFactoryDeleteParams(app_factory)
+
+class CampusFundingFactoryCreateParams:
+    """Parameters for 'create' operations of CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_campaign(
+        self,
+        args: tuple[str, str, int, int, str] | CreateCampaignArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_campaign(string,string,uint64,uint64,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_campaign(string,string,uint64,uint64,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def contribute(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | ContributeArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the contribute(uint64,pay)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "contribute(uint64,pay)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def contribute_many(
+        self,
+        args: tuple[list[tuple[int, int]], algokit_utils.AppMethodCallTransactionArgument] | ContributeManyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the contribute_many((uint64,uint64)[],pay)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "contribute_many((uint64,uint64)[],pay)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def withdraw_funds(
+        self,
+        args: tuple[int] | WithdrawFundsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw_funds(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw_funds(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim_refund(
+        self,
+        args: tuple[int, str] | ClaimRefundArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_refund(uint64,address)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_refund(uint64,address)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def refund_batch(
+        self,
+        args: tuple[int, list[str]] | RefundBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the refund_batch(uint64,address[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "refund_batch(uint64,address[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def release_deposits(
+        self,
+        args: tuple[int, list[str]] | ReleaseDepositsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the release_deposits(uint64,address[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "release_deposits(uint64,address[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def close_failed_campaigns(
+        self,
+        args: tuple[list[int]] | CloseFailedCampaignsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the close_failed_campaigns(uint64[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "close_failed_campaigns(uint64[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_campaign_info(
+        self,
+        args: tuple[int] | GetCampaignInfoArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_total_campaigns(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_total_campaigns()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_total_campaigns()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_campaigns(
+        self,
+        args: tuple[list[int]] | GetCampaignsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def increase_budget(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the increase_budget()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "increase_budget()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_creator_campaigns(
+        self,
+        args: tuple[str, int, int] | GetCreatorCampaignsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_creator_campaigns(address,uint64,uint64)(uint64,uint64[]) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_platform_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10]) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10])",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def cancel_campaign(
+        self,
+        args: tuple[int] | CancelCampaignArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the cancel_campaign(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "cancel_campaign(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def update_campaign(
+        self,
+        args: tuple[int, str, str] | UpdateCampaignArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the update_campaign(uint64,string,string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "update_campaign(uint64,string,string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_application(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_application()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_application()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class CampusFundingFactoryUpdateParams:
+    """Parameters for 'update' operations of CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class CampusFundingFactoryDeleteParams:
+    """Parameters for 'delete' operations of CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class CampusFundingFactoryCreateTransaction:
+    """Create transactions for CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CampusFundingFactoryCreateTransactionCreate(app_factory)
+
+
+class CampusFundingFactoryCreateTransactionCreate:
+    """Create new instances of CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class CampusFundingFactorySend:
+    """Send calls to CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CampusFundingFactorySendCreate(app_factory)
+
+
+class CampusFundingFactorySendCreate:
+    """Send create calls to CampusFunding contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[CampusFundingClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return CampusFundingClient(result[0]), result[1]
+
+    def create_application(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> tuple[CampusFundingClient, algokit_utils.AppFactoryCreateMethodCallResult[str]]:
+            """Creates and sends a transaction using the create_application()string ABI method"""
+            params = params or algokit_utils.CommonAppCallCreateParams()
+            client, result = self.app_factory.send.create(
+                algokit_utils.AppFactoryCreateMethodCallParams(
+                    **{
+                    **dataclasses.asdict(params),
+                    "method": "create_application()string",
+                    "args": None,
+                    }
+                ),
+                send_params=send_params,
+                compilation_params=compilation_params
+            )
+            return_value = None if result.abi_return is None else typing.cast(str, result.abi_return)
+    
+            return CampusFundingClient(client), algokit_utils.AppFactoryCreateMethodCallResult[str](
+                **{
+                    **result.__dict__,
+                    "app_id": result.app_id,
+                    "abi_return": return_value,
+                    "transaction": result.transaction,
+                    "confirmation": result.confirmation,
+                    "group_id": result.group_id,
+                    "tx_ids": result.tx_ids,
+                    "transactions": result.transactions,
+                    "confirmations": result.confirmations,
+                    "app_address": result.app_address,
+                }
+            )
+
+
+class CampusFundingComposer:
+    """Composer for creating transaction groups for CampusFunding contract calls"""
+
+    def __init__(self, client: "CampusFundingClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def create_campaign(
+        self,
+        args: tuple[str, str, int, int, str] | CreateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_campaign(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_campaign(string,string,uint64,uint64,string)uint64", v
+            )
+        )
+        return self
+
+    def contribute(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | ContributeArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.contribute(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "contribute(uint64,pay)string", v
+            )
+        )
+        return self
+
+    def contribute_many(
+        self,
+        args: tuple[list[tuple[int, int]], algokit_utils.AppMethodCallTransactionArgument] | ContributeManyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.contribute_many(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "contribute_many((uint64,uint64)[],pay)string", v
+            )
+        )
+        return self
+
+    def withdraw_funds(
+        self,
+        args: tuple[int] | WithdrawFundsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw_funds(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw_funds(uint64)string", v
+            )
+        )
+        return self
+
+    def claim_refund(
+        self,
+        args: tuple[int, str] | ClaimRefundArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_refund(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_refund(uint64,address)string", v
+            )
+        )
+        return self
+
+    def refund_batch(
+        self,
+        args: tuple[int, list[str]] | RefundBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.refund_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "refund_batch(uint64,address[])uint64", v
+            )
+        )
+        return self
+
+    def release_deposits(
+        self,
+        args: tuple[int, list[str]] | ReleaseDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.release_deposits(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "release_deposits(uint64,address[])uint64", v
+            )
+        )
+        return self
+
+    def close_failed_campaigns(
+        self,
+        args: tuple[list[int]] | CloseFailedCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.close_failed_campaigns(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "close_failed_campaigns(uint64[])uint64", v
+            )
+        )
+        return self
+
+    def get_campaign_info(
+        self,
+        args: tuple[int] | GetCampaignInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_campaign_info(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_campaign_info(uint64)(address,string,string,uint64,uint64,uint64,bool,bool,string)", v
+            )
+        )
+        return self
+
+    def get_total_campaigns(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_total_campaigns(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_total_campaigns()uint64", v
+            )
+        )
+        return self
+
+    def get_campaigns(
+        self,
+        args: tuple[list[int]] | GetCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_campaigns(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_campaigns(uint64[])(address,string,string,uint64,uint64,uint64,bool,bool,string)[]", v
+            )
+        )
+        return self
+
+    def increase_budget(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.increase_budget(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "increase_budget()void", v
+            )
+        )
+        return self
+
+    def get_creator_campaigns(
+        self,
+        args: tuple[str, int, int] | GetCreatorCampaignsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_creator_campaigns(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_creator_campaigns(address,uint64,uint64)(uint64,uint64[])", v
+            )
+        )
+        return self
+
+    def get_platform_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_platform_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_platform_stats()(uint64,uint64,uint64,uint64,(uint64,uint64)[10])", v
+            )
+        )
+        return self
+
+    def cancel_campaign(
+        self,
+        args: tuple[int] | CancelCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.cancel_campaign(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "cancel_campaign(uint64)string", v
+            )
+        )
+        return self
+
+    def update_campaign(
+        self,
+        args: tuple[int, str, str] | UpdateCampaignArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.update_campaign(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "update_campaign(uint64,string,string)string", v
+            )
+        )
+        return self
+
+    def create_application(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_application(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_application()string", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "CampusFundingComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "CampusFundingComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -4,7 +4,3 @@ Campus Funding Smart Contract Module
 This module contains the main crowdfunding smart contract
 with escrow functionality for campus projects.
 """
-
-from smart_contracts.campus_funding.contract import CampusFunding, CampaignInfo
-
-__all__ = ["CampusFunding", "CampaignInfo"]
@@ -0,0 +1,95 @@
+"""
+Opcode budget padding for heavy calls
+
+Every app call in a group adds 700 to an opcode budget the whole group
+shares. A call that needs more, such as update_campaign rewriting a long
+description, fails unless the group carries extra app calls.
+
+send_with_budget simulates the group first with extra budget allowed,
+reads how much it consumed against the 700 per app call it will have
+without that allowance, and appends just enough increase_budget calls to
+cover the difference. Each of those spends a few opcodes of its own in the
+router, so only what it adds beyond that counts towards the shortfall. Groups that fit the budget are
+sent unchanged, so only heavy calls pay for padding.
+
+    send_with_budget(
+        app_client,
+        lambda composer: composer.update_campaign({...}),
+    )
+"""
+
+import logging
+import math
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingClient,
+        CampusFundingComposer,
+    )
+
+logger = logging.getLogger(__name__)
+
+OPCODE_BUDGET_PER_APP_CALL = 700
+# Opcodes an increase_budget call spends routing to its empty body, which
+# is 14 in the compiled approval program, with room for the router to grow
+INCREASE_BUDGET_COST = 20
+MAX_GROUP_SIZE = 16
+# The most extra budget simulate grants, so the real cost can be measured
+MAX_SIMULATE_EXTRA_BUDGET = 320_000
+
+
+def padding_calls(group_result: Mapping[str, Any]) -> int:
+    """
+    Budget-padding app calls a group needs, from its simulate result
+    ("txn-groups"[0]). The group's "app-budget-added" includes the extra
+    budget simulate was allowed, so the natural budget is counted from its
+    app calls instead. Padding calls cost INCREASE_BUDGET_COST each, so
+    they are counted by the budget they add net of that.
+    """
+    app_calls = sum(
+        1
+        for txn_result in group_result.get("txn-results", [])
+        if txn_result["txn-result"]["txn"]["txn"].get("type") == "appl"
+    )
+    shortfall = (
+        group_result.get("app-budget-consumed", 0) - app_calls * OPCODE_BUDGET_PER_APP_CALL
+    )
+    return max(0, math.ceil(shortfall / (OPCODE_BUDGET_PER_APP_CALL - INCREASE_BUDGET_COST)))
+
+
+def send_with_budget(
+    app_client: "CampusFundingClient",
+    build: Callable[["CampusFundingComposer"], "CampusFundingComposer"],
+    **send_params: Any,
+) -> Any:
+    """
+    Send the group `build` adds calls to, padded with increase_budget calls
+    if its opcode cost needs them. Keyword arguments go to send().
+    """
+    from algokit_utils import CommonAppCallParams
+
+    simulated = build(app_client.new_group()).simulate(
+        skip_signatures=True,
+        allow_unnamed_resources=True,
+        extra_opcode_budget=MAX_SIMULATE_EXTRA_BUDGET,
+    )
+    padding = padding_calls(simulated.simulate_response["txn-groups"][0])
+    group_size = len(simulated.transactions)
+    if group_size + padding > MAX_GROUP_SIZE:
+        raise ValueError(
+            f"Group needs {padding} budget calls on top of its {group_size} transactions, "
+            f"more than fit in a group of {MAX_GROUP_SIZE}"
+        )
+
+    # A composer can't take more calls once built, so build the group again
+    composer = build(app_client.new_group())
+    for index in range(padding):
+        # Notes keep otherwise identical calls from sharing a transaction ID
+        composer = composer.increase_budget(
+            params=CommonAppCallParams(note=b"budget" + bytes([index]))
+        )
+    if padding:
+        logger.debug(f"Padding group with {padding} budget calls")
+    return composer.send(**send_params)
@@ -0,0 +1,133 @@
+"""
+Zero-copy decoding of CampusFunding's ARC-4 encodings
+
+The generated client decodes every CampaignInfo through algosdk's generic
+ABI codec, which builds a tuple of every field (strings included) before
+the client turns it into a dataclass. For bulk reads that is the hot spot.
+
+The decoders here work on memoryview slices of the raw bytes instead.
+Fixed-width fields are read straight from their offsets, and strings are
+only decoded when they are accessed, so a scan that filters on amounts or
+deadlines never touches the text.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+# CampaignInfo head: (address,string,string,uint64,uint64,uint64,bool,bool,string)
+# Dynamic fields are uint16 offsets from the start of the struct, and the
+# two bools share one byte
+INFO_CREATOR = 0
+INFO_TITLE = 32
+INFO_DESCRIPTION = 34
+INFO_GOAL_AMOUNT = 36
+INFO_DEADLINE = 44
+INFO_TOTAL_RAISED = 52
+INFO_FLAGS = 60
+INFO_IMAGE_URL = 61
+INFO_HEAD_SIZE = 63
+
+# CampaignState box: (address,uint64,uint64,uint64,bool,bool)
+STATE_GOAL_AMOUNT = 32
+STATE_DEADLINE = 40
+STATE_TOTAL_RAISED = 48
+STATE_FLAGS = 56
+STATE_SIZE = 57
+
+# CampaignMetadata box: (string,string,string)
+METADATA_TITLE = 0
+METADATA_DESCRIPTION = 2
+METADATA_IMAGE_URL = 4
+
+# ARC-4 packs bools from the most significant bit
+IS_ACTIVE_MASK = 0x80
+FUNDS_WITHDRAWN_MASK = 0x40
+
+
+def read_uint64(view: memoryview, offset: int) -> int:
+    return int.from_bytes(view[offset : offset + 8], "big")
+
+
+def read_string(view: memoryview, head_offset: int) -> str:
+    """Decode the ARC-4 string whose offset is stored at `head_offset`."""
+    start = int.from_bytes(view[head_offset : head_offset + 2], "big")
+    length = int.from_bytes(view[start : start + 2], "big")
+    return str(view[start + 2 : start + 2 + length], "utf-8")
+
+
+class CampaignInfoView:
+    """
+    Read-only CampaignInfo over encoded bytes, with the field names of the
+    generated client's CampaignInfo. Nothing is copied or decoded until a
+    field is read.
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, data: "Buffer"):
+        view = memoryview(data)
+        if len(view) < INFO_HEAD_SIZE:
+            raise ValueError(f"CampaignInfo needs at least {INFO_HEAD_SIZE} bytes, got {len(view)}")
+        self._view = view
+
+    @property
+    def creator_key(self) -> bytes:
+        """Creator's 32-byte public key"""
+        return bytes(self._view[INFO_CREATOR : INFO_CREATOR + 32])
+
+    @property
+    def creator(self) -> str:
+        from algosdk.encoding import encode_address
+
+        return encode_address(self.creator_key)  # type: ignore[no-any-return]
+
+    @property
+    def title(self) -> str:
+        return read_string(self._view, INFO_TITLE)
+
+    @property
+    def description(self) -> str:
+        return read_string(self._view, INFO_DESCRIPTION)
+
+    @property
+    def goal_amount(self) -> int:
+        return read_uint64(self._view, INFO_GOAL_AMOUNT)
+
+    @property
+    def deadline(self) -> int:
+        return read_uint64(self._view, INFO_DEADLINE)
+
+    @property
+    def total_raised(self) -> int:
+        return read_uint64(self._view, INFO_TOTAL_RAISED)
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self._view[INFO_FLAGS] & IS_ACTIVE_MASK)
+
+    @property
+    def funds_withdrawn(self) -> bool:
+        return bool(self._view[INFO_FLAGS] & FUNDS_WITHDRAWN_MASK)
+
+    @property
+    def image_url(self) -> str:
+        return read_string(self._view, INFO_IMAGE_URL)
+
+    def __repr__(self) -> str:
+        return f"CampaignInfoView({self.title!r}, {self.total_raised}/{self.goal_amount})"
+
+
+def decode_campaign_infos(data: "Buffer") -> list[CampaignInfoView]:
+    """
+    Split an encoded CampaignInfo[] (the raw return of get_campaigns) into
+    views. Elements are slices of the same buffer.
+    """
+    view = memoryview(data)
+    count = int.from_bytes(view[:2], "big")
+    # Element offsets are relative to the end of the length prefix
+    body = view[2:]
+    offsets = [int.from_bytes(body[2 * i : 2 * i + 2], "big") for i in range(count)]
+    ends = offsets[1:] + [len(body)]
+    return [CampaignInfoView(body[start:end]) for start, end in zip(offsets, ends)]
@@ -1,15 +1,81 @@
+import typing
+
 from algopy import (
     ARC4Contract,
+    Bytes,
     Global,
     Txn,
     gtxn,
+    itxn,
     String,
     UInt64,
     Account,
     BoxRef,
+    GlobalState,
     op,
+    subroutine,
+    urange,
+)
+from algopy.arc4 import (
+    abimethod,
+    Struct,
+    DynamicArray,
+    StaticArray,
+    UInt64 as ARC4UInt64,
+    String as ARC4String,
+    Address,
+    Bool,
 )
-from algopy.arc4 import abimethod, Struct, UInt64 as ARC4UInt64, String as ARC4String, Address, Bool
+
+# Upper bound on the encoded CampaignMetadata stored in a metadata box. Boxes are
+# sized to the exact encoded struct, and the app account pays the box minimum
+# balance (2500 + 400 * (key + size) microALGOs), so this caps what a single
+# campaign can lock up.
+MAX_CAMPAIGN_BOX_SIZE = 1024
+
+# Byte layout of the fixed-width CampaignState record, so the funding methods
+# can read and write single fields with box_extract / box_replace
+STATE_BOX_SIZE = 57
+CREATOR_OFFSET = 0
+GOAL_AMOUNT_OFFSET = 32
+DEADLINE_OFFSET = 40
+TOTAL_RAISED_OFFSET = 48
+FLAGS_OFFSET = 56
+IS_ACTIVE_BIT = 0
+FUNDS_WITHDRAWN_BIT = 1
+
+# Metadata boxes are keyed by this prefix + itob(campaign_id)
+METADATA_KEY_PREFIX = b"m"
+
+# Box MBR of a contributor's ledger entry, 2500 + 400 * (40 + 8). The payment
+# that creates an entry carries it on top of the contribution, so the app
+# account never pays for boxes other accounts create, and it is paid back
+# when the entry is deleted.
+CONTRIBUTION_DEPOSIT = 21_700
+
+# Paged indexes keep every box within the 1 KB of I/O budget one box
+# reference grants: the index key holds itob(number of IDs), and
+# key + itob(page) holds IDs page * 128 up to (page + 1) * 128, in order
+INDEX_PAGE_IDS = 128
+
+# Deadline index: "d" + itob(deadline // DEADLINE_BUCKET_SECONDS) is a paged
+# index of every campaign ending that day, in creation order
+DEADLINE_BUCKET_PREFIX = b"d"
+DEADLINE_BUCKET_SECONDS = 86_400
+# Creator index: "c" + creator address is a paged index of every campaign
+# the account created, in creation order
+CREATOR_INDEX_PREFIX = b"c"
+# IDs per get_creator_campaigns page; keeps the return under the 1 KB log
+# limit, and below INDEX_PAGE_IDS so a page spans at most two index pages
+MAX_CREATOR_PAGE = 100
+
+# Leaderboard box: the campaigns that raised the most, as LEADERBOARD_LENGTH
+# (itob(campaign_id), itob(total_raised)) entries sorted by total_raised
+# descending. Unused entries are zero, which no campaign ID is.
+LEADERBOARD_KEY = b"top"
+LEADERBOARD_LENGTH = 10
+LEADERBOARD_ENTRY_SIZE = 16
+LEADERBOARD_SIZE = LEADERBOARD_LENGTH * LEADERBOARD_ENTRY_SIZE
 
 
 class CampaignInfo(Struct):
@@ -25,10 +91,259 @@ class CampaignInfo(Struct):
     image_url: ARC4String
 
 
+class CampaignState(Struct):
+    """Fixed-width hot record touched by every funding call"""
+    creator: Address
+    goal_amount: ARC4UInt64
+    deadline: ARC4UInt64
+    total_raised: ARC4UInt64
+    is_active: Bool
+    funds_withdrawn: Bool
+
+
+class CampaignMetadata(Struct):
+    """Display text, only written by create_campaign and update_campaign"""
+    title: ARC4String
+    description: ARC4String
+    image_url: ARC4String
+
+
+class LeaderboardEntry(Struct):
+    """One leaderboard position"""
+    campaign_id: ARC4UInt64
+    total_raised: ARC4UInt64
+
+
+class PlatformStats(Struct):
+    """Headline numbers for the dashboard"""
+    total_campaigns: ARC4UInt64
+    total_raised: ARC4UInt64
+    active_campaigns: ARC4UInt64
+    successful_campaigns: ARC4UInt64
+    # Length is LEADERBOARD_LENGTH
+    leaderboard: StaticArray[LeaderboardEntry, typing.Literal[10]]
+
+
+class CreatorCampaigns(Struct):
+    """One page of a creator's campaign IDs"""
+    total: ARC4UInt64
+    campaign_ids: DynamicArray[ARC4UInt64]
+
+
+class ContributionSplit(Struct):
+    """Share of a batched payment going to one campaign"""
+    campaign_id: ARC4UInt64
+    amount: ARC4UInt64
+
+
+@subroutine
+def metadata_key(campaign_id: UInt64) -> Bytes:
+    """Box key of a campaign's metadata"""
+    return Bytes(METADATA_KEY_PREFIX) + op.itob(campaign_id)
+
+
+@subroutine
+def contribution_key(campaign_id: UInt64, contributor: Account) -> Bytes:
+    """Box key of a contributor's ledger entry: itob(campaign_id) + address"""
+    return op.itob(campaign_id) + contributor.bytes
+
+
+@subroutine
+def ledger_deposit(campaign_id: UInt64, contributor: Account) -> UInt64:
+    """Deposit a contribution must carry: CONTRIBUTION_DEPOSIT if it creates a ledger entry"""
+    if BoxRef(key=contribution_key(campaign_id, contributor)):
+        return UInt64(0)
+    return UInt64(CONTRIBUTION_DEPOSIT)
+
+
+@subroutine
+def settle_contribution(campaign_id: UInt64, contributor: Account, refund: bool) -> UInt64:
+    """
+    Delete a contributor's ledger entry and pay back its deposit, plus the
+    contribution if `refund`. Returns the contribution, or 0 if the
+    contributor has no entry.
+    """
+    contribution_box = BoxRef(key=contribution_key(campaign_id, contributor))
+    contributed, exists = contribution_box.maybe()
+    if not exists:
+        return UInt64(0)
+    amount = op.btoi(contributed)
+
+    # Clear the entry before paying out; deleting also releases its MBR
+    contribution_box.delete()
+
+    payout = UInt64(CONTRIBUTION_DEPOSIT)
+    if refund:
+        payout += amount
+    itxn.Payment(
+        receiver=contributor,
+        amount=payout,
+        fee=0,  # Caller pays fee
+    ).submit()
+    return amount
+
+
+@subroutine
+def read_uint64(key: Bytes, offset: UInt64) -> UInt64:
+    """Read one uint64 field of a campaign state record"""
+    return op.btoi(op.Box.extract(key, offset, 8))
+
+
+@subroutine
+def read_flag(key: Bytes, bit: UInt64) -> bool:
+    """Read one flag bit of a campaign state record"""
+    return op.getbit(op.Box.extract(key, FLAGS_OFFSET, 1), bit)
+
+
+@subroutine
+def write_flag(key: Bytes, bit: UInt64, value: bool) -> None:
+    """Set one flag bit of a campaign state record"""
+    flags = op.setbit_bytes(op.Box.extract(key, FLAGS_OFFSET, 1), bit, value)
+    op.Box.replace(key, FLAGS_OFFSET, flags)
+
+
+@subroutine
+def read_creator(key: Bytes) -> Account:
+    """Read the creator of a campaign state record"""
+    return Account(op.Box.extract(key, CREATOR_OFFSET, 32))
+
+
+@subroutine
+def deadline_bucket_key(deadline: UInt64) -> Bytes:
+    """Box key of the deadline index entry for the day `deadline` falls in"""
+    return Bytes(DEADLINE_BUCKET_PREFIX) + op.itob(deadline // DEADLINE_BUCKET_SECONDS)
+
+
+@subroutine
+def creator_index_key(creator: Account) -> Bytes:
+    """Box key of the index of campaigns created by `creator`"""
+    return Bytes(CREATOR_INDEX_PREFIX) + creator.bytes
+
+
+@subroutine
+def index_page_key(key: Bytes, page: UInt64) -> Bytes:
+    """Box key of one page of a paged index"""
+    return key + op.itob(page)
+
+
+@subroutine
+def append_to_paged_index(key: Bytes, campaign_id: UInt64) -> None:
+    """Append a campaign ID to a paged index, starting a new page when the last is full"""
+    count_box = BoxRef(key=key)
+    count = op.btoi(count_box.get(default=op.itob(0)))
+    count_box.put(op.itob(count + 1))
+
+    page_box = BoxRef(key=index_page_key(key, count // INDEX_PAGE_IDS))
+    offset = (count % INDEX_PAGE_IDS) * 8
+    if offset == 0:
+        page_box.create(size=UInt64(8))
+    else:
+        page_box.resize(offset + 8)
+    page_box.replace(offset, op.itob(campaign_id))
+
+
+@subroutine
+def assert_refunds_open(campaign_id: UInt64) -> None:
+    """Check that a campaign has ended without reaching its goal"""
+    state_key = op.itob(campaign_id)
+    assert BoxRef(key=state_key), "Campaign does not exist"
+
+    # Verify campaign has ended
+    assert Global.latest_timestamp > read_uint64(state_key, UInt64(DEADLINE_OFFSET)), "Campaign still active"
+
+    # Verify goal was NOT met
+    total_raised = read_uint64(state_key, UInt64(TOTAL_RAISED_OFFSET))
+    assert total_raised < read_uint64(state_key, UInt64(GOAL_AMOUNT_OFFSET)), "Goal was reached, no refunds"
+
+
+@subroutine
+def assert_goal_reached(campaign_id: UInt64) -> None:
+    """Check that a campaign has ended and reached its goal"""
+    state_key = op.itob(campaign_id)
+    assert BoxRef(key=state_key), "Campaign does not exist"
+
+    # Verify campaign has ended
+    assert Global.latest_timestamp > read_uint64(state_key, UInt64(DEADLINE_OFFSET)), "Campaign still active"
+
+    # Verify goal was met
+    total_raised = read_uint64(state_key, UInt64(TOTAL_RAISED_OFFSET))
+    assert total_raised >= read_uint64(state_key, UInt64(GOAL_AMOUNT_OFFSET)), "Goal not reached"
+
+
+@subroutine
+def has_failed(campaign_id: UInt64) -> bool:
+    """Whether a campaign exists, has ended and missed its goal"""
+    state_key = op.itob(campaign_id)
+    if not BoxRef(key=state_key):
+        return False
+    if Global.latest_timestamp <= read_uint64(state_key, UInt64(DEADLINE_OFFSET)):
+        return False
+    total_raised = read_uint64(state_key, UInt64(TOTAL_RAISED_OFFSET))
+    return total_raised < read_uint64(state_key, UInt64(GOAL_AMOUNT_OFFSET))
+
+
+@subroutine
+def update_leaderboard(campaign_id: UInt64, total_raised: UInt64) -> None:
+    """
+    Move a campaign whose total just grew to its place on the leaderboard.
+    Totals only grow, so an entry only ever moves up.
+    """
+    leaderboard = BoxRef(key=LEADERBOARD_KEY)
+    if not leaderboard:
+        leaderboard.create(size=UInt64(LEADERBOARD_SIZE))
+
+    # The campaign's current position, else the last one if it now beats it
+    position = UInt64(LEADERBOARD_LENGTH)
+    for index in urange(LEADERBOARD_LENGTH):
+        if op.btoi(leaderboard.extract(index * LEADERBOARD_ENTRY_SIZE, 8)) == campaign_id:
+            position = index
+            break
+    if position == LEADERBOARD_LENGTH:
+        position = UInt64(LEADERBOARD_LENGTH - 1)
+        lowest = op.btoi(leaderboard.extract(position * LEADERBOARD_ENTRY_SIZE + 8, 8))
+        if total_raised <= lowest:
+            return
+
+    # Shift entries with smaller totals down one place
+    while position > 0:
+        above = leaderboard.extract((position - 1) * LEADERBOARD_ENTRY_SIZE, LEADERBOARD_ENTRY_SIZE)
+        if op.btoi(op.extract(above, 8, 8)) >= total_raised:
+            break
+        leaderboard.replace(position * LEADERBOARD_ENTRY_SIZE, above)
+        position -= 1
+    leaderboard.replace(
+        position * LEADERBOARD_ENTRY_SIZE, op.itob(campaign_id) + op.itob(total_raised)
+    )
+
+
+@subroutine
+def load_campaign_info(campaign_id: UInt64) -> CampaignInfo:
+    """Assemble the public CampaignInfo view from a campaign's two boxes"""
+    state_bytes, exists = BoxRef(key=op.itob(campaign_id)).maybe()
+    assert exists, "Campaign does not exist"
+
+    state = CampaignState.from_bytes(state_bytes)
+    # Every campaign with a state box has a metadata box
+    metadata_bytes = BoxRef(key=metadata_key(campaign_id)).get(default=Bytes())
+    metadata = CampaignMetadata.from_bytes(metadata_bytes)
+
+    return CampaignInfo(
+        creator=state.creator,
+        title=metadata.title,
+        description=metadata.description,
+        goal_amount=state.goal_amount,
+        deadline=state.deadline,
+        total_raised=state.total_raised,
+        is_active=state.is_active,
+        funds_withdrawn=state.funds_withdrawn,
+        image_url=metadata.image_url,
+    )
+
+
 class CampusFunding(ARC4Contract):
     """
     Campus Crowdfunding Platform Smart Contract
-    
+
     Features:
     - Create campaigns with title, description, goal, and deadline
     - Accept contributions in ALGO
@@ -36,8 +351,35 @@ class CampusFunding(ARC4Contract):
     - Escrow functionality: funds released only if goal met by deadline
     - Refund mechanism if goal not met
     - Campaign creator can withdraw funds after successful campaign
+
+    Storage:
+    - itob(campaign_id) -> CampaignState (57 bytes, updated in place)
+    - "m" + itob(campaign_id) -> CampaignMetadata (sized to the text)
+    - itob(campaign_id) + address -> contributed microALGOs (8 bytes), its MBR
+      paid by the contributor as a deposit returned when the entry is deleted
+    - "d" + itob(deadline day) -> number of campaigns ending that day (8 bytes)
+    - "d" + itob(deadline day) + itob(page) -> up to 128 of their IDs (8 bytes each)
+    - "c" + creator address -> number of campaigns the creator made (8 bytes)
+    - "c" + creator address + itob(page) -> up to 128 of their IDs (8 bytes each)
+    - "top" -> leaderboard of the 10 campaigns that raised the most (160 bytes)
+
+    Campaign IDs are assigned sequentially from 1, so every campaign is
+    in the range 1..total_campaigns.
+
+    Platform totals are kept in global state and updated by the calls that
+    change them, so they never need a scan of the boxes.
     """
 
+    def __init__(self) -> None:
+        # Global state to track total campaigns and hand out IDs
+        self.total_campaigns = GlobalState(UInt64(0))
+        # Contributions received across all campaigns, less refunds, in microALGOs
+        self.total_raised = GlobalState(UInt64(0))
+        # Campaigns not yet cancelled, withdrawn or closed after missing their goal
+        self.active_campaigns = GlobalState(UInt64(0))
+        # Campaigns whose contributions have reached their goal
+        self.successful_campaigns = GlobalState(UInt64(0))
+
     @abimethod(allow_actions=["NoOp"], create="require")
     def create_application(self) -> String:
         """Initialize the smart contract"""
@@ -46,52 +388,65 @@ class CampusFunding(ARC4Contract):
     @abimethod()
     def create_campaign(
         self,
-        campaign_id: UInt64,
         title: String,
         description: String,
         goal_amount: UInt64,
         duration_seconds: UInt64,
         image_url: String,
-    ) -> String:
+    ) -> UInt64:
         """
         Create a new crowdfunding campaign
-        
+
         Args:
-            campaign_id: Unique identifier for the campaign
             title: Campaign title
             description: Campaign description
             goal_amount: Funding goal in microALGOs
             duration_seconds: Campaign duration in seconds
             image_url: URL to campaign image
-        
+
         Returns:
-            Success message with campaign ID
+            ID assigned to the new campaign
         """
-        # Ensure campaign doesn't already exist
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert not campaign_box.exists, "Campaign ID already exists"
-        
+        # Assign the next campaign ID
+        campaign_id = self.total_campaigns.value + 1
+        self.total_campaigns.value = campaign_id
+        state_box = BoxRef(key=op.itob(campaign_id))
+
         # Calculate deadline
         deadline = Global.latest_timestamp + duration_seconds
-        
-        # Create campaign info
-        campaign = CampaignInfo(
+
+        # Store the hot record
+        state = CampaignState(
             creator=Address(Txn.sender),
-            title=ARC4String(title),
-            description=ARC4String(description),
             goal_amount=ARC4UInt64(goal_amount),
             deadline=ARC4UInt64(deadline),
             total_raised=ARC4UInt64(UInt64(0)),
             is_active=Bool(True),
             funds_withdrawn=Bool(False),
+        )
+        state_box.create(size=UInt64(STATE_BOX_SIZE))
+        state_box.put(state.bytes)
+
+        # Store the text in a box sized to the encoded metadata
+        metadata = CampaignMetadata(
+            title=ARC4String(title),
+            description=ARC4String(description),
             image_url=ARC4String(image_url),
         )
-        
-        # Store campaign in box storage
-        campaign_box.create(size=UInt64(1024))  # Allocate sufficient space
-        campaign_box.put(campaign.bytes)
-        
-        return String("Campaign created successfully")
+        metadata_bytes = metadata.bytes
+        assert metadata_bytes.length <= MAX_CAMPAIGN_BOX_SIZE, "Campaign data too large"
+        metadata_box = BoxRef(key=metadata_key(campaign_id))
+        metadata_box.create(size=metadata_bytes.length)
+        metadata_box.put(metadata_bytes)
+
+        # Index by deadline day so ended campaigns can be found without a scan,
+        # and by creator so an account's campaigns can be listed directly
+        append_to_paged_index(deadline_bucket_key(deadline), campaign_id)
+        append_to_paged_index(creator_index_key(Txn.sender), campaign_id)
+
+        self.active_campaigns.value += 1
+
+        return campaign_id
 
     @abimethod()
     def contribute(
@@ -101,160 +456,395 @@ class CampusFunding(ARC4Contract):
     ) -> String:
         """
         Contribute to a campaign
-        
+
         Args:
             campaign_id: ID of the campaign to contribute to
-            payment: Payment transaction with contribution amount
-        
+            payment: Payment transaction with the contribution amount, plus
+                CONTRIBUTION_DEPOSIT if it is the sender's first to the campaign
+
         Returns:
             Success message with contribution amount
         """
         # Verify payment transaction
         assert payment.receiver == Global.current_application_address, "Payment must be to contract"
-        assert payment.amount > 0, "Contribution must be greater than 0"
-        
+        deposit = ledger_deposit(campaign_id, payment.sender)
+        assert payment.amount > deposit, "Contribution must be greater than 0"
+
+        new_total = self._add_contribution(campaign_id, payment.sender, payment.amount - deposit)
+        update_leaderboard(campaign_id, new_total)
+
+        return String("Contribution successful")
+
+    @abimethod()
+    def contribute_many(
+        self,
+        splits: DynamicArray[ContributionSplit],
+        payment: gtxn.PaymentTransaction,
+    ) -> String:
+        """
+        Contribute to several campaigns with a single payment
+
+        Args:
+            splits: Campaign IDs and the amount each one receives
+            payment: Payment transaction covering the sum of all splits, plus
+                CONTRIBUTION_DEPOSIT for each campaign the sender hasn't
+                contributed to before
+
+        Returns:
+            Success message
+
+        Splits must be sorted by campaign ID. A campaign named by several
+        splits is ranked once, at its total after the last of them, which
+        is the one followed by another campaign.
+
+        Every split needs its campaign's state box and the payer's ledger
+        box in the group's box references, and the group needs the
+        leaderboard box once.
+        """
+        # Verify payment transaction
+        assert payment.receiver == Global.current_application_address, "Payment must be to contract"
+
+        total = UInt64(0)
+        for index in urange(splits.length):
+            campaign_id = splits[index].campaign_id.native
+            amount = splits[index].amount.native
+            assert amount > 0, "Contribution must be greater than 0"
+            total += amount + ledger_deposit(campaign_id, payment.sender)
+            new_total = self._add_contribution(campaign_id, payment.sender, amount)
+            if index + 1 == splits.length:
+                update_leaderboard(campaign_id, new_total)
+            else:
+                next_id = splits[index + 1].campaign_id.native
+                assert next_id >= campaign_id, "Splits must be sorted by campaign ID"
+                if next_id != campaign_id:
+                    update_leaderboard(campaign_id, new_total)
+
+        # Verify splits and deposits account for the whole payment
+        assert total == payment.amount, "Splits must add up to payment"
+
+        return String("Contributions successful")
+
+    @subroutine
+    def _add_contribution(self, campaign_id: UInt64, contributor: Account, amount: UInt64) -> UInt64:
+        """
+        Add a contribution to a campaign's total and the contributor's ledger
+        entry, returning the new total for the caller to rank
+        """
         # Load campaign
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert campaign_box.exists, "Campaign does not exist"
-        
-        campaign = CampaignInfo.from_bytes(campaign_box.get())
-        
+        state_box = BoxRef(key=op.itob(campaign_id))
+        assert state_box, "Campaign does not exist"
+
         # Verify campaign is active and not expired
-        assert campaign.is_active.native, "Campaign is not active"
-        assert Global.latest_timestamp <= campaign.deadline.native, "Campaign has ended"
-        
-        # Update total raised
-        new_total = campaign.total_raised.native + payment.amount
-        campaign.total_raised = ARC4UInt64(new_total)
-        
-        # Save updated campaign
-        campaign_box.put(campaign.bytes)
-        
-        return String("Contribution successful")
+        assert read_flag(state_box.key, UInt64(IS_ACTIVE_BIT)), "Campaign is not active"
+        assert Global.latest_timestamp <= read_uint64(state_box.key, UInt64(DEADLINE_OFFSET)), "Campaign has ended"
+
+        # Update total raised in place
+        old_total = read_uint64(state_box.key, UInt64(TOTAL_RAISED_OFFSET))
+        new_total = old_total + amount
+        state_box.replace(TOTAL_RAISED_OFFSET, op.itob(new_total))
+
+        # Update platform totals; a campaign counts as successful once
+        goal_amount = read_uint64(state_box.key, UInt64(GOAL_AMOUNT_OFFSET))
+        self.total_raised.value += amount
+        if old_total < goal_amount and new_total >= goal_amount:
+            self.successful_campaigns.value += 1
+
+        # Record the contribution against the contributor for refunds; the
+        # caller has taken the deposit for a new entry
+        contribution_box = BoxRef(key=contribution_key(campaign_id, contributor))
+        contributed = op.btoi(contribution_box.get(default=op.itob(0)))
+        contribution_box.put(op.itob(contributed + amount))
+        return new_total
+
+    @subroutine
+    def _close_failed(self, campaign_id: UInt64) -> bool:
+        """
+        Stop counting a campaign that ended without reaching its goal as
+        active; the caller has checked that it failed. Returns whether it
+        was still counted.
+        """
+        state_key = op.itob(campaign_id)
+        if not read_flag(state_key, UInt64(IS_ACTIVE_BIT)):
+            return False
+        write_flag(state_key, UInt64(IS_ACTIVE_BIT), False)
+        self.active_campaigns.value -= 1
+        return True
 
     @abimethod()
     def withdraw_funds(self, campaign_id: UInt64) -> String:
         """
         Withdraw funds from a successful campaign (creator only)
-        
+
         Args:
             campaign_id: ID of the campaign
-        
+
         Returns:
             Success message
         """
         # Load campaign
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert campaign_box.exists, "Campaign does not exist"
-        
-        campaign = CampaignInfo.from_bytes(campaign_box.get())
-        
+        state_box = BoxRef(key=op.itob(campaign_id))
+        assert state_box, "Campaign does not exist"
+
         # Verify caller is campaign creator
-        assert Txn.sender == campaign.creator.native, "Only creator can withdraw"
-        
-        # Verify campaign has ended
-        assert Global.latest_timestamp > campaign.deadline.native, "Campaign still active"
-        
-        # Verify goal was met
-        assert campaign.total_raised.native >= campaign.goal_amount.native, "Goal not reached"
-        
+        creator = read_creator(state_box.key)
+        assert Txn.sender == creator, "Only creator can withdraw"
+
+        # Verify campaign has ended and the goal was met
+        assert_goal_reached(campaign_id)
+        total_raised = read_uint64(state_box.key, UInt64(TOTAL_RAISED_OFFSET))
+
         # Verify funds not already withdrawn
-        assert not campaign.funds_withdrawn.native, "Funds already withdrawn"
-        
+        assert not read_flag(state_box.key, UInt64(FUNDS_WITHDRAWN_BIT)), "Funds already withdrawn"
+
         # Transfer funds to creator
-        amount_to_send = campaign.total_raised.native
-        op.inner_txn.begin()
-        op.inner_txn.set_type_enum(op.TransactionType.Payment)
-        op.inner_txn.set_field("receiver", campaign.creator.native)
-        op.inner_txn.set_field("amount", amount_to_send)
-        op.inner_txn.set_field("fee", UInt64(0))  # Caller pays fee
-        op.inner_txn.submit()
-        
+        itxn.Payment(
+            receiver=creator,
+            amount=total_raised,
+            fee=0,  # Caller pays fee
+        ).submit()
+
         # Mark funds as withdrawn
-        campaign.funds_withdrawn = Bool(True)
-        campaign.is_active = Bool(False)
-        campaign_box.put(campaign.bytes)
-        
+        if read_flag(state_box.key, UInt64(IS_ACTIVE_BIT)):
+            self.active_campaigns.value -= 1
+        write_flag(state_box.key, UInt64(FUNDS_WITHDRAWN_BIT), True)
+        write_flag(state_box.key, UInt64(IS_ACTIVE_BIT), False)
+
         return String("Funds withdrawn successfully")
 
     @abimethod()
     def claim_refund(self, campaign_id: UInt64, contributor: Account) -> String:
         """
         Claim refund if campaign goal was not met
-        
+
         Args:
             campaign_id: ID of the campaign
             contributor: Address of the contributor
-        
+
         Returns:
             Success message
-        
-        Note: In production, you'd track individual contributions in separate box storage
-        This is a simplified version for demonstration
+
+        Pays back the contribution and the ledger deposit.
         """
-        # Load campaign
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert campaign_box.exists, "Campaign does not exist"
-        
-        campaign = CampaignInfo.from_bytes(campaign_box.get())
-        
-        # Verify campaign has ended
-        assert Global.latest_timestamp > campaign.deadline.native, "Campaign still active"
-        
-        # Verify goal was NOT met
-        assert campaign.total_raised.native < campaign.goal_amount.native, "Goal was reached, no refunds"
-        
-        # In a full implementation, you would:
-        # 1. Check contributor's contribution amount from separate storage
-        # 2. Verify they haven't already claimed refund
-        # 3. Transfer their contribution back
-        # 4. Mark refund as claimed
-        
-        return String("Refund mechanism - implement contribution tracking")
+        assert_refunds_open(campaign_id)
+        self._close_failed(campaign_id)
+
+        # Verify the contributor has an entry; settling deletes it
+        assert BoxRef(key=contribution_key(campaign_id, contributor)), "No contribution to refund"
+        self.total_raised.value -= settle_contribution(campaign_id, contributor, True)
+
+        return String("Refund claimed successfully")
+
+    @abimethod()
+    def refund_batch(self, campaign_id: UInt64, contributors: DynamicArray[Address]) -> UInt64:
+        """
+        Refund several contributors of a failed campaign in one call
+
+        Args:
+            campaign_id: ID of the campaign
+            contributors: Addresses to refund; ones with nothing left to
+                refund are skipped, so a batch can safely be retried
+
+        Returns:
+            Total microALGOs of contributions refunded; each contributor's
+            ledger deposit is paid back with their contribution
+
+        Inner payments carry no fee: the caller pays one minimum fee per
+        contributor on top of the call's own. Every contributor needs their
+        address and ledger box available to the group.
+        """
+        assert_refunds_open(campaign_id)
+        self._close_failed(campaign_id)
+
+        refunded = UInt64(0)
+        for contributor in contributors:
+            refunded += settle_contribution(campaign_id, contributor.native, True)
+        self.total_raised.value -= refunded
+
+        return refunded
+
+    @abimethod()
+    def release_deposits(self, campaign_id: UInt64, contributors: DynamicArray[Address]) -> UInt64:
+        """
+        Delete the ledger entries of a campaign that reached its goal and
+        pay back their deposits
+
+        Args:
+            campaign_id: ID of the campaign
+            contributors: Addresses whose entries to delete; ones without
+                an entry are skipped, so a batch can safely be retried
+
+        Returns:
+            Number of entries deleted
+
+        Once a campaign has ended at its goal nothing can be refunded, so
+        anyone may settle its entries. Fees work as in refund_batch.
+        """
+        assert_goal_reached(campaign_id)
+
+        released = UInt64(0)
+        for contributor in contributors:
+            account = contributor.native
+            if BoxRef(key=contribution_key(campaign_id, account)):
+                settle_contribution(campaign_id, account, False)
+                released += 1
+
+        return released
 
     @abimethod()
+    def close_failed_campaigns(self, campaign_ids: DynamicArray[ARC4UInt64]) -> UInt64:
+        """
+        Stop counting campaigns that ended without reaching their goal as
+        active, e.g. ones nobody has claimed a refund from yet
+
+        Args:
+            campaign_ids: Campaigns to close; ones that haven't failed or
+                are already closed are skipped, so a batch can safely be
+                retried
+
+        Returns:
+            Number of campaigns closed
+
+        Anyone may call it; the keeper does after each sweep. Every
+        campaign needs its state box available to the group.
+        """
+        closed = UInt64(0)
+        for campaign_id in campaign_ids:
+            if has_failed(campaign_id.native) and self._close_failed(campaign_id.native):
+                closed += 1
+        return closed
+
+    @abimethod(readonly=True)
     def get_campaign_info(self, campaign_id: UInt64) -> CampaignInfo:
         """
         Get campaign information
-        
+
         Args:
             campaign_id: ID of the campaign
-        
+
         Returns:
             Campaign information struct
         """
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert campaign_box.exists, "Campaign does not exist"
-        
-        return CampaignInfo.from_bytes(campaign_box.get())
+        return load_campaign_info(campaign_id)
+
+    @abimethod(readonly=True)
+    def get_total_campaigns(self) -> UInt64:
+        """Get total number of campaigns created (the highest campaign ID)"""
+        return self.total_campaigns.value
+
+    @abimethod(readonly=True)
+    def get_campaigns(self, campaign_ids: DynamicArray[ARC4UInt64]) -> DynamicArray[CampaignInfo]:
+        """
+        Get information for several campaigns in one call
+
+        Args:
+            campaign_ids: IDs of the campaigns, each needing its state and
+                metadata box in the box references (4 campaigns per transaction)
+
+        Returns:
+            Campaign information structs in the order requested
+        """
+        campaigns = DynamicArray[CampaignInfo]()
+        for campaign_id in campaign_ids:
+            campaigns.append(load_campaign_info(campaign_id.native))
+        return campaigns
+
+    @abimethod()
+    def increase_budget(self) -> None:
+        """
+        Do nothing. Each app call adds 700 to the group's pooled opcode
+        budget, so heavy calls are grouped with as many of these as they need.
+        """
+
+    @abimethod(readonly=True)
+    def get_creator_campaigns(
+        self, creator: Address, start: UInt64, limit: UInt64
+    ) -> CreatorCampaigns:
+        """
+        Get one page of the campaigns an account created
+
+        Args:
+            creator: Address of the creator
+            start: Position of the first ID to return
+            limit: Most IDs to return, capped at MAX_CREATOR_PAGE
+
+        Returns:
+            The creator's total number of campaigns and the IDs from `start`,
+            oldest first
+        """
+        key = creator_index_key(Account(creator.bytes))
+        total = op.btoi(BoxRef(key=key).get(default=op.itob(0)))
+
+        count = UInt64(0)
+        if start < total:
+            count = total - start
+            if limit < count:
+                count = limit
+            if count > MAX_CREATOR_PAGE:
+                count = UInt64(MAX_CREATOR_PAGE)
+        # An ARC-4 uint64[] is a uint16 length followed by the packed values,
+        # which is how the index pages store them
+        ids = op.extract(op.itob(count), 6, 2)
+        position = start
+        end = start + count
+        while position < end:
+            offset = position % INDEX_PAGE_IDS
+            taken = INDEX_PAGE_IDS - offset
+            if end - position < taken:
+                taken = end - position
+            page_key = index_page_key(key, position // INDEX_PAGE_IDS)
+            ids += op.Box.extract(page_key, offset * 8, taken * 8)
+            position += taken
+        return CreatorCampaigns(
+            total=ARC4UInt64(total),
+            campaign_ids=DynamicArray[ARC4UInt64].from_bytes(ids),
+        )
+
+    @abimethod(readonly=True)
+    def get_platform_stats(self) -> PlatformStats:
+        """
+        Get platform totals and the leaderboard in one call
+
+        Returns:
+            Campaign counts, total raised and the top campaigns by amount
+            raised (unused leaderboard entries are zero)
+        """
+        leaderboard = BoxRef(key=LEADERBOARD_KEY).get(default=op.bzero(LEADERBOARD_SIZE))
+        return PlatformStats(
+            total_campaigns=ARC4UInt64(self.total_campaigns.value),
+            total_raised=ARC4UInt64(self.total_raised.value),
+            active_campaigns=ARC4UInt64(self.active_campaigns.value),
+            successful_campaigns=ARC4UInt64(self.successful_campaigns.value),
+            leaderboard=StaticArray[LeaderboardEntry, typing.Literal[10]].from_bytes(leaderboard),
+        )
 
     @abimethod()
     def cancel_campaign(self, campaign_id: UInt64) -> String:
         """
         Cancel a campaign (creator only, before any contributions)
-        
+
         Args:
             campaign_id: ID of the campaign
-        
+
         Returns:
             Success message
         """
         # Load campaign
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert campaign_box.exists, "Campaign does not exist"
-        
-        campaign = CampaignInfo.from_bytes(campaign_box.get())
-        
+        state_box = BoxRef(key=op.itob(campaign_id))
+        assert state_box, "Campaign does not exist"
+
         # Verify caller is campaign creator
-        assert Txn.sender == campaign.creator.native, "Only creator can cancel"
-        
+        assert Txn.sender == read_creator(state_box.key), "Only creator can cancel"
+
         # Verify no contributions yet
-        assert campaign.total_raised.native == 0, "Cannot cancel campaign with contributions"
-        
+        assert read_uint64(state_box.key, UInt64(TOTAL_RAISED_OFFSET)) == 0, "Cannot cancel campaign with contributions"
+
+        # Verify not already cancelled, so it's only counted once
+        assert read_flag(state_box.key, UInt64(IS_ACTIVE_BIT)), "Campaign is not active"
+
         # Mark as inactive
-        campaign.is_active = Bool(False)
-        campaign_box.put(campaign.bytes)
-        
+        write_flag(state_box.key, UInt64(IS_ACTIVE_BIT), False)
+        self.active_campaigns.value -= 1
+
         return String("Campaign cancelled successfully")
 
     @abimethod()
@@ -266,32 +856,37 @@ class CampusFunding(ARC4Contract):
     ) -> String:
         """
         Update campaign details (creator only)
-        
+
         Args:
             campaign_id: ID of the campaign
             new_description: Updated description
             new_image_url: Updated image URL
-        
+
         Returns:
             Success message
         """
         # Load campaign
-        campaign_box = BoxRef(key=op.itob(campaign_id))
-        assert campaign_box.exists, "Campaign does not exist"
-        
-        campaign = CampaignInfo.from_bytes(campaign_box.get())
-        
+        state_box = BoxRef(key=op.itob(campaign_id))
+        assert state_box, "Campaign does not exist"
+
         # Verify caller is campaign creator
-        assert Txn.sender == campaign.creator.native, "Only creator can update"
-        
+        assert Txn.sender == read_creator(state_box.key), "Only creator can update"
+
         # Verify campaign is still active
-        assert campaign.is_active.native, "Campaign is not active"
-        
+        assert read_flag(state_box.key, UInt64(IS_ACTIVE_BIT)), "Campaign is not active"
+
         # Update fields
-        campaign.description = ARC4String(new_description)
-        campaign.image_url = ARC4String(new_image_url)
-        
-        # Save updated campaign
-        campaign_box.put(campaign.bytes)
-        
+        # Every campaign with a state box has a metadata box
+        metadata_box = BoxRef(key=metadata_key(campaign_id))
+        metadata = CampaignMetadata.from_bytes(metadata_box.get(default=Bytes()))
+        metadata.description = ARC4String(new_description)
+        metadata.image_url = ARC4String(new_image_url)
+
+        # Resize the box to the new encoding before saving
+        metadata_bytes = metadata.bytes
+        assert metadata_bytes.length <= MAX_CAMPAIGN_BOX_SIZE, "Campaign data too large"
+        if metadata_bytes.length != metadata_box.length:
+            metadata_box.resize(metadata_bytes.length)
+        metadata_box.put(metadata_bytes)
+
         return String("Campaign updated successfully")
@@ -1,19 +1,121 @@
+import dataclasses
 import logging
+from pathlib import Path
 
 import algokit_utils
 
+from smart_contracts._helpers.deployment_manifest import (
+    Deployment,
+    force_deploy,
+    load_deployment,
+    network_key,
+    program_hash,
+    record_deployment,
+)
+
 logger = logging.getLogger(__name__)
 
+CONTRACT_NAME = "campus_funding"
+APP_SPEC_PATH = (
+    Path(__file__).parent.parent / "artifacts" / CONTRACT_NAME / "CampusFunding.arc56.json"
+)
+
+# Box MBR of one more campaign at the largest metadata size: the app account
+# pays for new boxes, so it must always be able to afford the next campaign.
+# State box: 2500 + 400 * (8 + 57); metadata box: 2500 + 400 * (9 + 1024);
+# new deadline index count and page: 2500 + 400 * (9 + 8), 2500 + 400 * (17 + 8);
+# new creator index count and page: 2500 + 400 * (33 + 8), 2500 + 400 * (41 + 8)
+NEXT_CAMPAIGN_MBR = 28_500 + 415_700 + 9_300 + 12_500 + 18_900 + 22_100
+# Added on top of what is needed whenever the app account is topped up
+FUNDING_TOP_UP = algokit_utils.AlgoAmount(algo=5)
+# Minimum balance of an account that holds nothing, e.g. a just-created app's
+ACCOUNT_MIN_BALANCE = 100_000
+
+
+def top_up_amount(balance: int, min_balance: int) -> int:
+    """
+    MicroALGOs to send to the app account, or 0 if it can already cover the
+    boxes it holds (its minimum balance) plus the next campaign's boxes.
+    """
+    required = min_balance + NEXT_CAMPAIGN_MBR
+    if balance >= required:
+        return 0
+    return required - balance + FUNDING_TOP_UP.micro_algo
+
+
+def fund_app_account(
+    algorand: algokit_utils.AlgorandClient,
+    sender: str,
+    app_address: str,
+    *,
+    created: bool,
+) -> int:
+    """
+    Top up an app account if it can't cover its boxes plus the next campaign,
+    returning its balance afterwards.
+
+    A just-created app account is known to be empty, so it is funded without
+    looking it up first. The payment is submitted without waiting for it to
+    be confirmed, so the deploy finishes after the create's single
+    confirmation. algod checks the payment against the ledger on submission,
+    so once accepted it only needs the next block, and the balance returned
+    is the one the app will have then. Should the payment still drop out of
+    the pool, the next deploy reads the real balance and tops it up again.
+    """
+    if created:
+        balance, min_balance = 0, ACCOUNT_MIN_BALANCE
+    else:
+        account = algorand.account.get_information(app_address)
+        balance, min_balance = account.amount.micro_algo, account.min_balance.micro_algo
+
+    top_up = top_up_amount(balance, min_balance)
+    if not top_up:
+        return balance
+
+    payment = algorand.create_transaction.payment(
+        algokit_utils.PaymentParams(
+            amount=algokit_utils.AlgoAmount(micro_algo=top_up),
+            sender=sender,
+            receiver=app_address,
+        )
+    )
+    signed = algorand.account.get_signer(sender).sign_transactions([payment], [0])
+    tx_id = algorand.client.algod.send_transaction(signed[0])
+    logger.info(f"Topping up app account with {top_up} microALGOs in {tx_id}")
+    return balance + top_up
+
 
 # define deployment behaviour based on supplied app spec
 def deploy() -> None:
-    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
-        CampusFundingFactory,
-    )
+    network = network_key()
+    programs = program_hash(APP_SPEC_PATH)
+    previous = load_deployment(CONTRACT_NAME, network)
 
     algorand = algokit_utils.AlgorandClient.from_environment()
     deployer_ = algorand.account.from_environment("DEPLOYER")
 
+    if previous and previous.program_hash == programs and not force_deploy():
+        logger.info(
+            f"{CONTRACT_NAME} unchanged since App ID {previous.app_id} was deployed "
+            f"on {network}, skipping (set FORCE_DEPLOY=1 to deploy anyway)"
+        )
+        # Campaigns created since the last deploy spend the app account's
+        # balance on boxes, so it is still checked and topped up
+        balance = fund_app_account(
+            algorand, deployer_.address, previous.app_address, created=False
+        )
+        if balance != previous.funded_balance:
+            record_deployment(
+                CONTRACT_NAME,
+                network,
+                dataclasses.replace(previous, funded_balance=balance),
+            )
+        return
+
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingFactory,
+    )
+
     factory = algorand.client.get_typed_app_factory(
         CampusFundingFactory, default_sender=deployer_.address
     )
@@ -23,18 +125,27 @@ def deploy() -> None:
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
     )
 
-    if result.operation_performed in [
-        algokit_utils.OperationPerformed.Create,
-        algokit_utils.OperationPerformed.Replace,
-    ]:
-        # Fund the contract with initial ALGO for box storage and inner transactions
-        algorand.send.payment(
-            algokit_utils.PaymentParams(
-                amount=algokit_utils.AlgoAmount(algo=5),  # Increased for box storage
-                sender=deployer_.address,
-                receiver=app_client.app_address,
-            )
-        )
+    balance = fund_app_account(
+        algorand,
+        deployer_.address,
+        app_client.app_address,
+        created=result.operation_performed
+        in (
+            algokit_utils.OperationPerformed.Create,
+            algokit_utils.OperationPerformed.Replace,
+        ),
+    )
+
+    record_deployment(
+        CONTRACT_NAME,
+        network,
+        Deployment(
+            app_id=app_client.app_id,
+            app_address=app_client.app_address,
+            program_hash=programs,
+            funded_balance=balance,
+        ),
+    )
 
     logger.info(
         f"Deployed Campus Crowdfunding Platform ({app_client.app_name}) "
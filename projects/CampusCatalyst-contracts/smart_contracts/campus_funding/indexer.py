@@ -0,0 +1,302 @@
+"""
+In-memory campaign table kept current by following blocks
+
+CampaignIndexer loads every campaign's state and metadata box once, decodes
+them into a table of slotted records and then follows new blocks. Any app
+call that references one of the app's boxes marks that campaign dirty. Only
+its boxes are fetched again: a transaction can touch only the boxes its
+group references, so no change is missed.
+
+List, filter and sort queries are answered from memory:
+
+    indexer = CampaignIndexer(algod_client, app_id)
+    indexer.load()
+    threading.Thread(target=indexer.follow, args=(stop,), daemon=True).start()
+    indexer.campaigns(active=True, sort_by="percent_funded", descending=True)
+
+Updates replace whole records, so queries can run while follow() works in
+another thread.
+"""
+
+import base64
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from smart_contracts.campus_funding.codec import (
+    FUNDS_WITHDRAWN_MASK,
+    IS_ACTIVE_MASK,
+    METADATA_DESCRIPTION,
+    METADATA_IMAGE_URL,
+    METADATA_TITLE,
+    STATE_DEADLINE,
+    STATE_FLAGS,
+    STATE_GOAL_AMOUNT,
+    STATE_SIZE,
+    STATE_TOTAL_RAISED,
+    read_string,
+    read_uint64,
+)
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+# Box names, see contract.py
+CAMPAIGN_KEY_SIZE = 8
+CONTRIBUTION_KEY_SIZE = 40
+METADATA_KEY_PREFIX = b"m"
+
+SORT_KEYS = ("campaign_id", "deadline", "percent_funded", "total_raised", "goal_amount")
+MAX_FETCH_WORKERS = 16
+
+
+class CampaignRecord:
+    """
+    One campaign, decoded from its state and metadata boxes. The text
+    fields are decoded from the metadata box bytes when read.
+    """
+
+    __slots__ = (
+        "campaign_id",
+        "creator",
+        "goal_amount",
+        "deadline",
+        "total_raised",
+        "is_active",
+        "funds_withdrawn",
+        "metadata",
+    )
+
+    def __init__(
+        self,
+        campaign_id: int,
+        creator: bytes,
+        goal_amount: int,
+        deadline: int,
+        total_raised: int,
+        is_active: bool,
+        funds_withdrawn: bool,
+        metadata: memoryview | None = None,
+    ):
+        self.campaign_id = campaign_id
+        self.creator = creator
+        self.goal_amount = goal_amount
+        self.deadline = deadline
+        self.total_raised = total_raised
+        self.is_active = is_active
+        self.funds_withdrawn = funds_withdrawn
+        self.metadata = metadata
+
+    def _text(self, head_offset: int) -> str:
+        return "" if self.metadata is None else read_string(self.metadata, head_offset)
+
+    @property
+    def title(self) -> str:
+        return self._text(METADATA_TITLE)
+
+    @property
+    def description(self) -> str:
+        return self._text(METADATA_DESCRIPTION)
+
+    @property
+    def image_url(self) -> str:
+        return self._text(METADATA_IMAGE_URL)
+
+    @property
+    def percent_funded(self) -> float:
+        return 100 * self.total_raised / self.goal_amount if self.goal_amount else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CampaignRecord({self.campaign_id}, {self.title!r}, "
+            f"{self.total_raised}/{self.goal_amount}, active={self.is_active})"
+        )
+
+
+def decode_state(campaign_id: int, value: bytes) -> CampaignRecord:
+    """Decode a CampaignState box value."""
+    if len(value) != STATE_SIZE:
+        raise ValueError(f"Campaign {campaign_id} state box is {len(value)} bytes")
+    view = memoryview(value)
+    flags = view[STATE_FLAGS]
+    return CampaignRecord(
+        campaign_id=campaign_id,
+        creator=bytes(view[:32]),
+        goal_amount=read_uint64(view, STATE_GOAL_AMOUNT),
+        deadline=read_uint64(view, STATE_DEADLINE),
+        total_raised=read_uint64(view, STATE_TOTAL_RAISED),
+        is_active=bool(flags & IS_ACTIVE_MASK),
+        funds_withdrawn=bool(flags & FUNDS_WITHDRAWN_MASK),
+    )
+
+
+def campaign_id_from_box(name: bytes) -> tuple[int, bool] | None:
+    """
+    The campaign a box belongs to, and whether it is the metadata box.
+    Contribution boxes start with the campaign key, so they map to it too.
+    """
+    if len(name) == CAMPAIGN_KEY_SIZE + 1 and name.startswith(METADATA_KEY_PREFIX):
+        return int.from_bytes(name[1:], "big"), True
+    if len(name) in (CAMPAIGN_KEY_SIZE, CONTRIBUTION_KEY_SIZE):
+        return int.from_bytes(name[:CAMPAIGN_KEY_SIZE], "big"), False
+    return None
+
+
+def read_box(algod_client: "AlgodClient", app_id: int, name: bytes) -> bytes | None:
+    """A box's value, or None if the app has no such box."""
+    try:
+        box = algod_client.application_box_by_name(app_id, name)
+    except Exception as error:
+        # algosdk's AlgodHTTPError carries the status code
+        if getattr(error, "code", None) == 404:
+            return None
+        raise
+    return base64.b64decode(box["value"])  # type: ignore[index]
+
+
+def _as_bytes(value: str | bytes) -> bytes:
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+def referenced_campaigns(block: dict[str, Any], app_id: int) -> dict[int, bool]:
+    """
+    Campaigns whose boxes app calls in a block reference, each mapped to
+    whether its metadata box was among them.
+    """
+    touched: dict[int, bool] = {}
+    for signed in block.get("txns") or []:
+        txn = signed.get("txn", {})
+        if txn.get("type") != "appl" or "apbx" not in txn:
+            continue
+        called = txn.get("apid", 0)
+        foreign = txn.get("apfa") or []
+        for box in txn["apbx"]:
+            index = box.get("i", 0)
+            target = called if index == 0 else foreign[index - 1]
+            if target != app_id:
+                continue
+            found = campaign_id_from_box(_as_bytes(box.get("n", b"")))
+            if found is not None:
+                campaign_id, metadata = found
+                touched[campaign_id] = touched.get(campaign_id, False) or metadata
+    return touched
+
+
+class CampaignIndexer:
+    """Campaign table for one CampusFunding app, answered from memory."""
+
+    def __init__(self, algod_client: "AlgodClient", app_id: int):
+        self.algod = algod_client
+        self.app_id = app_id
+        self.table: dict[int, CampaignRecord] = {}
+        # Last round whose changes are reflected in the table
+        self.round = 0
+
+    def _box(self, name: bytes) -> bytes | None:
+        return read_box(self.algod, self.app_id, name)
+
+    def _fetch(self, campaign_id: int, metadata: bool) -> CampaignRecord | None:
+        key = campaign_id.to_bytes(CAMPAIGN_KEY_SIZE, "big")
+        state = self._box(key)
+        if state is None:
+            return None
+        record = decode_state(campaign_id, state)
+        previous = self.table.get(campaign_id)
+        if metadata or previous is None:
+            text = self._box(METADATA_KEY_PREFIX + key)
+            record.metadata = None if text is None else memoryview(text)
+        else:
+            record.metadata = previous.metadata
+        return record
+
+    def _refresh(self, touched: dict[int, bool]) -> None:
+        if not touched:
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(touched))) as pool:
+            records = pool.map(lambda item: self._fetch(*item), touched.items())
+            for campaign_id, record in zip(touched, records):
+                if record is None:
+                    self.table.pop(campaign_id, None)
+                else:
+                    self.table[campaign_id] = record
+
+    def load(self) -> None:
+        """Read every campaign box of the app into the table."""
+        self.round = self.algod.status()["last-round"]  # type: ignore[index]
+        response = self.algod.application_boxes(self.app_id)
+        campaign_ids = set()
+        for box in response["boxes"]:  # type: ignore[index]
+            found = campaign_id_from_box(_as_bytes(box["name"]))
+            if found is not None:
+                campaign_ids.add(found[0])
+        self.table = {}
+        self._refresh({campaign_id: True for campaign_id in campaign_ids})
+        logger.info(f"Loaded {len(self.table)} campaigns as of round {self.round}")
+
+    def apply_block(self, round_: int) -> None:
+        """Bring the table up to date with one block."""
+        block = self.algod.block_info(round_)["block"]  # type: ignore[index]
+        self._refresh(referenced_campaigns(block, self.app_id))
+        self.round = round_
+
+    def follow(self, stop: threading.Event | None = None) -> None:
+        """Apply new blocks as they are produced until `stop` is set."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            status = self.algod.status_after_block(self.round)
+            for round_ in range(self.round + 1, status["last-round"] + 1):  # type: ignore[index]
+                self.apply_block(round_)
+
+    def campaigns(
+        self,
+        *,
+        active: bool | None = None,
+        ending_within: int | None = None,
+        min_percent_funded: float | None = None,
+        creator: bytes | None = None,
+        sort_by: str = "campaign_id",
+        descending: bool = False,
+        limit: int | None = None,
+        now: int | None = None,
+    ) -> list[CampaignRecord]:
+        """
+        Query the table.
+
+        Args:
+            active: Only campaigns still (or no longer) accepting contributions
+            ending_within: Only open campaigns whose deadline is this many seconds away or less
+            min_percent_funded: Only campaigns at least this percent funded
+            creator: Only campaigns by this 32-byte public key
+            sort_by: One of SORT_KEYS
+            descending: Sort largest first
+            limit: Return at most this many
+            now: Unix time to compare deadlines with, defaults to the clock
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort_by!r}, expected one of {SORT_KEYS}")
+        now = int(time.time()) if now is None else now
+
+        def is_open(record: CampaignRecord) -> bool:
+            return record.is_active and record.deadline > now
+
+        records: Iterable[CampaignRecord] = list(self.table.values())
+        if active is not None:
+            records = (record for record in records if is_open(record) == active)
+        if ending_within is not None:
+            records = (
+                record
+                for record in records
+                if is_open(record) and record.deadline - now <= ending_within
+            )
+        if min_percent_funded is not None:
+            records = (r for r in records if r.percent_funded >= min_percent_funded)
+        if creator is not None:
+            records = (record for record in records if record.creator == creator)
+
+        result = sorted(records, key=lambda r: getattr(r, sort_by), reverse=descending)
+        return result if limit is None else result[:limit]
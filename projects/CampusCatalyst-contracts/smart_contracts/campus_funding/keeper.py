@@ -0,0 +1,279 @@
+"""
+Sweeping campaigns that have reached their deadline
+
+create_campaign appends every campaign ID to a deadline index,
+"d" + itob(deadline // 86400), so the campaigns ending on a given day can
+be read without scanning the rest. The index is paged: its key holds how
+many IDs it has, and key + itob(page) holds up to 128 of them, so no box
+outgrows the 1 KB a box reference can read. A day's bucket is closed once
+the day is over: every campaign in it has passed its deadline.
+
+A sweep reads only the buckets closed since the previous sweep, page by
+page, then the state box of each campaign in them, and sorts them into:
+- "withdraw": the goal was met and the creator hasn't withdrawn yet
+- "refund": the goal was missed and contributors can claim refunds
+- "close": nothing is left to refund, because nothing was raised or every
+  contributor has been refunded, but the campaign still counts as active
+
+Whether a failed campaign has contributors left to refund is read from its
+ledger boxes, with one listing of the app's box names per sweep that finds
+a failed campaign. Failed campaigns stop counting towards active_campaigns
+when the first refund is claimed; close_all closes the rest, refund or
+close, with close_failed_campaigns. Campaigns already withdrawn, or
+cancelled before any contribution, need nothing. Progress is kept in a
+small state file, so the cost of a sweep grows with the number of
+campaigns that ended, not with the total.
+"""
+
+import base64
+import dataclasses
+import json
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from smart_contracts.campus_funding.indexer import (
+    CONTRIBUTION_KEY_SIZE,
+    CampaignRecord,
+    decode_state,
+    read_box,
+)
+from smart_contracts.campus_funding.reads import chunk_campaign_ids
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingClient,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Matches DEADLINE_BUCKET_PREFIX, DEADLINE_BUCKET_SECONDS and INDEX_PAGE_IDS
+# in the contract
+BUCKET_PREFIX = b"d"
+BUCKET_SECONDS = 86_400
+BUCKET_KEY_SIZE = 9
+INDEX_PAGE_IDS = 128
+MAX_GROUP_SIZE = 16
+# close_failed_campaigns needs each campaign's state box, and a transaction
+# carries 8 references
+CLOSE_IDS_PER_CALL = 8
+# withdraw_funds pays its inner payment's fee through the outer call
+WITHDRAW_FEE = 2_000
+MAX_FETCH_WORKERS = 16
+
+
+def deadline_day(deadline: int) -> int:
+    return deadline // BUCKET_SECONDS
+
+
+def bucket_key(day: int) -> bytes:
+    return BUCKET_PREFIX + day.to_bytes(8, "big")
+
+
+def page_key(index_key: bytes, page: int) -> bytes:
+    """Box key of one page of a paged index"""
+    return index_key + page.to_bytes(8, "big")
+
+
+def parse_count(value: bytes | None) -> int:
+    """IDs in a paged index, from its count box (None if it has none yet)"""
+    return 0 if value is None else int.from_bytes(value, "big")
+
+
+def page_count(count: int) -> int:
+    """Pages a paged index of `count` IDs spans"""
+    return -(-count // INDEX_PAGE_IDS)
+
+
+def parse_page(value: bytes) -> list[int]:
+    """Campaign IDs stored in one page of a paged index"""
+    return [int.from_bytes(value[start : start + 8], "big") for start in range(0, len(value), 8)]
+
+
+def closed_days(last_swept_day: int, now: int) -> range:
+    """Days after `last_swept_day` that ended by `now`"""
+    return range(last_swept_day + 1, deadline_day(now))
+
+
+def bucket_days(box_names: Sequence[str | bytes]) -> list[int]:
+    """
+    Days that have a deadline index, from the app's box names (base64
+    strings as algod lists them, or bytes). Only count boxes match, so
+    each day is listed once however many pages it has.
+    """
+    days = []
+    for name in box_names:
+        if isinstance(name, str):
+            name = base64.b64decode(name)
+        if len(name) == BUCKET_KEY_SIZE and name.startswith(BUCKET_PREFIX):
+            days.append(int.from_bytes(name[1:], "big"))
+    return sorted(days)
+
+
+def ledger_campaigns(box_names: Sequence[str | bytes]) -> set[int]:
+    """
+    Campaigns with a contributor ledger box left, from the app's box names
+    (base64 strings as algod lists them, or bytes)
+    """
+    campaign_ids = set()
+    for name in box_names:
+        if isinstance(name, str):
+            name = base64.b64decode(name)
+        if len(name) == CONTRIBUTION_KEY_SIZE:
+            campaign_ids.add(int.from_bytes(name[:8], "big"))
+    return campaign_ids
+
+
+def classify(record: CampaignRecord, has_ledger: bool = True) -> str | None:
+    """
+    What an ended campaign still needs: "withdraw", "refund", "close" or
+    nothing. `has_ledger` says whether any contributor still has a ledger
+    box; a failed campaign without one has nothing left to refund.
+    """
+    if record.funds_withdrawn:
+        return None
+    if record.total_raised and record.total_raised >= record.goal_amount:
+        return "withdraw"
+    if record.total_raised and has_ledger:
+        return "refund"
+    return "close" if record.is_active else None
+
+
+@dataclasses.dataclass(frozen=True)
+class ExpiredCampaign:
+    campaign_id: int
+    action: str
+    creator: str
+    total_raised: int
+    goal_amount: int
+    deadline: int
+    is_active: bool
+
+
+@dataclasses.dataclass
+class KeeperState:
+    app_id: int
+    # The last day whose bucket has been swept
+    last_swept_day: int
+
+    @classmethod
+    def load(cls, path: Path) -> "KeeperState | None":
+        if not path.exists():
+            return None
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(dataclasses.asdict(self), indent=2) + "\n")
+
+
+def sweep(
+    algod_client: "AlgodClient", app_id: int, days: Sequence[int]
+) -> list[ExpiredCampaign]:
+    """Campaigns in the given days' buckets that still need a withdrawal, refunds or closing."""
+    from algosdk.encoding import encode_address
+
+    def read(name: bytes) -> bytes | None:
+        return read_box(algod_client, app_id, name)
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        counts = pool.map(lambda day: parse_count(read(bucket_key(day))), days)
+        pages = [
+            page_key(bucket_key(day), page)
+            for day, count in zip(days, counts)
+            for page in range(page_count(count))
+        ]
+        campaign_ids = [
+            campaign_id
+            for value in pool.map(read, pages)
+            if value
+            for campaign_id in parse_page(value)
+        ]
+        states = pool.map(lambda campaign_id: read(campaign_id.to_bytes(8, "big")), campaign_ids)
+        records = [
+            decode_state(campaign_id, state)
+            for campaign_id, state in zip(campaign_ids, states)
+            if state is not None
+        ]
+
+    # Only failed campaigns need their ledger boxes looked up
+    failed = any(0 < record.total_raised < record.goal_amount for record in records)
+    with_ledger = (
+        ledger_campaigns(
+            [box["name"] for box in algod_client.application_boxes(app_id)["boxes"]]  # type: ignore[index]
+        )
+        if failed
+        else set()
+    )
+
+    expired = []
+    for record in records:
+        action = classify(record, record.campaign_id in with_ledger)
+        if action is not None:
+            expired.append(
+                ExpiredCampaign(
+                    campaign_id=record.campaign_id,
+                    action=action,
+                    creator=encode_address(record.creator),
+                    total_raised=record.total_raised,
+                    goal_amount=record.goal_amount,
+                    deadline=record.deadline,
+                    is_active=record.is_active,
+                )
+            )
+    logger.info(
+        f"Swept {len(days)} day buckets ({len(pages)} pages): "
+        f"{len(campaign_ids)} ended campaigns, {len(expired)} need action"
+    )
+    return expired
+
+
+def withdraw_all(
+    app_client: "CampusFundingClient",
+    campaign_ids: Sequence[int],
+    *,
+    group_size: int = MAX_GROUP_SIZE,
+) -> int:
+    """
+    Withdraw the given campaigns for their creator, app_client's default
+    sender, with up to `group_size` withdraw_funds calls per atomic group.
+    Returns the number of groups sent.
+    """
+    from algokit_utils import AlgoAmount, CommonAppCallParams
+
+    params = CommonAppCallParams(static_fee=AlgoAmount(micro_algo=WITHDRAW_FEE))
+    groups = chunk_campaign_ids(campaign_ids, group_size)
+    for group in groups:
+        composer = app_client.new_group()
+        for campaign_id in group:
+            composer = composer.withdraw_funds({"campaign_id": campaign_id}, params=params)
+        composer.send()
+        logger.info(f"Withdrew campaigns {group}")
+    return len(groups)
+
+
+def close_all(
+    app_client: "CampusFundingClient",
+    campaign_ids: Sequence[int],
+    *,
+    group_size: int = MAX_GROUP_SIZE,
+) -> int:
+    """
+    Stop counting the given failed campaigns as active, with up to
+    `group_size` close_failed_campaigns calls of 8 campaigns per atomic
+    group. Any account can send them. Returns the number closed.
+    """
+    calls = chunk_campaign_ids(campaign_ids, CLOSE_IDS_PER_CALL)
+    closed = 0
+    for start in range(0, len(calls), group_size):
+        group = calls[start : start + group_size]
+        composer = app_client.new_group()
+        for call in group:
+            composer = composer.close_failed_campaigns({"campaign_ids": call})
+        returns = composer.send().returns
+        closed += sum(returns)
+        logger.info(f"Closed {sum(returns)} of campaigns {sum(group, [])}")
+    return closed
@@ -0,0 +1,259 @@
+"""
+Campaign reads for dashboards and scripts
+
+All reads go through simulate, so they cost no fees and never wait for a
+block. Batched reads use the readonly get_campaigns method, packing as
+many IDs into each call as the box reference limit allows and running the
+calls concurrently. A simulate request can also hold a whole group of
+calls, which get_creator_campaigns uses to read a portfolio in two
+requests.
+
+Batched reads skip the generated client's CampaignInfo dataclasses: the
+raw return of each call is taken from the simulate response and split
+into CampaignInfoViews, which decode fields only when they are read.
+"""
+
+import base64
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampaignInfo,
+        CampusFundingClient,
+        CampusFundingComposer,
+        PlatformStats,
+    )
+
+from smart_contracts.campus_funding.codec import CampaignInfoView, decode_campaign_infos
+
+logger = logging.getLogger(__name__)
+
+# A transaction can reference at most 8 boxes, and every campaign needs
+# its state box and its metadata box
+MAX_BOX_REFERENCES = 8
+BOXES_PER_CAMPAIGN = 2
+MAX_CAMPAIGNS_PER_CALL = MAX_BOX_REFERENCES // BOXES_PER_CAMPAIGN
+# Calls in one atomic group, and so in one simulate request
+MAX_GROUP_SIZE = 16
+# Matches MAX_CREATOR_PAGE in the contract
+MAX_CREATOR_PAGE = 100
+# ARC-4 prefix of the log an ABI method's return value is in
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+# AVM error for a byte value longer than 4096 bytes, such as an encoded
+# CampaignInfo[] of several campaigns with long descriptions
+VALUE_TOO_LARGE_ERROR = "too big"
+
+
+def chunk_campaign_ids(
+    campaign_ids: Sequence[int], size: int = MAX_CAMPAIGNS_PER_CALL
+) -> list[list[int]]:
+    """Split campaign IDs into the fewest groups of at most `size` IDs."""
+    if size < 1:
+        raise ValueError("Group size must be at least 1")
+    return [
+        list(campaign_ids[start : start + size])
+        for start in range(0, len(campaign_ids), size)
+    ]
+
+
+def simulate_read(
+    app_client: "CampusFundingClient",
+    build: Callable[["CampusFundingComposer"], "CampusFundingComposer"],
+) -> Any:
+    """
+    Run a single read-only call through simulate and return its value.
+
+    Signatures are skipped and box references are resolved by simulate, so
+    no signer or resource packing is needed and nothing is submitted.
+    """
+    return simulate_group(app_client, [build])[0]
+
+
+def _simulate(
+    app_client: "CampusFundingClient",
+    builds: Sequence[Callable[["CampusFundingComposer"], "CampusFundingComposer"]],
+    **simulate_params: Any,
+) -> Any:
+    composer = app_client.new_group()
+    for build in builds:
+        composer = build(composer)
+    return composer.simulate(
+        skip_signatures=True,
+        allow_unnamed_resources=True,
+        **simulate_params,
+    )
+
+
+def simulate_group(
+    app_client: "CampusFundingClient",
+    builds: Sequence[Callable[["CampusFundingComposer"], "CampusFundingComposer"]],
+) -> list[Any]:
+    """Run up to 16 read-only calls as one simulated group and return their values."""
+    return list(_simulate(app_client, builds).returns)
+
+
+def simulate_raw_group(
+    app_client: "CampusFundingClient",
+    builds: Sequence[Callable[["CampusFundingComposer"], "CampusFundingComposer"]],
+) -> list[memoryview]:
+    """
+    Run up to 16 read-only calls as one simulated group and return each
+    call's ARC-4 encoded return value, undecoded. Nothing is submitted, so
+    the 1 KB log limit is lifted for returns longer than it.
+    """
+    result = _simulate(app_client, builds, allow_more_logs=True)
+    txn_results = result.simulate_response["txn-groups"][0]["txn-results"]
+    returns = []
+    for txn_result in txn_results:
+        log = base64.b64decode(txn_result["txn-result"]["logs"][-1])
+        returns.append(memoryview(log)[len(ABI_RETURN_PREFIX) :])
+    return returns
+
+
+def _get_campaigns_call(
+    campaign_ids: list[int],
+) -> Callable[["CampusFundingComposer"], "CampusFundingComposer"]:
+    return lambda composer: composer.get_campaigns({"campaign_ids": campaign_ids})
+
+
+def get_campaign(app_client: "CampusFundingClient", campaign_id: int) -> "CampaignInfo":
+    """Fetch one campaign's information through simulate."""
+    return simulate_read(
+        app_client,
+        lambda composer: composer.get_campaign_info({"campaign_id": campaign_id}),
+    )
+
+
+def get_total_campaigns(app_client: "CampusFundingClient") -> int:
+    """Fetch the number of campaigns, which is also the highest campaign ID."""
+    return simulate_read(app_client, lambda composer: composer.get_total_campaigns())
+
+
+def get_platform_stats(app_client: "CampusFundingClient") -> "PlatformStats":
+    """Fetch platform totals and the leaderboard through simulate."""
+    return simulate_read(app_client, lambda composer: composer.get_platform_stats())
+
+
+def _value_too_large(error: Exception) -> bool:
+    return VALUE_TOO_LARGE_ERROR in str(error)
+
+
+def _fetch_group(
+    app_client: "CampusFundingClient", campaign_ids: list[int]
+) -> list[CampaignInfoView]:
+    """Fetch one group, halving it if the encoded return is too large."""
+    try:
+        (encoded,) = simulate_raw_group(app_client, [_get_campaigns_call(campaign_ids)])
+    except Exception as error:
+        # Long descriptions can push several structs past the 4 KB value limit
+        if not _value_too_large(error) or len(campaign_ids) == 1:
+            raise
+        middle = len(campaign_ids) // 2
+        logger.debug(f"Splitting campaign read {campaign_ids} after failure")
+        return _fetch_group(app_client, campaign_ids[:middle]) + _fetch_group(
+            app_client, campaign_ids[middle:]
+        )
+    return decode_campaign_infos(encoded)
+
+
+def get_campaigns(
+    app_client: "CampusFundingClient",
+    campaign_ids: Sequence[int],
+    *,
+    group_size: int = MAX_CAMPAIGNS_PER_CALL,
+    max_workers: int = 8,
+) -> list[CampaignInfoView]:
+    """
+    Fetch campaign information for any number of campaigns.
+
+    Args:
+        app_client: Typed client for the deployed CampusFunding app
+        campaign_ids: IDs to fetch, in the order results should be returned
+        group_size: Campaigns per get_campaigns call
+        max_workers: Calls allowed in flight at once
+
+    Returns:
+        One CampaignInfoView per requested ID, in request order
+    """
+    groups = chunk_campaign_ids(campaign_ids, group_size)
+    if not groups:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+        results = pool.map(lambda group: _fetch_group(app_client, group), groups)
+        return [campaign for group in results for campaign in group]
+
+
+def list_campaigns(app_client: "CampusFundingClient", **kwargs: int) -> list[CampaignInfoView]:
+    """
+    Fetch every campaign of the app.
+
+    Campaign IDs are assigned sequentially, so this reads the counter once
+    and then the range 1..N with get_campaigns. Keyword arguments are
+    passed on to get_campaigns.
+    """
+    total = get_total_campaigns(app_client)
+    return get_campaigns(app_client, range(1, total + 1), **kwargs)
+
+
+def _fetch_packed(
+    app_client: "CampusFundingClient", campaign_ids: list[int]
+) -> list[CampaignInfoView]:
+    """
+    Fetch up to 64 campaigns in one simulate request: a group of 16
+    get_campaigns calls of 4 IDs each. Falls back to separate requests if
+    one call's return is too large.
+    """
+    chunks = chunk_campaign_ids(campaign_ids)
+    try:
+        results = simulate_raw_group(app_client, [_get_campaigns_call(chunk) for chunk in chunks])
+    except Exception as error:
+        if not _value_too_large(error):
+            raise
+        logger.debug(f"Reading campaigns {campaign_ids} call by call after failure")
+        return [campaign for chunk in chunks for campaign in _fetch_group(app_client, chunk)]
+    return [campaign for encoded in results for campaign in decode_campaign_infos(encoded)]
+
+
+def get_creator_campaign_ids(app_client: "CampusFundingClient", creator: str) -> list[int]:
+    """
+    Fetch the IDs of every campaign `creator` created, oldest first. The
+    first page tells how many there are, and any further pages are read
+    16 at a time in one simulate request each.
+    """
+
+    def page(start: int) -> Callable[["CampusFundingComposer"], "CampusFundingComposer"]:
+        return lambda composer: composer.get_creator_campaigns(
+            {"creator": creator, "start": start, "limit": MAX_CREATOR_PAGE}
+        )
+
+    first = simulate_read(app_client, page(0))
+    campaign_ids = list(first.campaign_ids)
+    starts = list(range(MAX_CREATOR_PAGE, first.total, MAX_CREATOR_PAGE))
+    for group in chunk_campaign_ids(starts, MAX_GROUP_SIZE):
+        for result in simulate_group(app_client, [page(start) for start in group]):
+            campaign_ids.extend(result.campaign_ids)
+    return campaign_ids
+
+
+def get_creator_campaigns(
+    app_client: "CampusFundingClient", creator: str, *, max_workers: int = 8
+) -> list[CampaignInfoView]:
+    """
+    Fetch every campaign `creator` created, oldest first.
+
+    One simulate request reads the creator's index and a second reads the
+    campaigns, 64 per request; larger portfolios read their campaigns with
+    concurrent requests.
+    """
+    campaign_ids = get_creator_campaign_ids(app_client, creator)
+    batches = chunk_campaign_ids(campaign_ids, MAX_GROUP_SIZE * MAX_CAMPAIGNS_PER_CALL)
+    if not batches:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+        results = pool.map(lambda batch: _fetch_packed(app_client, batch), batches)
+        return [campaign for batch in results for campaign in batch]
@@ -0,0 +1,220 @@
+"""
+Bulk refunds for a failed campaign
+
+claim_refund pays one contributor per call, so refunding N contributors
+costs N app calls plus N inner payments: 2N minimum fees. refund_batch pays
+several contributors per call with fee-less inner payments whose fees the
+call covers. The contributors are packed into groups of up to 16 calls, so
+the app call fees are paid once per call instead of once per contributor.
+
+How many contributors fit in a group is bounded by:
+- references: each needs its address and ledger box available, and a group
+  shares 8 references per transaction (one goes to the campaign's state box)
+- inner transactions: at most 256 per group
+
+Groups are sized to those limits. If a group still fails on opcode budget
+or resources, it is halved and retried; any other failure stops the run.
+refund_batch skips contributors already refunded, so retrying a group
+never pays anyone twice.
+
+Every contributor paid a deposit for their ledger box with their first
+contribution. Refunds pay it back with the contribution; for a campaign
+that reached its goal, release_all deletes the boxes with release_deposits
+calls, packed the same way, and pays back just the deposits.
+"""
+
+import base64
+import dataclasses
+import logging
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from smart_contracts.campus_funding.indexer import CONTRIBUTION_KEY_SIZE
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingClient,
+        CampusFundingComposer,
+    )
+
+logger = logging.getLogger(__name__)
+
+MIN_FEE = 1_000
+MAX_GROUP_SIZE = 16
+MAX_REFERENCES_PER_TRANSACTION = 8
+MAX_INNER_TRANSACTIONS = 256
+# Each contributor's address and ledger box
+REFERENCES_PER_CONTRIBUTOR = 2
+# Matches CONTRIBUTION_DEPOSIT in the contract: the ledger box MBR a
+# contributor's first payment to a campaign carries
+CONTRIBUTION_DEPOSIT = 21_700
+# Failures a smaller group avoids: AVM opcode budget, unavailable
+# references and inner transaction limits, and algokit_utils running out
+# of room for the references while populating them
+GROUP_TOO_LARGE_ERRORS = (
+    "dynamic cost budget exceeded",
+    "unavailable ",
+    "too many inner transactions",
+    "reference limit",
+)
+
+
+def group_capacity(calls: int = MAX_GROUP_SIZE) -> int:
+    """Most contributors a group of `calls` refund_batch calls can refund"""
+    references = calls * MAX_REFERENCES_PER_TRANSACTION - 1
+    return min(references // REFERENCES_PER_CONTRIBUTOR, MAX_INNER_TRANSACTIONS)
+
+
+def split_batches(contributors: Sequence[str], calls: int) -> list[list[str]]:
+    """Spread a group's contributors evenly over at most `calls` calls."""
+    calls = min(calls, len(contributors))
+    size, extra = divmod(len(contributors), calls) if calls else (0, 0)
+    batches = []
+    start = 0
+    for index in range(calls):
+        end = start + size + (1 if index < extra else 0)
+        batches.append(list(contributors[start:end]))
+        start = end
+    return batches
+
+
+def batch_fee(batch: Sequence[str]) -> int:
+    """Fee of a refund_batch call: its own plus one per inner payment"""
+    return MIN_FEE * (1 + len(batch))
+
+
+@dataclasses.dataclass
+class RefundReport:
+    contributors: int = 0
+    refunded: int = 0
+    groups: int = 0
+    calls: int = 0
+    fees: int = 0
+
+    @property
+    def claim_refund_fees(self) -> int:
+        """What one claim_refund per contributor would have cost"""
+        return 2 * MIN_FEE * self.contributors
+
+    def summary(self) -> str:
+        saved = self.claim_refund_fees - self.fees
+        return (
+            f"Refunded {self.refunded} microALGOs to {self.contributors} contributors in "
+            f"{self.calls} calls ({self.groups} groups): fees {self.fees} microALGOs vs "
+            f"{self.claim_refund_fees} with claim_refund, {saved} saved"
+        )
+
+
+def campaign_contributors(
+    algod_client: "AlgodClient", app_id: int, campaign_id: int
+) -> list[str]:
+    """Addresses with a ledger entry for the campaign, from the app's box names"""
+    from algosdk.encoding import encode_address
+
+    prefix = campaign_id.to_bytes(8, "big")
+    names = (
+        base64.b64decode(box["name"])
+        for box in algod_client.application_boxes(app_id)["boxes"]  # type: ignore[index]
+    )
+    return [
+        encode_address(name[8:])
+        for name in names
+        if len(name) == CONTRIBUTION_KEY_SIZE and name.startswith(prefix)
+    ]
+
+
+def group_too_large(error: Exception) -> bool:
+    """Whether a failed group could succeed with fewer contributors"""
+    message = str(error)
+    return any(fragment in message for fragment in GROUP_TOO_LARGE_ERRORS)
+
+
+def _send_in_groups(
+    app_client: "CampusFundingClient",
+    contributors: Sequence[str],
+    add_call: Callable[["CampusFundingComposer", list[str], Any], "CampusFundingComposer"],
+    calls_per_group: int,
+) -> Iterator[tuple[list[list[str]], Any]]:
+    """
+    Send one call per batch of contributors, in groups as large as the
+    protocol limits allow, yielding each group's batches and send result.
+    """
+    from algokit_utils import AlgoAmount, CommonAppCallParams
+
+    capacity = group_capacity(calls_per_group)
+    pending = list(contributors)
+    while pending:
+        group = pending[:capacity]
+        batches = split_batches(group, calls_per_group)
+        composer = app_client.new_group()
+        for batch in batches:
+            composer = add_call(
+                composer,
+                batch,
+                CommonAppCallParams(static_fee=AlgoAmount(micro_algo=batch_fee(batch))),
+            )
+        try:
+            result = composer.send()
+        except Exception as error:
+            if not group_too_large(error) or capacity == 1:
+                raise
+            capacity //= 2
+            logger.info(f"Group of {len(group)} contributors failed, retrying with {capacity}")
+            continue
+
+        pending = pending[len(group) :]
+        logger.info(f"Settled {len(group)} contributors, {len(pending)} to go")
+        yield batches, result
+
+
+def refund_all(
+    app_client: "CampusFundingClient",
+    campaign_id: int,
+    contributors: Sequence[str],
+    *,
+    calls_per_group: int = MAX_GROUP_SIZE,
+) -> RefundReport:
+    """
+    Refund every contributor with refund_batch, in groups as large as the
+    protocol limits allow. Fees are paid by app_client's default sender.
+    """
+    report = RefundReport(contributors=len(contributors))
+    groups = _send_in_groups(
+        app_client,
+        contributors,
+        lambda composer, batch, params: composer.refund_batch(
+            {"campaign_id": campaign_id, "contributors": batch}, params=params
+        ),
+        calls_per_group,
+    )
+    for batches, result in groups:
+        report.refunded += sum(result.returns)
+        report.groups += 1
+        report.calls += len(batches)
+        report.fees += sum(batch_fee(batch) for batch in batches)
+    return report
+
+
+def release_all(
+    app_client: "CampusFundingClient",
+    campaign_id: int,
+    contributors: Sequence[str],
+    *,
+    calls_per_group: int = MAX_GROUP_SIZE,
+) -> int:
+    """
+    Delete the ledger boxes of a campaign that reached its goal, paying
+    each contributor's deposit back, and return how many were deleted.
+    Fees are paid by app_client's default sender.
+    """
+    groups = _send_in_groups(
+        app_client,
+        contributors,
+        lambda composer, batch, params: composer.release_deposits(
+            {"campaign_id": campaign_id, "contributors": batch}, params=params
+        ),
+        calls_per_group,
+    )
+    return sum(sum(result.returns) for _, result in groups)
@@ -0,0 +1,324 @@
+"""
+Bulk campaign loading for seeding and migrations
+
+Campaigns are read from CSV or JSONL and created with create_campaign calls
+packed into atomic groups of up to 16. Groups are signed and submitted
+back to back, keeping a bounded window in flight, and confirmed through the
+block-following ConfirmationService.
+
+create_campaign assigns IDs from the on-chain counter, so every call's box
+references are predicted from it, and the index pages it appends to from
+the index counts read once at the start and advanced locally. Algod
+evaluates each submitted group on top of the ones already pending, so
+predictions hold as long as nothing else creates campaigns on the app
+while a load runs. The checkpoint file
+records the first ID of the load; because groups apply in submission order,
+comparing it with the counter tells a rerun exactly which rows are done.
+A group that fails to confirm breaks the predictions for every group after
+it, so the load stops at the first failure.
+"""
+
+import asyncio
+import csv
+import dataclasses
+import json
+import logging
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from smart_contracts._helpers.confirmations import ConfirmationService
+from smart_contracts.campus_funding.indexer import read_box
+from smart_contracts.campus_funding.keeper import (
+    INDEX_PAGE_IDS,
+    bucket_key,
+    deadline_day,
+    page_key,
+    parse_count,
+)
+from smart_contracts.campus_funding.reads import chunk_campaign_ids, get_total_campaigns
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingClient,
+    )
+
+logger = logging.getLogger(__name__)
+
+MAX_GROUP_SIZE = 16
+MAX_BOX_REFERENCES = 8
+# Matches CREATOR_INDEX_PREFIX in the contract
+CREATOR_INDEX_PREFIX = b"c"
+DEFAULT_WINDOW = 8
+FIELDS = ("title", "description", "goal_amount", "duration_seconds", "image_url")
+# Matches MAX_CAMPAIGN_BOX_SIZE in the contract; the encoded metadata has a
+# 6-byte head plus a 2-byte length per string
+MAX_METADATA_SIZE = 1024
+METADATA_OVERHEAD = 12
+# The deadline is the latest block timestamp plus the duration, so it can
+# fall a little before or after the clock at submission
+DEADLINE_DRIFT = (-60, 600)
+
+
+@dataclasses.dataclass(frozen=True)
+class CampaignRow:
+    title: str
+    description: str
+    goal_amount: int
+    duration_seconds: int
+    image_url: str
+
+    def as_args(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+def _parse_row(record: dict[str, Any], line: int) -> CampaignRow:
+    missing = [field for field in FIELDS if record.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"Row {line}: missing {', '.join(missing)}")
+    try:
+        row = CampaignRow(
+            title=str(record["title"]),
+            description=str(record["description"]),
+            goal_amount=int(record["goal_amount"]),
+            duration_seconds=int(record["duration_seconds"]),
+            image_url=str(record["image_url"]),
+        )
+    except ValueError as error:
+        raise ValueError(f"Row {line}: {error}") from error
+    text_size = sum(len(value.encode()) for value in (row.title, row.description, row.image_url))
+    if METADATA_OVERHEAD + text_size > MAX_METADATA_SIZE:
+        raise ValueError(f"Row {line}: campaign text exceeds {MAX_METADATA_SIZE} bytes")
+    if row.goal_amount <= 0 or row.duration_seconds <= 0:
+        raise ValueError(f"Row {line}: goal_amount and duration_seconds must be positive")
+    return row
+
+
+def read_campaigns(path: Path) -> list[CampaignRow]:
+    """Read and validate campaigns from a .csv file with a header or a .jsonl file."""
+    if path.suffix == ".csv":
+        with path.open(newline="") as file:
+            # Line 1 is the header
+            records = csv.DictReader(file)
+            return [_parse_row(record, line) for line, record in enumerate(records, 2)]
+    if path.suffix == ".jsonl":
+        with path.open() as file:
+            return [
+                _parse_row(json.loads(text), line)
+                for line, text in enumerate(file, 1)
+                if text.strip()
+            ]
+    raise ValueError(f"Unsupported campaign file {path}, expected .csv or .jsonl")
+
+
+@dataclasses.dataclass
+class Checkpoint:
+    source: str
+    first_campaign_id: int
+    rows_done: int = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint | None":
+        if not path.exists():
+            return None
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(dataclasses.asdict(self), indent=2) + "\n")
+
+
+def rows_loaded(checkpoint: Checkpoint, total_campaigns: int, row_count: int) -> int:
+    """Rows of a load already on chain, from the campaign counter."""
+    done = max(0, total_campaigns - checkpoint.first_campaign_id + 1)
+    if done > row_count:
+        raise ValueError(
+            f"{done} campaigns created since ID {checkpoint.first_campaign_id} but the "
+            f"source has {row_count} rows; something else is creating campaigns"
+        )
+    return done
+
+
+class IndexCounts:
+    """
+    Predicted size of each paged index a load appends to. Counts are read
+    from the chain the first time an index is seen and advanced locally
+    after that. A deadline close to midnight may land on either of two
+    days, so each count is kept as a (fewest, most) range and every page
+    the next ID could land on is referenced.
+    """
+
+    def __init__(self, read_count: Callable[[bytes], int]):
+        self.read_count = read_count
+        self.counts: dict[bytes, tuple[int, int]] = {}
+
+    def append(self, keys: Sequence[bytes]) -> list[bytes]:
+        """Box names an append to one of `keys` may touch, counting the append."""
+        names = []
+        for key in keys:
+            if key not in self.counts:
+                count = self.read_count(key)
+                self.counts[key] = (count, count)
+            fewest, most = self.counts[key]
+            names.append(key)
+            names.extend(
+                page_key(key, page)
+                for page in range(fewest // INDEX_PAGE_IDS, most // INDEX_PAGE_IDS + 1)
+            )
+            # Only a single candidate is sure to grow
+            self.counts[key] = (fewest + (1 if len(keys) == 1 else 0), most + 1)
+        return names
+
+
+def _box_references(
+    campaign_id: int, duration_seconds: int, now: int, creator: bytes, indexes: IndexCounts
+) -> list[bytes]:
+    """Box names create_campaign writes: state, metadata, creator and deadline indexes"""
+    key = campaign_id.to_bytes(8, "big")
+    days = sorted({deadline_day(now + duration_seconds + drift) for drift in DEADLINE_DRIFT})
+    return [
+        key,
+        b"m" + key,
+        *indexes.append([CREATOR_INDEX_PREFIX + creator]),
+        *indexes.append([bucket_key(day) for day in days]),
+    ]
+
+
+def _spread_references(per_call: Sequence[Sequence[bytes]]) -> list[list[bytes]]:
+    """
+    Share a group's box references out over its calls, at most 8 each.
+    Boxes referenced anywhere in a group are available to all of its
+    calls, so index boxes several calls write are referenced once.
+    """
+    names = list(dict.fromkeys(name for call in per_call for name in call))
+    if len(names) > MAX_BOX_REFERENCES * len(per_call):
+        raise ValueError(
+            f"{len(per_call)} calls need {len(names)} box references, more than "
+            f"{MAX_BOX_REFERENCES} each; use a larger group"
+        )
+    return [
+        names[start : start + MAX_BOX_REFERENCES]
+        for start in range(0, MAX_BOX_REFERENCES * len(per_call), MAX_BOX_REFERENCES)
+    ]
+
+
+def _build_group(
+    app_client: "CampusFundingClient",
+    sender: str,
+    rows: Sequence[CampaignRow],
+    first_id: int,
+    indexes: IndexCounts,
+) -> list[Any]:
+    """Sign one atomic group of create_campaign calls for consecutive IDs."""
+    from algokit_utils import CommonAppCallParams
+    from algosdk.encoding import decode_address
+    from algosdk.transaction import assign_group_id
+
+    now = int(time.time())
+    creator = decode_address(sender)
+    references = _spread_references(
+        [
+            _box_references(first_id + offset, row.duration_seconds, now, creator, indexes)
+            for offset, row in enumerate(rows)
+        ]
+    )
+    transactions = [
+        app_client.create_transaction.create_campaign(
+            row.as_args(),
+            params=CommonAppCallParams(sender=sender, box_references=names),
+        ).transactions[0]
+        for row, names in zip(rows, references)
+    ]
+    assign_group_id(transactions)
+    signer = app_client.algorand.account.get_signer(sender)
+    return signer.sign_transactions(transactions, list(range(len(transactions))))
+
+
+async def seed_campaigns(
+    app_client: "CampusFundingClient",
+    sender: str,
+    rows: Sequence[CampaignRow],
+    checkpoint_path: Path,
+    *,
+    source: str = "",
+    group_size: int = MAX_GROUP_SIZE,
+    window: int = DEFAULT_WINDOW,
+) -> int:
+    """
+    Create every campaign in `rows` that an earlier run hasn't, returning
+    how many were created by this run.
+
+    Args:
+        app_client: Typed client for the deployed CampusFunding app
+        sender: Account creating the campaigns; its signer must be registered
+        rows: Campaigns to create, in order
+        checkpoint_path: Where progress is recorded for reruns
+        source: Name of the input, checked against the checkpoint
+        group_size: create_campaign calls per atomic group, at most 16
+        window: Groups allowed in flight at once
+    """
+    if not 1 <= group_size <= MAX_GROUP_SIZE:
+        raise ValueError(f"Group size must be between 1 and {MAX_GROUP_SIZE}")
+
+    total = get_total_campaigns(app_client)
+    checkpoint = Checkpoint.load(checkpoint_path)
+    if checkpoint is None:
+        checkpoint = Checkpoint(source=source, first_campaign_id=total + 1)
+    elif checkpoint.source != source:
+        raise ValueError(f"{checkpoint_path} belongs to a load of {checkpoint.source}")
+    done = rows_loaded(checkpoint, total, len(rows))
+    checkpoint.rows_done = done
+    checkpoint.save(checkpoint_path)
+    if done:
+        logger.info(f"Resuming after {done} campaigns already created")
+
+    groups = chunk_campaign_ids(range(done, len(rows)), group_size)
+    algod = app_client.algorand.client.algod
+    indexes = IndexCounts(lambda key: parse_count(read_box(algod, app_client.app_id, key)))
+    in_flight = asyncio.Semaphore(window)
+    confirmed_groups: set[int] = set()
+    next_group = 0
+    # Campaign IDs are predicted from the groups before, so once a group
+    # fails the ones after it can't be built and submission stops
+    failures: list[Exception] = []
+
+    async with ConfirmationService(algod) as confirmations:
+
+        async def confirm(index: int, tx_id: str) -> None:
+            nonlocal next_group
+            try:
+                await confirmations.confirmed(tx_id)
+            except Exception as error:
+                failures.append(error)
+                raise
+            finally:
+                in_flight.release()
+            confirmed_groups.add(index)
+            # Record progress up to the first group still unconfirmed
+            while next_group in confirmed_groups:
+                checkpoint.rows_done = groups[next_group][-1] + 1
+                next_group += 1
+            checkpoint.save(checkpoint_path)
+
+        pending = []
+        try:
+            for index, group in enumerate(groups):
+                await in_flight.acquire()
+                if failures:
+                    raise failures[0]
+                group_rows = [rows[row] for row in group]
+                first_id = checkpoint.first_campaign_id + group[0]
+                signed = await asyncio.to_thread(
+                    _build_group, app_client, sender, group_rows, first_id, indexes
+                )
+                tx_ids = await confirmations.send_group(signed)
+                logger.debug(f"Submitted campaigns {first_id}..{first_id + len(group) - 1}")
+                pending.append(asyncio.create_task(confirm(index, tx_ids[0])))
+        except Exception:
+            # Let submitted groups land so the checkpoint is current for a rerun
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+        await asyncio.gather(*pending)
+
+    logger.info(f"Created {len(rows) - done} campaigns, {len(rows)} of {len(rows)} loaded")
+    return len(rows) - done
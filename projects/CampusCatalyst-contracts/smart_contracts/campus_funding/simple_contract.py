@@ -88,12 +88,12 @@ class CampusCatalyst(ARC4Contract):
         amount_algo = payment.amount // UInt64(1_000_000)
         return arc4.String(f"Contributed {amount_algo} ALGO to campaign {campaign_id.native}")
     
-    @arc4.abimethod
+    @arc4.abimethod(readonly=True)
     def get_total_campaigns(self) -> arc4.UInt64:
         """Get total number of campaigns created"""
         return arc4.UInt64(self.total_campaigns.value)
     
-    @arc4.abimethod
+    @arc4.abimethod(readonly=True)
     def get_contract_balance(self) -> arc4.UInt64:
         """Get total ALGO held by contract"""
         return arc4.UInt64(self.contract_balance.value)
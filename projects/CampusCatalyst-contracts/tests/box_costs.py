@@ -0,0 +1,97 @@
+"""
+Box sizes and minimum balance costs of the CampusFunding storage layout
+"""
+
+# Box minimum balance: 2500 microALGOs per box + 400 per byte of key and value
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+STATE_KEY_SIZE = 8  # itob(campaign_id)
+STATE_BOX_SIZE = 57  # creator + goal/deadline/total_raised + packed flags
+METADATA_KEY_SIZE = 9  # b"m" + itob(campaign_id)
+# CampaignMetadata head: three string offsets (3 * 2); each string adds a 2-byte length
+METADATA_HEAD_SIZE = 6
+CONTRIBUTION_KEY_SIZE = 40  # itob(campaign_id) + 32-byte address
+CONTRIBUTION_BOX_SIZE = 8
+LEGACY_CAMPAIGN_BOX_SIZE = 1024
+# Paged indexes: a count box at the index key and pages of up to 128 IDs at
+# key + itob(page)
+DEADLINE_INDEX_KEY_SIZE = 9  # b"d" + itob(deadline day)
+CREATOR_INDEX_KEY_SIZE = 33  # b"c" + 32-byte address
+INDEX_PAGE_KEY_EXTRA = 8  # + itob(page)
+INDEX_COUNT_SIZE = 8
+INDEX_ENTRY_SIZE = 8
+INDEX_PAGE_IDS = 128
+LEADERBOARD_KEY_SIZE = 3  # b"top"
+LEADERBOARD_SIZE = 160  # 10 * (itob(campaign_id) + itob(total_raised))
+
+# (title, description, image_url) of the campaigns the MBR report covers
+SAMPLE_CAMPAIGNS = [
+    ("Campus Hackathon 2026", "Funding for annual campus hackathon event",
+     "https://example.com/image.jpg"),
+    ("Student Club Funding", "Support our robotics club",
+     "https://example.com/robot.jpg"),
+    ("Campus Innovation Lab",
+     "Building a maker space for students to prototype ideas",
+     "https://example.com/innovation-lab.jpg"),
+    ("Green Campus Initiative", "Solar panels for the student union. " * 8,
+     "https://example.com/solar.jpg"),
+]
+
+
+def encoded_metadata_size(title: str, description: str, image_url: str) -> int:
+    """Size in bytes of an ARC-4 encoded CampaignMetadata"""
+    strings = (title, description, image_url)
+    return METADATA_HEAD_SIZE + sum(2 + len(value.encode()) for value in strings)
+
+
+def box_mbr(value_size: int, key_size: int) -> int:
+    """Minimum balance in microALGOs locked by a box"""
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (key_size + value_size)
+
+
+def campaign_boxes_mbr(title: str, description: str, image_url: str) -> int:
+    """Minimum balance locked by a campaign's state and metadata boxes"""
+    metadata_size = encoded_metadata_size(title, description, image_url)
+    return box_mbr(STATE_BOX_SIZE, STATE_KEY_SIZE) + box_mbr(
+        metadata_size, METADATA_KEY_SIZE
+    )
+
+
+def index_entry_mbr(key_size: int, position: int) -> int:
+    """
+    Minimum balance one more ID locks in a paged index that already holds
+    `position` IDs: the first one creates the count box, and the first of
+    every page creates the page
+    """
+    mbr = BOX_BYTE_MBR * INDEX_ENTRY_SIZE
+    if position % INDEX_PAGE_IDS == 0:
+        mbr += BOX_FLAT_MBR + BOX_BYTE_MBR * (key_size + INDEX_PAGE_KEY_EXTRA)
+    if position == 0:
+        mbr += box_mbr(INDEX_COUNT_SIZE, key_size)
+    return mbr
+
+
+def campaign_mbr(
+    title: str,
+    description: str,
+    image_url: str,
+    *,
+    day_position: int = 0,
+    creator_position: int = 0,
+) -> int:
+    """
+    Minimum balance a create_campaign locks: the campaign's own boxes plus
+    its entries in the deadline and creator indexes, which already hold
+    `day_position` and `creator_position` IDs (by default the campaign is
+    the first of its day and of its creator, the most it can cost)
+    """
+    return (
+        campaign_boxes_mbr(title, description, image_url)
+        + index_entry_mbr(DEADLINE_INDEX_KEY_SIZE, day_position)
+        + index_entry_mbr(CREATOR_INDEX_KEY_SIZE, creator_position)
+    )
+
+
+def leaderboard_mbr() -> int:
+    """Minimum balance of the leaderboard box, locked once by the first contribution"""
+    return box_mbr(LEADERBOARD_SIZE, LEADERBOARD_KEY_SIZE)
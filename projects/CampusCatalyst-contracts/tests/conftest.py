@@ -0,0 +1,89 @@
+"""
+Shared pytest configuration
+
+The default run is fully offline: contracts execute in the algopy_testing
+emulator. Tests marked `localnet` deploy to a running LocalNet and only run
+when `--localnet` is passed; their fixtures import algokit_utils lazily so
+offline runs never touch the network stack.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from algokit_utils import AlgorandClient
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--localnet",
+        action="store_true",
+        default=False,
+        help="run integration tests against a running LocalNet",
+    )
+    parser.addoption(
+        "--update-benchmarks",
+        action="store_true",
+        default=False,
+        help="rewrite the benchmark baseline with this run's measurements",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=10.0,
+        help="percentage a benchmark metric may grow over its baseline",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--localnet"):
+        return
+    skip_localnet = pytest.mark.skip(reason="needs a running LocalNet, pass --localnet")
+    for item in items:
+        if "localnet" in item.keywords:
+            item.add_marker(skip_localnet)
+
+
+@pytest.fixture(scope="session")
+def algorand_client() -> "AlgorandClient":
+    """Get Algorand client for testing"""
+    from algokit_utils import AlgorandClient
+
+    return AlgorandClient.from_environment()
+
+
+@pytest.fixture(scope="session")
+def deployer(algorand_client: "AlgorandClient") -> Any:
+    """Get deployer account"""
+    from algokit_utils import get_localnet_default_account
+
+    return get_localnet_default_account(algorand_client)
+
+
+@pytest.fixture(scope="session")
+def app_client(algorand_client: "AlgorandClient", deployer: Any) -> Any:
+    """Deploy and return app client"""
+    from algokit_utils import AlgoAmount, PaymentParams
+
+    from smart_contracts.artifacts.campus_funding.campus_funding_client import (
+        CampusFundingFactory,
+    )
+
+    factory = algorand_client.client.get_typed_app_factory(
+        CampusFundingFactory,
+        default_sender=deployer.address
+    )
+
+    app_client, _ = factory.deploy()
+
+    # Fund the contract
+    algorand_client.send.payment(
+        PaymentParams(
+            amount=AlgoAmount(algo=5),
+            sender=deployer.address,
+            receiver=app_client.app_address,
+        )
+    )
+
+    return app_client
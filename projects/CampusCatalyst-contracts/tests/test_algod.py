@@ -0,0 +1,97 @@
+"""
+Tests for the shared pooled algod client, against a mocked HTTP transport
+"""
+
+import urllib.request
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("algosdk")
+
+from algosdk import error  # noqa: E402
+
+from smart_contracts._helpers import algod  # noqa: E402
+
+PARAMS = {
+    "consensus-version": "future",
+    "fee": 0,
+    "genesis-hash": "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+    "genesis-id": "testnet-v1.0",
+    "last-round": 1_000,
+    "min-fee": 1_000,
+}
+
+
+@pytest.fixture(autouse=True)
+def restore_opener() -> Iterator[None]:
+    yield
+    urllib.request.install_opener(None)  # type: ignore[arg-type]
+
+
+def pooled_client(
+    handler: Any, monkeypatch: pytest.MonkeyPatch
+) -> algod.CachedParamsAlgodClient:
+    monkeypatch.setattr(algod.time, "sleep", lambda seconds: None)
+    transport = algod.PooledTransport(retries=2)
+    transport.session = httpx.Client(transport=httpx.MockTransport(handler))
+    algod.install_transport(transport)
+    return algod.CachedParamsAlgodClient("", "https://algod.test")
+
+
+def test_retries_reads_with_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    statuses = iter([503, 429, 200])
+
+    def handler(request: Any) -> Any:
+        return httpx.Response(next(statuses), json={"last-round": 7, "message": "busy"})
+
+    client = pooled_client(handler, monkeypatch)
+    assert client.status()["last-round"] == 7
+
+
+def test_gives_up_after_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def handler(request: Any) -> Any:
+        calls.append(request)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    client = pooled_client(handler, monkeypatch)
+    with pytest.raises(error.AlgodHTTPError, match="unavailable"):
+        client.status()
+    assert len(calls) == 3
+
+
+def test_does_not_resubmit_transactions(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def handler(request: Any) -> Any:
+        calls.append(request)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    client = pooled_client(handler, monkeypatch)
+    with pytest.raises(error.AlgodHTTPError):
+        client.algod_request("POST", "/transactions", data=b"signed")
+    assert len(calls) == 1
+
+
+def test_reuses_suggested_params(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def handler(request: Any) -> Any:
+        calls.append(request.url.path)
+        return httpx.Response(200, json=PARAMS)
+
+    client = pooled_client(handler, monkeypatch)
+    first = client.suggested_params()
+    first.fee = 5_000
+    second = client.suggested_params()
+
+    assert calls == ["/v2/transactions/params"]
+    assert second.first == 1_000 and second.fee != 5_000
+
+    client._params_fetched_at -= client.params_rounds * algod.ROUND_SECONDS
+    client.suggested_params()
+    assert len(calls) == 2
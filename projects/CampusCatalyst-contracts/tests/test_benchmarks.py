@@ -0,0 +1,325 @@
+"""
+Opcode budget and box I/O benchmarks for every CampusFunding ABI method
+other than create_application, which only runs when the app is deployed
+
+Each method is simulated on LocalNet with execution tracing enabled and
+measured for:
+- opcode cost (app budget consumed by the call)
+- box bytes read (size of every box the call references)
+- box bytes written (size of every box value the call writes)
+- fees (minimum fee for the group plus any inner transactions)
+
+Results are compared against benchmarks_baseline.json and the test fails
+when any metric grows by more than --benchmark-tolerance percent, or when
+the baseline or a method's entry in it is missing. Run with
+`pytest --localnet tests/test_benchmarks.py`; pass --update-benchmarks to
+write the baseline, the first time or after an intentional change.
+"""
+
+import base64
+import dataclasses
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts.campus_funding.refunds import CONTRIBUTION_DEPOSIT
+
+BASELINE_PATH = Path(__file__).parent / "benchmarks_baseline.json"
+METRICS = ("opcode_cost", "box_bytes_read", "box_bytes_written", "fees")
+SHORT_DURATION = 2  # seconds, for campaigns that must end during setup
+
+
+@dataclasses.dataclass
+class MethodCost:
+    opcode_cost: int
+    box_bytes_read: int
+    box_bytes_written: int
+    fees: int
+
+
+@dataclasses.dataclass
+class Scenario:
+    """Campaigns prepared on LocalNet for the benchmarked calls"""
+    open_id: int
+    successful_id: int
+    failed_id: int
+    batch_ids: list[int]
+
+
+def _box_size(algorand_client: Any, app_id: int, name: bytes) -> int:
+    """Current size of a box, or 0 if the call is what creates it"""
+    try:
+        box = algorand_client.client.algod.application_box_by_name(app_id, name)
+    except Exception:
+        return 0
+    return len(base64.b64decode(box["value"]))
+
+
+def _referenced_boxes(response: dict[str, Any], transactions: list[Any]) -> set[bytes]:
+    """Box names from explicit references and simulate's unnamed resources"""
+    names = {
+        box.name
+        for txn in transactions
+        for box in (getattr(txn, "boxes", None) or [])
+    }
+    group = response["txn-groups"][0]
+    resource_sets = [group.get("unnamed-resources-accessed", {})] + [
+        result.get("unnamed-resources-accessed", {}) for result in group["txn-results"]
+    ]
+    for resources in resource_sets:
+        names.update(base64.b64decode(box["name"]) for box in resources.get("boxes", []))
+    return names
+
+
+def _box_bytes_written(txn_result: dict[str, Any]) -> int:
+    """Bytes of box values written according to the execution trace"""
+    trace = txn_result.get("exec-trace", {}).get("approval-program-trace", [])
+    return sum(
+        len(base64.b64decode(change["new-value"].get("bytes", "")))
+        for step in trace
+        for change in step.get("state-changes", [])
+        if change["app-state-type"] == "b" and change["operation"] == "w"
+    )
+
+
+def _inner_txn_count(txn_result: dict[str, Any]) -> int:
+    inner = txn_result["txn-result"].get("inner-txns", [])
+    return len(inner) + sum(_inner_txn_count({"txn-result": txn}) for txn in inner)
+
+
+def measure(
+    algorand_client: Any,
+    app_client: Any,
+    build: Callable[[Any], Any],
+) -> MethodCost:
+    """Simulate one app call (and any payment it takes) and measure the app call."""
+    from algosdk.v2client.models import SimulateTraceConfig
+
+    result = build(app_client.new_group()).simulate(
+        allow_unnamed_resources=True,
+        skip_signatures=True,
+        exec_trace_config=SimulateTraceConfig(enable=True, state_change=True),
+    )
+    response = result.simulate_response
+    txn_results = response["txn-groups"][0]["txn-results"]
+    app_call = txn_results[-1]
+
+    min_fee = algorand_client.get_suggested_params().min_fee
+    inner_txns = sum(_inner_txn_count(txn_result) for txn_result in txn_results)
+
+    return MethodCost(
+        opcode_cost=app_call.get("app-budget-consumed", 0),
+        box_bytes_read=sum(
+            _box_size(algorand_client, app_client.app_id, name)
+            for name in _referenced_boxes(response, result.transactions)
+        ),
+        box_bytes_written=_box_bytes_written(app_call),
+        fees=min_fee * (len(txn_results) + inner_txns),
+    )
+
+
+def _payment(algorand_client: Any, deployer: Any, app_client: Any, amount: int) -> Any:
+    from algokit_utils import AlgoAmount, PaymentParams
+
+    return algorand_client.create_transaction.payment(
+        PaymentParams(
+            sender=deployer.address,
+            receiver=app_client.app_address,
+            amount=AlgoAmount(micro_algo=amount),
+        )
+    )
+
+
+def _create(app_client: Any, duration_seconds: int, goal_amount: int = 1_000_000) -> int:
+    return app_client.send.create_campaign(
+        {
+            "title": "Benchmark Campaign",
+            "description": "Representative campaign description for cost measurement",
+            "goal_amount": goal_amount,
+            "duration_seconds": duration_seconds,
+            "image_url": "https://example.com/benchmark.jpg",
+        }
+    ).abi_return
+
+
+@pytest.fixture(scope="module")
+def scenario(algorand_client: Any, deployer: Any, app_client: Any) -> Scenario:
+    """Campaigns in every state a benchmarked method needs"""
+    from algokit_utils import AlgoAmount, PaymentParams
+
+    successful_id = _create(app_client, SHORT_DURATION, goal_amount=1_000_000)
+    failed_id = _create(app_client, SHORT_DURATION, goal_amount=10_000_000)
+    for campaign_id, amount in ((successful_id, 1_000_000), (failed_id, 200_000)):
+        app_client.send.contribute(
+            {
+                "campaign_id": campaign_id,
+                "payment": _payment(
+                    algorand_client, deployer, app_client, amount + CONTRIBUTION_DEPOSIT
+                ),
+            }
+        )
+    open_id = _create(app_client, 86400)
+    batch_ids = [_create(app_client, 86400) for _ in range(4)]
+
+    # Let the short campaigns end and produce a block with a later timestamp
+    time.sleep(SHORT_DURATION + 1)
+    algorand_client.send.payment(
+        PaymentParams(
+            sender=deployer.address,
+            receiver=deployer.address,
+            amount=AlgoAmount(micro_algo=0),
+        )
+    )
+    return Scenario(open_id, successful_id, failed_id, batch_ids)
+
+
+def _calls(
+    algorand_client: Any, deployer: Any, app_client: Any, scenario: Scenario
+) -> dict[str, Callable[[Any], Any]]:
+    """One composer builder per ABI method"""
+    from algokit_utils import AlgoAmount, CommonAppCallParams
+
+    # Covers the app call plus one inner payment
+    inner_payment_fee = CommonAppCallParams(static_fee=AlgoAmount(micro_algo=2_000))
+
+    def pay(amount: int) -> Any:
+        return _payment(algorand_client, deployer, app_client, amount)
+
+    return {
+        "create_campaign": lambda composer: composer.create_campaign(
+            {
+                "title": "Benchmark Campaign",
+                "description": "Representative campaign description for cost measurement",
+                "goal_amount": 1_000_000,
+                "duration_seconds": 86400,
+                "image_url": "https://example.com/benchmark.jpg",
+            }
+        ),
+        "contribute": lambda composer: composer.contribute(
+            {"campaign_id": scenario.open_id, "payment": pay(100_000 + CONTRIBUTION_DEPOSIT)}
+        ),
+        "contribute_many": lambda composer: composer.contribute_many(
+            {
+                "splits": [(campaign_id, 50_000) for campaign_id in scenario.batch_ids[:3]],
+                "payment": pay(150_000 + 3 * CONTRIBUTION_DEPOSIT),
+            }
+        ),
+        "withdraw_funds": lambda composer: composer.withdraw_funds(
+            {"campaign_id": scenario.successful_id}, params=inner_payment_fee
+        ),
+        "claim_refund": lambda composer: composer.claim_refund(
+            {"campaign_id": scenario.failed_id, "contributor": deployer.address},
+            params=inner_payment_fee,
+        ),
+        "get_campaign_info": lambda composer: composer.get_campaign_info(
+            {"campaign_id": scenario.open_id}
+        ),
+        "get_campaigns": lambda composer: composer.get_campaigns(
+            {"campaign_ids": scenario.batch_ids}
+        ),
+        "get_total_campaigns": lambda composer: composer.get_total_campaigns(),
+        "update_campaign": lambda composer: composer.update_campaign(
+            {
+                "campaign_id": scenario.open_id,
+                "new_description": "A longer replacement description that grows the metadata box",
+                "new_image_url": "https://example.com/benchmark-updated.jpg",
+            }
+        ),
+        "cancel_campaign": lambda composer: composer.cancel_campaign(
+            {"campaign_id": scenario.open_id}
+        ),
+        "refund_batch": lambda composer: composer.refund_batch(
+            {"campaign_id": scenario.failed_id, "contributors": [deployer.address]},
+            params=inner_payment_fee,
+        ),
+        "release_deposits": lambda composer: composer.release_deposits(
+            {"campaign_id": scenario.successful_id, "contributors": [deployer.address]},
+            params=inner_payment_fee,
+        ),
+        "close_failed_campaigns": lambda composer: composer.close_failed_campaigns(
+            {"campaign_ids": [scenario.failed_id]}
+        ),
+        "get_creator_campaigns": lambda composer: composer.get_creator_campaigns(
+            {"creator": deployer.address, "start": 0, "limit": 10}
+        ),
+        "get_platform_stats": lambda composer: composer.get_platform_stats(),
+        "increase_budget": lambda composer: composer.increase_budget(),
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, int]],
+    baseline: dict[str, dict[str, int]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Describe every metric that grew more than `tolerance` percent, and
+    every method the baseline has no entry for.
+    """
+    regressions = []
+    for method, metrics in results.items():
+        previous = baseline.get(method)
+        if previous is None:
+            regressions.append(f"{method}: not in the baseline")
+            continue
+        for metric in METRICS:
+            before, after = previous.get(metric, 0), metrics[metric]
+            if after > before * (1 + tolerance / 100):
+                regressions.append(f"{method}.{metric}: {before} -> {after}")
+    return regressions
+
+
+@pytest.mark.localnet
+def test_method_costs(
+    request: pytest.FixtureRequest,
+    algorand_client: Any,
+    deployer: Any,
+    app_client: Any,
+    scenario: Scenario,
+) -> None:
+    """Measure every ABI method and compare against the baseline"""
+    calls = _calls(algorand_client, deployer, app_client, scenario)
+    results = {
+        method: dataclasses.asdict(measure(algorand_client, app_client, build))
+        for method, build in calls.items()
+    }
+
+    print(f"\n{'method':<22}" + "".join(f"{metric:>19}" for metric in METRICS))
+    for method, metrics in results.items():
+        print(f"{method:<22}" + "".join(f"{metrics[metric]:>19}" for metric in METRICS))
+
+    if request.config.getoption("--update-benchmarks"):
+        BASELINE_PATH.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        return
+    if not BASELINE_PATH.exists():
+        pytest.fail(
+            f"No baseline at {BASELINE_PATH}; run with --update-benchmarks and commit it"
+        )
+
+    baseline = json.loads(BASELINE_PATH.read_text())
+    tolerance = request.config.getoption("--benchmark-tolerance")
+    regressions = find_regressions(results, baseline, tolerance)
+    assert not regressions, (
+        f"Regressed more than {tolerance}% or missing from the baseline:\n"
+        + "\n".join(regressions)
+    )
+
+
+def test_find_regressions() -> None:
+    """Test the regression check on its own, without LocalNet"""
+    baseline = {"contribute": {"opcode_cost": 100, "box_bytes_read": 65, "box_bytes_written": 65, "fees": 2000}}
+    within = {"contribute": {"opcode_cost": 110, "box_bytes_read": 65, "box_bytes_written": 65, "fees": 2000}}
+    over = {"contribute": {"opcode_cost": 111, "box_bytes_read": 65, "box_bytes_written": 65, "fees": 3000}}
+
+    assert find_regressions(within, baseline, 10.0) == []
+    assert find_regressions(over, baseline, 10.0) == [
+        "contribute.opcode_cost: 100 -> 111",
+        "contribute.fees: 2000 -> 3000",
+    ]
+    assert find_regressions({"refund_batch": within["contribute"]}, baseline, 10.0) == [
+        "refund_batch: not in the baseline"
+    ]
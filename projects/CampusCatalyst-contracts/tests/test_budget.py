@@ -0,0 +1,99 @@
+"""
+Tests for padding groups with increase_budget calls only when needed
+"""
+
+import dataclasses
+from typing import Any
+
+import pytest
+
+from smart_contracts.campus_funding.budget import (
+    INCREASE_BUDGET_COST,
+    padding_calls,
+    send_with_budget,
+)
+
+
+def simulated_group(consumed: int, types: list[str]) -> dict[str, Any]:
+    """A simulate "txn-groups" entry, including the extra budget simulate was allowed"""
+    return {
+        "app-budget-consumed": consumed,
+        "app-budget-added": 700 * types.count("appl") + 320_000,
+        "txn-results": [{"txn-result": {"txn": {"txn": {"type": type_}}}} for type_ in types],
+    }
+
+
+def test_padding_calls() -> None:
+    assert padding_calls(simulated_group(650, ["appl"])) == 0
+    assert padding_calls(simulated_group(701, ["appl"])) == 1
+    assert padding_calls(simulated_group(2_760, ["pay", "appl", "appl"])) == 2
+    # Two calls add 1,400 but spend some of it themselves
+    assert padding_calls(simulated_group(2_800, ["pay", "appl", "appl"])) == 3
+    # Readonly groups without app calls report nothing
+    assert padding_calls({}) == 0
+
+
+def test_padding_calls_ignores_simulate_extra_budget() -> None:
+    # Consumption past the natural budget is covered in simulate by its
+    # extra allowance, which must not count towards the real group's budget
+    group = simulated_group(5_000, ["appl", "appl"])
+    assert group["app-budget-consumed"] < group["app-budget-added"]
+    assert padding_calls(group) == 6
+
+
+def test_padding_covers_its_own_cost() -> None:
+    for consumed in range(701, 11_000, 97):
+        padding = padding_calls(simulated_group(consumed, ["appl"]))
+        # The padded group's budget covers the call and the padding itself
+        assert 700 * (1 + padding) >= consumed + INCREASE_BUDGET_COST * padding
+        # and one call fewer would not
+        assert 700 * padding < consumed + INCREASE_BUDGET_COST * (padding - 1)
+
+
+@dataclasses.dataclass
+class FakeSimulation:
+    simulate_response: dict[str, Any]
+    transactions: list[str]
+
+
+class FakeComposer:
+    def __init__(self, cost: int) -> None:
+        self.cost = cost
+        self.calls: list[str] = []
+
+    def update_campaign(self, args: dict[str, Any]) -> "FakeComposer":
+        self.calls.append("update_campaign")
+        return self
+
+    def increase_budget(self, params: Any = None) -> "FakeComposer":
+        self.calls.append("increase_budget")
+        return self
+
+    def simulate(self, **kwargs: Any) -> FakeSimulation:
+        assert kwargs["extra_opcode_budget"] > 0
+        group = simulated_group(self.cost, ["appl"] * len(self.calls))
+        return FakeSimulation({"txn-groups": [group]}, list(self.calls))
+
+    def send(self, **kwargs: Any) -> list[str]:
+        return self.calls
+
+
+class FakeAppClient:
+    def __init__(self, cost: int) -> None:
+        self.cost = cost
+
+    def new_group(self) -> FakeComposer:
+        return FakeComposer(self.cost)
+
+
+@pytest.mark.parametrize(("cost", "padding"), [(500, 0), (1_500, 2), (10_500, 15)])
+def test_send_with_budget(cost: int, padding: int) -> None:
+    pytest.importorskip("algokit_utils")
+    sent = send_with_budget(FakeAppClient(cost), lambda composer: composer.update_campaign({}))
+    assert sent == ["update_campaign"] + ["increase_budget"] * padding
+
+
+def test_send_with_budget_over_group_limit() -> None:
+    pytest.importorskip("algokit_utils")
+    with pytest.raises(ValueError, match="more than fit in a group of 16"):
+        send_with_budget(FakeAppClient(11_000), lambda composer: composer.update_campaign({}))
@@ -0,0 +1,170 @@
+"""
+Tests for the build cache key, for running build tools in-process and
+reporting their time, and for building contracts in parallel workers
+"""
+
+import io
+import logging
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import smart_contracts.__main__ as cli
+from smart_contracts.__main__ import _report_stage, _run_in_process
+
+
+def test_in_process_output_is_streamed(monkeypatch: pytest.MonkeyPatch) -> None:
+    echo = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", echo)
+    seen = []
+
+    def entry_point() -> int:
+        print("compiling contract.py")
+        seen.append(echo.getvalue())
+        print("done", end="", file=sys.stderr)
+        return 3
+
+    returncode, output = _run_in_process(entry_point, ["puyapy"], "[app] ")
+
+    assert seen == ["[app] compiling contract.py\n"]
+    assert (returncode, output) == (3, "compiling contract.py\ndone")
+    assert echo.getvalue() == "[app] compiling contract.py\n[app] done\n"
+
+
+def test_in_process_output_through_rewrapped_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    echo = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", echo)
+
+    def entry_point() -> None:
+        # As puyapy does when it configures logging
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, line_buffering=True)
+        print("writing caf\u00e9.teal")
+
+    returncode, output = _run_in_process(entry_point, ["puyapy"], "[app] ")
+
+    assert (returncode, output) == (0, "writing caf\u00e9.teal\n")
+    assert echo.getvalue() == "[app] writing caf\u00e9.teal\n"
+
+
+def test_report_stage_against_subprocess_baseline(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    baseline: dict[str, float] = {}
+
+    _report_stage("compile", 1.0, False, baseline, "[app] ")
+    _report_stage("compile", 0.25, True, baseline, "[app] ")
+    _report_stage("generate", 0.5, True, baseline, "[app] ")
+
+    assert baseline == {"compile": 1.0}
+    assert "[app] compile ran in-process in 0.25s, 0.75s faster" in caplog.text
+    assert "[app] generate ran in-process in 0.50s (build once with --subprocess" in caplog.text
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A contract importing shared modules, next to a module it doesn't import"""
+    files = {
+        "__init__.py": "",
+        "shared/__init__.py": "",
+        "shared/constants.py": "GOAL = 1\n",
+        "app/__init__.py": "",
+        "app/contract.py": (
+            "import algopy\n"
+            "from smart_contracts.shared import constants\n"
+            "from .helpers import double\n"
+        ),
+        "app/helpers.py": "def double(x):\n    return 2 * x\n",
+        "app/deploy_config.py": "DEPLOYED = True\n",
+    }
+    root = tmp_path / "smart_contracts"
+    for name, text in files.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_text(text)
+    monkeypatch.setattr(cli, "root_path", root)
+    monkeypatch.setattr(cli, "_tool_version", lambda tool: "1.0")
+    return root
+
+
+def test_cache_key_covers_contract_imports(project: Path) -> None:
+    contract = project / "app" / "contract.py"
+    sources = cli._contract_sources(contract)
+    assert [path.relative_to(project).as_posix() for path in sources] == [
+        "__init__.py",
+        "app/__init__.py",
+        "app/contract.py",
+        "app/helpers.py",
+        "shared/__init__.py",
+        "shared/constants.py",
+    ]
+
+    key = cli._build_cache_key(contract)
+    (project / "app" / "deploy_config.py").write_text("DEPLOYED = False\n")
+    assert cli._build_cache_key(contract) == key
+    (project / "shared" / "constants.py").write_text("GOAL = 2\n")
+    assert cli._build_cache_key(contract) != key
+
+
+def test_unknown_tool_version_skips_cache(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "_tool_version", lambda tool: None)
+    assert cli._build_cache_key(project / "app" / "contract.py") is None
+    assert cli._read_build_cache(project, None) is None
+
+
+STUB_CONTRACT = """\
+from algopy import ARC4Contract, UInt64, arc4
+
+
+class {name}(ARC4Contract):
+    @arc4.abimethod()
+    def ping(self) -> UInt64:
+        return {value}
+"""
+
+
+def run_cli(root: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    """`python -m smart_contracts` on the stub project at `root`"""
+    # puyapy type-checks with the `python` on PATH, which must be this one
+    path = os.pathsep.join((str(Path(sys.executable).parent), os.environ.get("PATH", "")))
+    return subprocess.run(
+        [sys.executable, "-m", "smart_contracts", *args],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PATH": path},
+    )
+
+
+def test_build_all_in_parallel_workers(tmp_path: Path) -> None:
+    pytest.importorskip("puya")
+    pytest.importorskip("algokit_client_generator")
+    # A copy of the CLI next to stub contracts, so root_path is the stub
+    # project in this process and in every build worker
+    package = tmp_path / "smart_contracts"
+    package.mkdir()
+    shutil.copy(Path(cli.__file__), package / "__main__.py")
+    (package / "__init__.py").write_text("")
+    for name, value in (("First", "UInt64(1)"), ("Second", "UInt64(2)")):
+        folder = package / name.lower()
+        folder.mkdir()
+        (folder / "contract.py").write_text(STUB_CONTRACT.format(name=name, value=value))
+
+    built = run_cli(tmp_path, "build", "--jobs", "2")
+
+    assert built.returncode == 0, built.stderr
+    assert "Built 2 contract(s)" in built.stderr
+    for name in ("first", "second"):
+        output = package / "artifacts" / name
+        assert (output / f"{name.title()}.arc56.json").is_file()
+        assert (output / f"{name}_client.py").is_file()
+
+    broken = package / "broken"
+    broken.mkdir()
+    (broken / "contract.py").write_text(STUB_CONTRACT.format(name="Broken", value='"one"'))
+
+    failed = run_cli(tmp_path, "build", "--jobs", "2")
+
+    assert failed.returncode != 0
+    assert "Could not build contract" in failed.stderr
@@ -0,0 +1,460 @@
+"""
+LocalNet integration tests for Campus Crowdfunding Platform Smart Contract
+
+These deploy the compiled contract to a running LocalNet and cover what the
+offline suite can't: fees, minimum balance, simulate-based reads and the
+generated client. Run them with `pytest --localnet`.
+
+Tests cover:
+- Campaign creation
+- Contributions
+- Refund mechanism
+- Campaign updates
+- Box sizing and minimum balance cost
+"""
+
+import time
+
+import pytest
+from algokit_utils import (
+    AlgoAmount,
+    AlgorandClient,
+    ApplicationClient,
+    CommonAppCallParams,
+)
+from algosdk.encoding import decode_address
+
+from smart_contracts.campus_funding.indexer import read_box
+from smart_contracts.campus_funding.keeper import bucket_key, deadline_day, parse_count
+from smart_contracts.campus_funding.reads import (
+    get_campaign,
+    get_campaigns,
+    get_total_campaigns,
+    list_campaigns,
+)
+from smart_contracts.campus_funding.refunds import CONTRIBUTION_DEPOSIT
+from tests.box_costs import (
+    BOX_BYTE_MBR,
+    CONTRIBUTION_BOX_SIZE,
+    CONTRIBUTION_KEY_SIZE,
+    LEGACY_CAMPAIGN_BOX_SIZE,
+    SAMPLE_CAMPAIGNS,
+    box_mbr,
+    campaign_mbr,
+    leaderboard_mbr,
+)
+
+pytestmark = pytest.mark.localnet
+
+# Covers the app call plus one inner payment
+INNER_PAYMENT_FEE = 2_000
+
+
+def new_campaign(app_client, **overrides) -> int:
+    """Create a campaign and return the ID the contract assigned"""
+    campaign = {
+        "title": "Test Campaign",
+        "description": "Test description",
+        "goal_amount": 1_000_000,
+        "duration_seconds": 86400,
+        "image_url": "https://example.com/test.jpg",
+        **overrides,
+    }
+    return app_client.send.create_campaign(campaign).abi_return
+
+
+def contribute(app_client, algorand_client: AlgorandClient, sender, campaign_id: int, amount: int):
+    """Send a contribution, with the ledger deposit if it's the sender's first, and return the call result"""
+    ledger_key = campaign_id.to_bytes(8, "big") + decode_address(sender.address)
+    if read_box(algorand_client.client.algod, app_client.app_id, ledger_key) is None:
+        amount += CONTRIBUTION_DEPOSIT
+    payment_txn = algorand_client.transactions.payment(
+        {
+            "sender": sender.address,
+            "receiver": app_client.app_address,
+            "amount": amount,
+        }
+    )
+    return app_client.send.contribute({"campaign_id": campaign_id, "payment": payment_txn})
+
+
+def app_min_balance(algorand_client: AlgorandClient, app_client) -> int:
+    """Current minimum balance requirement of the app account"""
+    info = algorand_client.account.get_information(app_client.app_address)
+    return info.min_balance.micro_algo
+
+
+def index_positions(app_client, algorand_client: AlgorandClient, deployer, campaign_id: int) -> dict:
+    """
+    Where a new campaign landed in the deadline and creator indexes, as
+    campaign_mbr arguments. Other tests may already have campaigns on the
+    same day or by the same creator.
+    """
+    deadline = get_campaign(app_client, campaign_id).deadline
+    day_count, creator_count = (
+        parse_count(read_box(algorand_client.client.algod, app_client.app_id, key))
+        for key in (bucket_key(deadline_day(deadline)), b"c" + decode_address(deployer.address))
+    )
+    return {"day_position": day_count - 1, "creator_position": creator_count - 1}
+
+
+def test_create_campaign(app_client, deployer):
+    """Test creating a new campaign"""
+    result = app_client.send.create_campaign(
+        {
+            "title": "Campus Hackathon 2026",
+            "description": "Funding for annual campus hackathon event",
+            "goal_amount": 10_000_000,  # 10 ALGO
+            "duration_seconds": 86400 * 30,  # 30 days
+            "image_url": "https://example.com/image.jpg",
+        }
+    )
+    
+    campaign_id = result.abi_return
+    assert campaign_id == get_total_campaigns(app_client)
+    assert get_campaign(app_client, campaign_id).title == "Campus Hackathon 2026"
+
+
+def test_campaign_ids_are_sequential(app_client):
+    """Test that the contract hands out consecutive campaign IDs"""
+    first = new_campaign(app_client, title="First Campaign")
+    second = new_campaign(app_client, title="Second Campaign")
+
+    assert second == first + 1
+    assert get_total_campaigns(app_client) == second
+
+
+def test_contribute_to_campaign(app_client, algorand_client, deployer):
+    """Test contributing to a campaign"""
+    # Create campaign first
+    campaign_id = new_campaign(
+        app_client,
+        title="Student Club Funding",
+        description="Support our robotics club",
+        goal_amount=5_000_000,  # 5 ALGO
+        duration_seconds=86400 * 7,  # 7 days
+    )
+    
+    # Contribute 1 ALGO to campaign
+    result = contribute(app_client, algorand_client, deployer, campaign_id, 1_000_000)
+    
+    assert result.abi_return == "Contribution successful"
+
+
+def test_get_campaign_info(app_client):
+    """Test retrieving campaign information"""
+    # Create campaign
+    campaign_id = new_campaign(app_client)
+    
+    # Get campaign info
+    result = app_client.send.get_campaign_info({"campaign_id": campaign_id})
+    
+    campaign_info = result.abi_return
+    assert campaign_info is not None
+
+
+def test_update_campaign(app_client, deployer):
+    """Test updating campaign details"""
+    # Create campaign
+    campaign_id = new_campaign(
+        app_client,
+        title="Update Test",
+        description="Original description",
+        image_url="https://example.com/original.jpg",
+    )
+    
+    # Update campaign
+    result = app_client.send.update_campaign(
+        {
+            "campaign_id": campaign_id,
+            "new_description": "Updated description with more details",
+            "new_image_url": "https://example.com/updated.jpg",
+        }
+    )
+    
+    assert result.abi_return == "Campaign updated successfully"
+
+
+def test_cancel_campaign(app_client, deployer):
+    """Test cancelling a campaign with no contributions"""
+    # Create campaign
+    campaign_id = new_campaign(app_client, title="Cancel Test")
+    
+    # Cancel campaign
+    result = app_client.send.cancel_campaign({"campaign_id": campaign_id})
+    
+    assert result.abi_return == "Campaign cancelled successfully"
+
+
+def test_campaign_boxes_sized_to_struct(app_client, algorand_client, deployer):
+    """Test that campaign boxes and index entries only lock MBR for their encoded size"""
+    campaign = {
+        "title": "Library Makerspace",
+        "description": "3D printers and soldering stations for the library",
+        "image_url": "https://example.com/makerspace.jpg",
+    }
+    before = app_min_balance(algorand_client, app_client)
+
+    campaign_id = new_campaign(app_client, **campaign)
+
+    expected = campaign_mbr(
+        campaign["title"],
+        campaign["description"],
+        campaign["image_url"],
+        **index_positions(app_client, algorand_client, deployer, campaign_id),
+    )
+    assert app_min_balance(algorand_client, app_client) - before == expected
+
+
+def test_mbr_report_matches_app_account(app_client, algorand_client, deployer):
+    """Test the MBR report's campaigns against what they lock in the app account"""
+    algod = algorand_client.client.algod
+    for title, description, image_url in SAMPLE_CAMPAIGNS:
+        before = app_min_balance(algorand_client, app_client)
+        campaign_id = new_campaign(
+            app_client, title=title, description=description, image_url=image_url
+        )
+        created = app_min_balance(algorand_client, app_client)
+        assert created - before == campaign_mbr(
+            title,
+            description,
+            image_url,
+            **index_positions(app_client, algorand_client, deployer, campaign_id),
+        )
+
+        # A first contribution adds a ledger box, and the very first to the
+        # app also the leaderboard
+        expected = box_mbr(CONTRIBUTION_BOX_SIZE, CONTRIBUTION_KEY_SIZE)
+        if read_box(algod, app_client.app_id, b"top") is None:  # leaderboard key
+            expected += leaderboard_mbr()
+        contribute(app_client, algorand_client, deployer, campaign_id, 100_000)
+        assert app_min_balance(algorand_client, app_client) - created == expected
+
+
+def test_update_campaign_resizes_box(app_client, algorand_client):
+    """Test that updates grow and shrink the metadata box with the text"""
+    campaign_id = new_campaign(
+        app_client, description="Short", image_url="https://example.com/a.jpg"
+    )
+    created = app_min_balance(algorand_client, app_client)
+
+    longer = "A much longer description that grows the encoded campaign"
+    app_client.send.update_campaign(
+        {
+            "campaign_id": campaign_id,
+            "new_description": longer,
+            "new_image_url": "https://example.com/a.jpg",
+        }
+    )
+    grown = app_min_balance(algorand_client, app_client)
+    assert grown - created == BOX_BYTE_MBR * (len(longer) - len("Short"))
+
+    app_client.send.update_campaign(
+        {
+            "campaign_id": campaign_id,
+            "new_description": "Short",
+            "new_image_url": "https://example.com/a.jpg",
+        }
+    )
+    assert app_min_balance(algorand_client, app_client) == created
+
+
+def test_update_campaign_too_large_fails(app_client):
+    """Test that updates past the campaign box size limit are rejected"""
+    campaign_id = new_campaign(app_client, description="Fits")
+
+    with pytest.raises(Exception, match="Campaign data too large"):
+        app_client.send.update_campaign(
+            {
+                "campaign_id": campaign_id,
+                "new_description": "x" * LEGACY_CAMPAIGN_BOX_SIZE,
+                "new_image_url": "https://example.com/limit.jpg",
+            }
+        )
+
+
+def test_contribution_updates_state_in_place(app_client, algorand_client, deployer):
+    """Test that contributions leave the metadata untouched"""
+    campaign_id = new_campaign(
+        app_client,
+        description="Contributions only touch the state record",
+        goal_amount=5_000_000,
+    )
+
+    for _ in range(2):
+        contribute(app_client, algorand_client, deployer, campaign_id, 250_000)
+
+    info = get_campaign(app_client, campaign_id)
+    assert info.total_raised == 500_000
+    assert info.is_active
+    assert info.description == "Contributions only touch the state record"
+
+
+def test_contribute_many(app_client, algorand_client, deployer):
+    """Test splitting one payment across several campaigns in one call"""
+    first = new_campaign(app_client, title="Giving Day A", goal_amount=5_000_000)
+    second = new_campaign(app_client, title="Giving Day B", goal_amount=5_000_000)
+    payment_txn = algorand_client.transactions.payment(
+        {
+            "sender": deployer.address,
+            "receiver": app_client.app_address,
+            # One deposit for each new ledger entry
+            "amount": 700_000 + 2 * CONTRIBUTION_DEPOSIT,
+        }
+    )
+
+    result = app_client.send.contribute_many(
+        {"splits": [(first, 200_000), (second, 500_000)], "payment": payment_txn}
+    )
+
+    assert result.abi_return == "Contributions successful"
+    assert get_campaign(app_client, first).total_raised == 200_000
+    assert get_campaign(app_client, second).total_raised == 500_000
+
+
+def test_contribute_many_rejects_mismatched_splits(app_client, algorand_client, deployer):
+    """Test that splits must add up to the payment"""
+    first = new_campaign(app_client)
+    second = new_campaign(app_client)
+    payment_txn = algorand_client.transactions.payment(
+        {
+            "sender": deployer.address,
+            "receiver": app_client.app_address,
+            "amount": 700_000,
+        }
+    )
+
+    with pytest.raises(Exception, match="Splits must add up to payment"):
+        app_client.send.contribute_many(
+            {"splits": [(first, 200_000), (second, 100_000)], "payment": payment_txn}
+        )
+
+
+def test_get_campaigns_batch(app_client):
+    """Test reading several campaigns in one call"""
+    ids = [new_campaign(app_client, title=f"Batch {index}") for index in range(3)]
+
+    result = app_client.send.get_campaigns({"campaign_ids": ids[::-1]})
+
+    campaigns = result.abi_return
+    assert [campaign.title for campaign in campaigns] == ["Batch 2", "Batch 1", "Batch 0"]
+
+
+def test_get_campaigns_helper_preserves_order(app_client):
+    """Test that the client helper splits, fans out and reassembles reads"""
+    ids = [new_campaign(app_client, title=f"Order {index}") for index in range(5)]
+    campaign_ids = [ids[3], ids[0], ids[4], ids[1], ids[2]]
+
+    campaigns = get_campaigns(app_client, campaign_ids, group_size=2)
+
+    expected = [get_campaign(app_client, campaign_id) for campaign_id in campaign_ids]
+    fields = ("creator", "title", "description", "goal_amount", "deadline", "total_raised")
+    assert [[getattr(campaign, field) for field in fields] for campaign in campaigns] == [
+        [getattr(campaign, field) for field in fields] for campaign in expected
+    ]
+
+
+def test_list_campaigns(app_client):
+    """Test that listing covers every assigned ID"""
+    campaigns = list_campaigns(app_client)
+
+    assert len(campaigns) == get_total_campaigns(app_client)
+
+
+def test_reads_are_simulated(app_client, algorand_client):
+    """Test that campaign reads never submit a transaction"""
+    campaign_id = new_campaign(app_client, title="Simulated Read")
+    before = algorand_client.account.get_information(app_client.app_address)
+
+    campaign = get_campaign(app_client, campaign_id)
+
+    after = algorand_client.account.get_information(app_client.app_address)
+    assert campaign.title == "Simulated Read"
+    assert after.round == before.round
+
+
+def wait_for_deadline(algorand_client: AlgorandClient, deployer, seconds: int) -> None:
+    """Let a short campaign expire and produce a block with a later timestamp"""
+    time.sleep(seconds + 1)
+    algorand_client.send.payment(
+        {"sender": deployer.address, "receiver": deployer.address, "amount": 0}
+    )
+
+
+def test_contribution_ledger_mbr(app_client, algorand_client, deployer):
+    """Test that only a contributor's first payment creates a ledger box"""
+    campaign_id = new_campaign(app_client, goal_amount=5_000_000)
+    mbr = [app_min_balance(algorand_client, app_client)]
+
+    for _ in range(2):
+        contribute(app_client, algorand_client, deployer, campaign_id, 100_000)
+        mbr.append(app_min_balance(algorand_client, app_client))
+
+    assert mbr[1] - mbr[0] == box_mbr(CONTRIBUTION_BOX_SIZE, CONTRIBUTION_KEY_SIZE)
+    assert mbr[2] == mbr[1]
+
+
+def test_claim_refund_after_failed_campaign(app_client, algorand_client, deployer):
+    """Test that a failed campaign refunds the full contribution once"""
+    campaign_id = new_campaign(app_client, goal_amount=10_000_000, duration_seconds=2)
+    for amount in (300_000, 200_000):
+        contribute(app_client, algorand_client, deployer, campaign_id, amount)
+    wait_for_deadline(algorand_client, deployer, 2)
+
+    before = algorand_client.account.get_information(deployer.address).amount.micro_algo
+    result = app_client.send.claim_refund(
+        {"campaign_id": campaign_id, "contributor": deployer.address},
+        params=CommonAppCallParams(static_fee=AlgoAmount(micro_algo=INNER_PAYMENT_FEE)),
+    )
+    after = algorand_client.account.get_information(deployer.address).amount.micro_algo
+
+    assert result.abi_return == "Refund claimed successfully"
+    assert after - before == 500_000 + CONTRIBUTION_DEPOSIT - INNER_PAYMENT_FEE
+
+    with pytest.raises(Exception, match="No contribution to refund"):
+        app_client.send.claim_refund(
+            {"campaign_id": campaign_id, "contributor": deployer.address},
+            params=CommonAppCallParams(static_fee=AlgoAmount(micro_algo=INNER_PAYMENT_FEE)),
+        )
+
+
+def test_seed_campaigns_resumes(app_client, algorand_client, deployer, tmp_path):
+    """Test a bulk load in pipelined groups, then a rerun that creates nothing"""
+    import asyncio
+
+    from smart_contracts.campus_funding.seeding import CampaignRow, seed_campaigns
+
+    rows = [
+        CampaignRow(
+            title=f"Seeded Campaign {index}",
+            description="Loaded in bulk",
+            goal_amount=1_000_000,
+            duration_seconds=86400,
+            image_url="https://example.com/seeded.jpg",
+        )
+        for index in range(40)
+    ]
+    # Box MBR is paid by the app account
+    algorand_client.send.payment(
+        {
+            "sender": deployer.address,
+            "receiver": app_client.app_address,
+            "amount": AlgoAmount(algo=3),
+        }
+    )
+    checkpoint = tmp_path / "seed.checkpoint.json"
+    first_id = get_total_campaigns(app_client) + 1
+
+    def seed():
+        return asyncio.run(
+            seed_campaigns(
+                app_client, deployer.address, rows, checkpoint, source="seed", window=2
+            )
+        )
+
+    assert seed() == 40
+    assert get_total_campaigns(app_client) == first_id + 39
+    loaded = get_campaigns(app_client, range(first_id, first_id + 40))
+    assert [campaign.title for campaign in loaded] == [row.title for row in rows]
+
+    assert seed() == 0
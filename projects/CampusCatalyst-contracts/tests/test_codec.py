@@ -0,0 +1,162 @@
+"""
+Tests for the zero-copy CampaignInfo decoder, and a microbenchmark against
+the generic ABI codec and the generated client's decode path
+
+    pytest tests/test_codec.py -s
+
+The client timing needs the generated client, so run
+`python -m smart_contracts build` first or it is left out.
+"""
+
+import importlib
+import timeit
+
+import pytest
+
+from smart_contracts.campus_funding.codec import CampaignInfoView, decode_campaign_infos
+
+CAMPAIGN_INFO_TYPE = "(address,string,string,uint64,uint64,uint64,bool,bool,string)"
+CREATOR = bytes(range(32))
+# ARC-4 array offsets are uint16, so the encoded array must stay under 64 KB
+BULK_SIZE = 400
+
+
+def _string(value: str) -> bytes:
+    encoded = value.encode()
+    return len(encoded).to_bytes(2, "big") + encoded
+
+
+def encode_info(
+    title: str,
+    description: str,
+    goal_amount: int,
+    deadline: int,
+    total_raised: int,
+    is_active: bool,
+    funds_withdrawn: bool,
+    image_url: str,
+) -> bytes:
+    """ARC-4 encode a CampaignInfo without algosdk"""
+    title_tail, description_tail, image_tail = map(_string, (title, description, image_url))
+    offset = 63
+    head = CREATOR + offset.to_bytes(2, "big")
+    offset += len(title_tail)
+    head += offset.to_bytes(2, "big")
+    offset += len(description_tail)
+    flags = (0x80 if is_active else 0) | (0x40 if funds_withdrawn else 0)
+    head += b"".join(value.to_bytes(8, "big") for value in (goal_amount, deadline, total_raised))
+    head += bytes([flags]) + offset.to_bytes(2, "big")
+    return head + title_tail + description_tail + image_tail
+
+
+def encode_infos(infos: list[bytes]) -> bytes:
+    """ARC-4 encode a CampaignInfo[] from encoded elements"""
+    head = len(infos).to_bytes(2, "big")
+    offset = 2 * len(infos)
+    for info in infos:
+        head += offset.to_bytes(2, "big")
+        offset += len(info)
+    return head + b"".join(infos)
+
+
+FIELDS = ("Solar Benches", "Phone charging benches ☀", 2_000_000, 1_760_000_000, 750_000)
+INFO = encode_info(*FIELDS, True, False, "https://example.com/benches.jpg")
+
+
+def test_fields() -> None:
+    view = CampaignInfoView(INFO)
+    assert view.creator_key == CREATOR
+    assert (view.title, view.description) == FIELDS[:2]
+    assert (view.goal_amount, view.deadline, view.total_raised) == FIELDS[2:]
+    assert (view.is_active, view.funds_withdrawn) == (True, False)
+    assert view.image_url == "https://example.com/benches.jpg"
+
+    with pytest.raises(ValueError, match="at least 63 bytes"):
+        CampaignInfoView(INFO[:40])
+
+
+def test_decode_array_shares_buffer() -> None:
+    second = encode_info("Robotics", "", 5, 6, 7, False, True, "")
+    raw = encode_infos([INFO, second])
+    views = decode_campaign_infos(raw)
+    assert [view.title for view in views] == ["Solar Benches", "Robotics"]
+    assert views[1].funds_withdrawn and not views[1].is_active
+    assert all(view._view.obj is raw for view in views)
+    assert decode_campaign_infos(encode_infos([])) == []
+
+
+def test_matches_abi_codec() -> None:
+    abi = pytest.importorskip("algosdk.abi")
+    encoding = pytest.importorskip("algosdk.encoding")
+    creator = encoding.encode_address(CREATOR)
+    values = [creator, *FIELDS[:2], *FIELDS[2:], True, False, "https://example.com/benches.jpg"]
+    encoded = abi.ABIType.from_string(CAMPAIGN_INFO_TYPE).encode(values)
+    assert encoded == INFO
+    assert CampaignInfoView(encoded).creator == creator
+
+
+def _client_decoder(array_type):
+    """Decode the way a get_campaigns call through the generated client does"""
+    try:
+        client = importlib.import_module(
+            "smart_contracts.artifacts.campus_funding.campus_funding_client"
+        )
+    except ImportError:
+        return None
+    from algokit_utils import ABIReturn
+    from algosdk.atomic_transaction_composer import ABIResult
+
+    method = client.APP_SPEC.get_arc56_method("get_campaigns")
+    fields = client.APP_SPEC.structs["CampaignInfo"]
+
+    def decode(raw: bytes) -> list:
+        result = ABIResult("", raw, array_type.decode(raw), None, {}, method.to_abi_method())
+        infos = ABIReturn(result).get_arc56_value(method, client.APP_SPEC.structs)
+        return [
+            client._init_dataclass(
+                client.CampaignInfo,
+                client.APP_SPEC.get_abi_struct_from_abi_tuple(info, fields, client.APP_SPEC.structs),
+            )
+            for info in infos
+        ]
+
+    return decode
+
+
+def _per_call_ms(function) -> float:
+    return min(timeit.repeat(function, number=3, repeat=3)) / 3 * 1e3
+
+
+def test_decoder_microbenchmark() -> None:
+    abi = pytest.importorskip("algosdk.abi")
+    raw = encode_infos([INFO] * BULK_SIZE)
+    assert len(raw) < 2**16
+    array_type = abi.ABIType.from_string(f"{CAMPAIGN_INFO_TYPE}[]")
+    client_decode = _client_decoder(array_type)
+
+    def generic() -> int:
+        return sum(info[5] for info in array_type.decode(raw))
+
+    def zero_copy() -> int:
+        return sum(view.total_raised for view in decode_campaign_infos(raw))
+
+    timings = {"ABI codec": generic}
+    if client_decode is not None:
+
+        def generated_client() -> int:
+            return sum(info.total_raised for info in client_decode(raw))
+
+        timings["generated client"] = generated_client
+
+    expected = zero_copy()
+    assert all(decode() == expected for decode in timings.values())
+    zero_copy_ms = _per_call_ms(zero_copy)
+    results = {name: _per_call_ms(decode) for name, decode in timings.items()}
+    print(
+        f"\nSumming total_raised over {BULK_SIZE} CampaignInfo: "
+        + ", ".join(
+            f"{name} {ms:.1f} ms ({ms / zero_copy_ms:.0f}x)" for name, ms in results.items()
+        )
+        + f", memoryview {zero_copy_ms:.1f} ms"
+    )
+    assert all(zero_copy_ms < ms for ms in results.values())
@@ -0,0 +1,166 @@
+"""
+Tests for the block-following confirmation service, against an in-memory algod
+"""
+
+import asyncio
+import collections
+import dataclasses
+from typing import Any
+
+import pytest
+
+from smart_contracts._helpers.confirmations import (
+    ConfirmationService,
+    TransactionExpiredError,
+)
+
+
+@dataclasses.dataclass
+class FakeTransaction:
+    last_valid_round: int
+
+
+@dataclasses.dataclass
+class FakeSignedTransaction:
+    tx_id: str
+    transaction: FakeTransaction
+
+    def get_txid(self) -> str:
+        return self.tx_id
+
+
+class FakeAlgod:
+    """Confirms every submitted transaction in the next round, except `dropped` ones"""
+
+    def __init__(self, dropped: tuple[str, ...] = ()) -> None:
+        self.round = 100
+        self.blocks: dict[int, list[str]] = collections.defaultdict(list)
+        self.dropped = dropped
+        self.calls: collections.Counter[str] = collections.Counter()
+
+    def status(self) -> dict[str, Any]:
+        self.calls["status"] += 1
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_: int) -> dict[str, Any]:
+        self.calls["status_after_block"] += 1
+        self.round = max(self.round, round_ + 1)
+        return {"last-round": self.round}
+
+    def get_block_txids(self, round_: int) -> dict[str, Any]:
+        self.calls["get_block_txids"] += 1
+        return {"blockTxids": self.blocks.get(round_, [])}
+
+    def send_transactions(self, signed_txns: list[FakeSignedTransaction]) -> str:
+        self.calls["send_transactions"] += 1
+        for signed_txn in signed_txns:
+            if signed_txn.tx_id not in self.dropped:
+                self.blocks[self.round + 1].append(signed_txn.tx_id)
+        return signed_txns[0].tx_id
+
+    def pending_transaction_info(self, tx_id: str) -> dict[str, Any]:
+        self.calls["pending_transaction_info"] += 1
+        return {"confirmed-round": next(r for r, ids in self.blocks.items() if tx_id in ids)}
+
+
+def signed(tx_id: str, last_valid: int = 1_000) -> FakeSignedTransaction:
+    return FakeSignedTransaction(tx_id, FakeTransaction(last_valid))
+
+
+def test_resolves_many_transactions_per_block() -> None:
+    algod = FakeAlgod()
+
+    async def run() -> list[int]:
+        async with ConfirmationService(algod) as confirmations:  # type: ignore[arg-type]
+            tx_ids = [await confirmations.send(signed(f"tx{i}")) for i in range(50)]
+            return await asyncio.gather(*map(confirmations.confirmed, tx_ids))
+
+    rounds = asyncio.run(run())
+    assert all(f"tx{i}" in algod.blocks[round_] for i, round_ in enumerate(rounds))
+    # One block read per round followed, however many transactions were waiting
+    followed_rounds = algod.round - 100 + 1
+    assert algod.calls["get_block_txids"] == followed_rounds
+    assert algod.calls["status_after_block"] == followed_rounds - 1
+    assert algod.calls["pending_transaction_info"] == 0
+
+
+def test_confirmed_after_resolution() -> None:
+    algod = FakeAlgod()
+
+    async def run() -> tuple[int, dict[str, Any]]:
+        async with ConfirmationService(algod) as confirmations:  # type: ignore[arg-type]
+            tx_id = await confirmations.send(signed("tx"))
+            await asyncio.sleep(0.1)
+            return await confirmations.confirmed(tx_id), await confirmations.transaction_info(tx_id)
+
+    assert asyncio.run(run()) == (101, {"confirmed-round": 101})
+
+
+def test_expires_after_last_valid_round() -> None:
+    algod = FakeAlgod(dropped=("lost",))
+
+    async def run() -> None:
+        async with ConfirmationService(algod) as confirmations:  # type: ignore[arg-type]
+            tx_id = await confirmations.send(signed("lost", last_valid=103))
+            await confirmations.confirmed(tx_id)
+
+    with pytest.raises(TransactionExpiredError):
+        asyncio.run(run())
+    assert algod.round == 103
+
+
+def test_idle_without_watches() -> None:
+    algod = FakeAlgod()
+
+    async def run() -> None:
+        async with ConfirmationService(algod):  # type: ignore[arg-type]
+            await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert sum(algod.calls.values()) == 0
+
+
+class FlakyAlgod(FakeAlgod):
+    """Fails the first `failures` block reads"""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    def get_block_txids(self, round_: int) -> dict[str, Any]:
+        if self.failures:
+            self.failures -= 1
+            self.calls["failed"] += 1
+            raise ConnectionError("algod unavailable")
+        return super().get_block_txids(round_)
+
+
+def test_retries_after_transient_error() -> None:
+    algod = FlakyAlgod(failures=1)
+
+    async def run() -> list[int]:
+        async with ConfirmationService(algod, retry_delay=0.01) as confirmations:  # type: ignore[arg-type]
+            first = await confirmations.send(signed("first"))
+            rounds = [await confirmations.confirmed(first)]
+            # The follower is still running for later watches
+            second = await confirmations.send(signed("second"))
+            rounds.append(await confirmations.confirmed(second))
+            return rounds
+
+    first_round, second_round = asyncio.run(run())
+    assert algod.calls["failed"] == 1
+    assert "first" in algod.blocks[first_round] and "second" in algod.blocks[second_round]
+
+
+def test_restarts_after_giving_up() -> None:
+    algod = FlakyAlgod(failures=6)
+
+    async def run() -> int:
+        async with ConfirmationService(algod, retry_delay=0.001) as confirmations:  # type: ignore[arg-type]
+            lost = await confirmations.send(signed("lost"))
+            with pytest.raises(ConnectionError):
+                await confirmations.confirmed(lost)
+            # Once reads work again, new watches are confirmed
+            return await confirmations.confirmed(await confirmations.send(signed("later")))
+
+    assert "later" in algod.blocks[asyncio.run(run())]
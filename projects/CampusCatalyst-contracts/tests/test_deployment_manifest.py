@@ -0,0 +1,79 @@
+"""
+Tests for the local deployment manifest and the app account top-up rule
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.deployment_manifest import (
+    Deployment,
+    load_deployment,
+    network_key,
+    program_hash,
+    record_deployment,
+)
+
+
+def write_app_spec(path: Path, approval: str, clear: str = "I2NsZWFy") -> Path:
+    spec = {"name": "CampusFunding", "source": {"approval": approval, "clear": clear}}
+    path.write_text(json.dumps(spec))
+    return path
+
+
+def test_program_hash_tracks_programs(tmp_path: Path) -> None:
+    spec = write_app_spec(tmp_path / "a.arc56.json", "YXBwcm92YWw=")
+    same = write_app_spec(tmp_path / "b.arc56.json", "YXBwcm92YWw=")
+    changed = write_app_spec(tmp_path / "c.arc56.json", "Y2hhbmdlZA==")
+
+    assert program_hash(spec) == program_hash(same)
+    assert program_hash(spec) != program_hash(changed)
+
+
+def test_record_and_load_per_network(tmp_path: Path) -> None:
+    manifest = tmp_path / "deployments.json"
+    localnet = Deployment(1001, "APPADDRESS", "abc", 5_544_200)
+    testnet = Deployment(2002, "OTHERADDRESS", "abc", 5_100_000)
+
+    record_deployment("campus_funding", "localnet", localnet, manifest)
+    record_deployment("campus_funding", "testnet", testnet, manifest)
+
+    assert load_deployment("campus_funding", "localnet", manifest) == localnet
+    assert load_deployment("campus_funding", "testnet", manifest) == testnet
+    assert load_deployment("campus_funding", "mainnet", manifest) is None
+    assert load_deployment("other", "localnet", manifest) is None
+
+
+def test_missing_or_corrupt_manifest(tmp_path: Path) -> None:
+    manifest = tmp_path / "deployments.json"
+    assert load_deployment("campus_funding", "localnet", manifest) is None
+
+    manifest.write_text("not json")
+    assert load_deployment("campus_funding", "localnet", manifest) is None
+
+
+def test_network_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("ALGOD_SERVER", raising=False)
+    monkeypatch.delenv("ALGOD_PORT", raising=False)
+    assert network_key() == "http://localhost:4001"
+
+    monkeypatch.setenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+    assert network_key() == "https://testnet-api.algonode.cloud"
+
+
+def test_top_up_only_below_required() -> None:
+    pytest.importorskip("algokit_utils")
+    from smart_contracts.campus_funding.deploy_config import (
+        FUNDING_TOP_UP,
+        NEXT_CAMPAIGN_MBR,
+        top_up_amount,
+    )
+
+    min_balance = 100_000 + 28_500
+    required = min_balance + NEXT_CAMPAIGN_MBR
+
+    assert top_up_amount(required, min_balance) == 0
+    assert top_up_amount(required - 1, min_balance) == 1 + FUNDING_TOP_UP.micro_algo
+    # A fresh app account holds nothing
+    assert top_up_amount(0, 100_000) == 100_000 + NEXT_CAMPAIGN_MBR + FUNDING_TOP_UP.micro_algo
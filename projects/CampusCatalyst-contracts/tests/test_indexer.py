@@ -0,0 +1,140 @@
+"""
+Tests for the campaign indexer, against boxes and blocks recorded in a fixture
+"""
+
+import base64
+import collections
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts.campus_funding.indexer import (
+    CampaignIndexer,
+    decode_state,
+    referenced_campaigns,
+)
+
+FIXTURE = json.loads((Path(__file__).parent / "fixtures" / "indexer_blocks.json").read_text())
+APP_ID = FIXTURE["app_id"]
+NOW = 1_760_050_000
+
+
+class BoxNotFoundError(Exception):
+    code = 404
+
+
+class RecordedAlgod:
+    """Serves the fixture's boxes and blocks, applying box updates as rounds are read"""
+
+    def __init__(self) -> None:
+        self.round = FIXTURE["last_round"]
+        self.boxes = {base64.b64decode(k): v for k, v in FIXTURE["boxes"].items()}
+        self.calls: collections.Counter[str] = collections.Counter()
+
+    def status(self) -> dict[str, Any]:
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_: int) -> dict[str, Any]:
+        self.round = max(self.round, round_ + 1)
+        for update in FIXTURE["updates"].get(str(self.round), {}).items():
+            self.boxes[base64.b64decode(update[0])] = update[1]
+        return {"last-round": self.round}
+
+    def application_boxes(self, app_id: int) -> dict[str, Any]:
+        assert app_id == APP_ID
+        return {"boxes": [{"name": base64.b64encode(name).decode()} for name in self.boxes]}
+
+    def application_box_by_name(self, app_id: int, name: bytes) -> dict[str, Any]:
+        assert app_id == APP_ID
+        self.calls["box"] += 1
+        if name not in self.boxes:
+            raise BoxNotFoundError("box not found")
+        return {"name": base64.b64encode(name).decode(), "value": self.boxes[name]}
+
+    def block_info(self, round_: int) -> dict[str, Any]:
+        return {"block": FIXTURE["blocks"].get(str(round_), {"rnd": round_})}
+
+
+@pytest.fixture
+def algod() -> RecordedAlgod:
+    return RecordedAlgod()
+
+
+def test_decode_boxes(algod: RecordedAlgod) -> None:
+    record = decode_state(1, base64.b64decode(algod.boxes[(1).to_bytes(8, "big")]))
+    assert (record.goal_amount, record.total_raised, record.deadline) == (
+        2_000_000,
+        2_500_000,
+        1_760_000_000,
+    )
+    assert (record.is_active, record.funds_withdrawn) == (False, True)
+    assert record.percent_funded == 125
+
+    record.metadata = memoryview(base64.b64decode(algod.boxes[b"m" + (1).to_bytes(8, "big")]))
+    assert (record.title, record.description, record.image_url) == (
+        "Solar Benches",
+        "Phone charging benches for the quad",
+        "https://example.com/benches.jpg",
+    )
+
+    with pytest.raises(ValueError, match="state box is 8 bytes"):
+        decode_state(1, bytes(8))
+
+
+def test_load_and_query(algod: RecordedAlgod) -> None:
+    indexer = CampaignIndexer(algod, APP_ID)
+    indexer.load()
+    assert indexer.round == 500
+    assert sorted(indexer.table) == [1, 2, 3]
+    assert indexer.table[2].title == "Robotics Club"
+
+    def ids(**query: Any) -> list[int]:
+        return [record.campaign_id for record in indexer.campaigns(now=NOW, **query)]
+
+    assert ids(active=True) == [2, 3]
+    assert ids(active=False) == [1]
+    assert ids(ending_within=86_400) == [3]
+    assert ids(min_percent_funded=50) == [1, 3]
+    assert ids(sort_by="percent_funded", descending=True, limit=2) == [1, 3]
+    assert ids(creator=bytes(range(32)), sort_by="deadline") == [1, 3]
+    with pytest.raises(ValueError, match="Unknown sort key"):
+        indexer.campaigns(sort_by="title")
+
+
+def test_referenced_campaigns() -> None:
+    # Box references of another app are ignored, foreign references to this app are not
+    assert referenced_campaigns(FIXTURE["blocks"]["501"], APP_ID) == {}
+    assert referenced_campaigns(FIXTURE["blocks"]["502"], APP_ID) == {2: False, 4: True}
+
+
+def test_follow_refetches_touched_campaigns_only(algod: RecordedAlgod) -> None:
+    indexer = CampaignIndexer(algod, APP_ID)
+    indexer.load()
+    loaded = algod.calls["box"]
+
+    stop = threading.Event()
+    original = indexer.apply_block
+
+    def apply_block(round_: int) -> None:
+        original(round_)
+        if round_ == 502:
+            stop.set()
+
+    indexer.apply_block = apply_block  # type: ignore[method-assign]
+    indexer.follow(stop)
+
+    assert indexer.round == 502
+    # Campaign 2's state (metadata is kept), campaign 4's state and metadata
+    assert algod.calls["box"] - loaded == 3
+    assert indexer.table[2].total_raised == 4_000_000
+    assert indexer.table[2].title == "Robotics Club"
+    assert indexer.table[4].title == "Open Mic Night"
+    assert [r.campaign_id for r in indexer.campaigns(sort_by="total_raised", now=NOW)] == [
+        4,
+        3,
+        1,
+        2,
+    ]
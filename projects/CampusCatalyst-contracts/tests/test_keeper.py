@@ -0,0 +1,200 @@
+"""
+Tests for sweeping ended campaigns through the deadline index
+"""
+
+import base64
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts.campus_funding.indexer import CampaignRecord
+from smart_contracts.campus_funding.keeper import (
+    KeeperState,
+    bucket_days,
+    bucket_key,
+    classify,
+    close_all,
+    closed_days,
+    ledger_campaigns,
+    page_count,
+    page_key,
+    parse_page,
+    sweep,
+)
+
+DAY = 86_400
+APP_ID = 1001
+
+
+def state_box(goal_amount: int, total_raised: int, *, active: bool, withdrawn: bool) -> bytes:
+    flags = (0x80 if active else 0) | (0x40 if withdrawn else 0)
+    return (
+        bytes(32)
+        + goal_amount.to_bytes(8, "big")
+        + (100 * DAY).to_bytes(8, "big")
+        + total_raised.to_bytes(8, "big")
+        + bytes([flags])
+    )
+
+
+def record(total_raised: int, *, active: bool = True, withdrawn: bool = False) -> CampaignRecord:
+    return CampaignRecord(1, bytes(32), 1_000, 100 * DAY, total_raised, active, withdrawn)
+
+
+def test_closed_days() -> None:
+    # Day 101 is still running at noon, so only 99 and 100 are closed
+    assert list(closed_days(98, now=101 * DAY + DAY // 2)) == [99, 100]
+    assert list(closed_days(100, now=101 * DAY + DAY // 2)) == []
+    assert list(closed_days(100, now=102 * DAY)) == [101]
+
+
+def ids(*campaign_ids: int) -> bytes:
+    return b"".join(campaign_id.to_bytes(8, "big") for campaign_id in campaign_ids)
+
+
+def test_buckets() -> None:
+    assert parse_page(ids(3, 9, 12)) == [3, 9, 12]
+    assert [page_count(count) for count in (0, 1, 128, 129)] == [0, 1, 1, 2]
+    names = [
+        base64.b64encode(bucket_key(105)).decode(),
+        base64.b64encode((3).to_bytes(8, "big")).decode(),
+        bucket_key(101),
+        page_key(bucket_key(101), 0),
+        b"top",
+    ]
+    assert bucket_days(names) == [101, 105]
+
+
+def test_classify() -> None:
+    assert classify(record(1_500)) == "withdraw"
+    assert classify(record(400)) == "refund"
+    assert classify(record(1_500, active=False, withdrawn=True)) is None
+    # Cancelled or already closed, or never funded but still counted as active
+    assert classify(record(0, active=False)) is None
+    assert classify(record(0)) == "close"
+    # Every contributor refunded
+    assert classify(record(400), has_ledger=False) == "close"
+    assert classify(record(400, active=False), has_ledger=False) is None
+    assert classify(record(1_500), has_ledger=False) == "withdraw"
+
+
+def test_ledger_campaigns() -> None:
+    names = [
+        (3).to_bytes(8, "big") + bytes(32),
+        base64.b64encode((5).to_bytes(8, "big") + bytes(range(32))).decode(),
+        (4).to_bytes(8, "big"),
+        b"m" + (4).to_bytes(8, "big"),
+        bucket_key(101),
+    ]
+    assert ledger_campaigns(names) == {3, 5}
+
+
+def test_keeper_state(tmp_path: Path) -> None:
+    path = tmp_path / ".keeper-1001.json"
+    assert KeeperState.load(path) is None
+    KeeperState(app_id=APP_ID, last_swept_day=100).save(path)
+    assert KeeperState.load(path) == KeeperState(APP_ID, 100)
+
+
+class BoxAlgod:
+    def __init__(self, boxes: dict[bytes, bytes]) -> None:
+        self.boxes = boxes
+        self.reads: list[bytes] = []
+
+    def application_boxes(self, app_id: int) -> dict[str, Any]:
+        return {"boxes": [{"name": base64.b64encode(name).decode()} for name in self.boxes]}
+
+    def application_box_by_name(self, app_id: int, name: bytes) -> dict[str, Any]:
+        self.reads.append(name)
+        if name not in self.boxes:
+            error = Exception("box not found")
+            error.code = 404  # type: ignore[attr-defined]
+            raise error
+        return {"value": base64.b64encode(self.boxes[name]).decode()}
+
+
+def count(value: int) -> bytes:
+    return value.to_bytes(8, "big")
+
+
+def test_sweep_reads_only_closed_buckets() -> None:
+    pytest.importorskip("algosdk")
+    key = lambda campaign_id: campaign_id.to_bytes(8, "big")  # noqa: E731
+    algod = BoxAlgod(
+        {
+            bucket_key(100): count(4),
+            page_key(bucket_key(100), 0): ids(1, 2, 3, 5),
+            bucket_key(102): count(1),
+            page_key(bucket_key(102), 0): ids(4),
+            key(1): state_box(1_000, 1_500, active=True, withdrawn=False),
+            key(2): state_box(1_000, 400, active=True, withdrawn=False),
+            key(3): state_box(1_000, 0, active=False, withdrawn=False),
+            key(4): state_box(1_000, 2_000, active=True, withdrawn=False),
+            key(5): state_box(1_000, 400, active=True, withdrawn=False),
+            # Campaign 2 still has a contributor to refund, campaign 5 none
+            key(2) + bytes(32): count(400),
+        }
+    )
+
+    expired = sweep(algod, APP_ID, [100, 101])
+
+    assert [(campaign.campaign_id, campaign.action) for campaign in expired] == [
+        (1, "withdraw"),
+        (2, "refund"),
+        (5, "close"),
+    ]
+    # Campaign 4 ends on a day that wasn't swept, so its box is never read
+    assert key(4) not in algod.reads and bucket_key(102) not in algod.reads
+
+
+def test_sweep_reads_every_page() -> None:
+    pytest.importorskip("algosdk")
+    campaign_ids = range(1, 131)
+    boxes = {
+        bucket_key(100): count(130),
+        page_key(bucket_key(100), 0): ids(*campaign_ids[:128]),
+        page_key(bucket_key(100), 1): ids(*campaign_ids[128:]),
+    }
+    for campaign_id in campaign_ids:
+        boxes[campaign_id.to_bytes(8, "big")] = state_box(
+            1_000, 400, active=True, withdrawn=False
+        )
+
+    expired = sweep(BoxAlgod(boxes), APP_ID, [100])
+
+    assert [campaign.campaign_id for campaign in expired] == list(campaign_ids)
+
+
+class FakeComposer:
+    def __init__(self, groups: list[list[list[int]]]) -> None:
+        self.calls: list[list[int]] = []
+        groups.append(self.calls)
+
+    def close_failed_campaigns(self, args: dict[str, Any]) -> "FakeComposer":
+        self.calls.append(args["campaign_ids"])
+        return self
+
+    def send(self) -> Any:
+        # Pretend one campaign per call was already closed
+        return type("Result", (), {"returns": [len(call) - 1 for call in self.calls]})
+
+
+class FakeAppClient:
+    def __init__(self) -> None:
+        self.groups: list[list[list[int]]] = []
+
+    def new_group(self) -> FakeComposer:
+        return FakeComposer(self.groups)
+
+
+def test_close_all_packs_calls_into_groups() -> None:
+    app_client = FakeAppClient()
+
+    closed = close_all(app_client, list(range(1, 21)), group_size=2)  # type: ignore[arg-type]
+
+    assert app_client.groups == [
+        [list(range(1, 9)), list(range(9, 17))],
+        [list(range(17, 21))],
+    ]
+    assert closed == 17
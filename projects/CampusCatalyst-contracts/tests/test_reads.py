@@ -0,0 +1,121 @@
+"""
+Tests for batched campaign reads, against a composer that simulates get_campaigns
+"""
+
+import base64
+from typing import Any
+
+import pytest
+
+from smart_contracts.campus_funding.reads import (
+    ABI_RETURN_PREFIX,
+    get_campaigns,
+    get_creator_campaigns,
+)
+from tests.test_codec import encode_info, encode_infos
+
+CAMPAIGNS = {
+    campaign_id: encode_info(
+        f"Campaign {campaign_id}", "", 1_000_000, 1_760_000_000, campaign_id, True, False, ""
+    )
+    for campaign_id in range(1, 11)
+}
+
+
+class FakeSimulation:
+    def __init__(self, returns: list[bytes]) -> None:
+        logs = [[base64.b64encode(ABI_RETURN_PREFIX + value).decode()] for value in returns]
+        self.simulate_response = {
+            "txn-groups": [{"txn-results": [{"txn-result": {"logs": log}} for log in logs]}]
+        }
+
+
+class FakeComposer:
+    def __init__(self, app_client: "FakeAppClient") -> None:
+        self.app_client = app_client
+        self.calls: list[list[int]] = []
+
+    def get_campaigns(self, args: dict[str, Any]) -> "FakeComposer":
+        self.calls.append(args["campaign_ids"])
+        return self
+
+    def get_creator_campaigns(self, args: dict[str, Any]) -> "FakeComposer":
+        self.calls.append(self.app_client.portfolio)
+        return self
+
+    def simulate(self, **kwargs: Any) -> Any:
+        assert kwargs["skip_signatures"]
+        self.app_client.requests.append(self.calls)
+        if self.app_client.error is not None:
+            raise self.app_client.error
+        if self.calls == [self.app_client.portfolio]:
+            return FakePortfolio(self.calls[0])
+        if any(len(ids) > self.app_client.max_ids for ids in self.calls):
+            # The AVM's error for a byte value over 4096 bytes
+            raise RuntimeError("logic eval error: concat produced a too big (4362) byte-array")
+        return FakeSimulation(
+            [encode_infos([CAMPAIGNS[campaign_id] for campaign_id in ids]) for ids in self.calls]
+        )
+
+
+class FakePortfolio:
+    def __init__(self, campaign_ids: list[int]) -> None:
+        self.returns = [self]
+        self.campaign_ids = campaign_ids
+        self.total = len(campaign_ids)
+
+
+class FakeAppClient:
+    def __init__(self, max_ids: int = 4, error: Exception | None = None) -> None:
+        self.max_ids = max_ids
+        self.error = error
+        self.portfolio = [3, 8, 1, 6, 4]
+        self.requests: list[list[list[int]]] = []
+
+    def new_group(self) -> FakeComposer:
+        return FakeComposer(self)
+
+
+def test_get_campaigns_decodes_raw_returns() -> None:
+    app_client = FakeAppClient()
+    campaign_ids = [7, 2, 9, 1, 5, 10]
+
+    campaigns = get_campaigns(app_client, campaign_ids, max_workers=1)  # type: ignore[arg-type]
+
+    assert [campaign.total_raised for campaign in campaigns] == campaign_ids
+    assert campaigns[0].title == "Campaign 7"
+    assert app_client.requests == [[[7, 2, 9, 1]], [[5, 10]]]
+
+
+def test_get_campaigns_splits_returns_too_large() -> None:
+    app_client = FakeAppClient(max_ids=1)
+
+    campaigns = get_campaigns(app_client, [4, 2, 3], max_workers=1)  # type: ignore[arg-type]
+
+    assert [campaign.total_raised for campaign in campaigns] == [4, 2, 3]
+    assert app_client.requests == [[[4, 2, 3]], [[4]], [[2, 3]], [[2]], [[3]]]
+
+
+def test_get_creator_campaigns_falls_back_per_call() -> None:
+    app_client = FakeAppClient(max_ids=2)
+
+    campaigns = get_creator_campaigns(app_client, "creator")  # type: ignore[arg-type]
+
+    assert [campaign.total_raised for campaign in campaigns] == app_client.portfolio
+    assert app_client.requests[1:] == [
+        [[3, 8, 1, 6], [4]],
+        [[3, 8, 1, 6]],
+        [[3, 8]],
+        [[1, 6]],
+        [[4]],
+    ]
+
+
+def test_other_failures_are_not_retried() -> None:
+    app_client = FakeAppClient(error=ConnectionError("algod unavailable"))
+
+    with pytest.raises(ConnectionError):
+        get_campaigns(app_client, [1, 2, 3, 4], max_workers=1)  # type: ignore[arg-type]
+    with pytest.raises(ConnectionError):
+        get_creator_campaigns(app_client, "creator")  # type: ignore[arg-type]
+    assert len(app_client.requests) == 2
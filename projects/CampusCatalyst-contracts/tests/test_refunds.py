@@ -0,0 +1,102 @@
+"""
+Tests for packing bulk refunds into refund_batch groups
+"""
+
+from typing import Any
+
+import pytest
+
+from smart_contracts.campus_funding.refunds import (
+    RefundReport,
+    batch_fee,
+    group_capacity,
+    group_too_large,
+    refund_all,
+    split_batches,
+)
+
+
+def test_group_capacity() -> None:
+    # 16 calls share 128 references; one is the state box, two per contributor
+    assert group_capacity() == 63
+    assert group_capacity(1) == 3
+
+
+def test_split_batches() -> None:
+    contributors = [f"C{index}" for index in range(10)]
+    batches = split_batches(contributors, 4)
+    assert [len(batch) for batch in batches] == [3, 3, 2, 2]
+    assert [name for batch in batches for name in batch] == contributors
+    assert split_batches(contributors[:2], 16) == [["C0"], ["C1"]]
+    assert split_batches([], 16) == []
+
+
+def test_fee_report() -> None:
+    # 2,000 contributors, 63 per group of 16 calls
+    groups, last = divmod(2_000, 63)
+    fees = groups * sum(map(batch_fee, split_batches(["C"] * 63, 16)))
+    fees += sum(map(batch_fee, split_batches(["C"] * last, 16)))
+    report = RefundReport(contributors=2_000, groups=groups + 1, calls=16 * (groups + 1), fees=fees)
+
+    assert report.claim_refund_fees == 4_000_000
+    assert report.fees == 2_000_000 + 1_000 * report.calls
+    assert "fees 2512000 microALGOs vs 4000000 with claim_refund, 1488000 saved" in report.summary()
+
+
+def test_group_too_large() -> None:
+    assert group_too_large(RuntimeError("logic eval error: dynamic cost budget exceeded"))
+    assert group_too_large(RuntimeError("logic eval error: unavailable Box c3a0"))
+    assert not group_too_large(RuntimeError("logic eval error: Refunds not available"))
+    assert not group_too_large(ConnectionError("algod unavailable"))
+
+
+class FakeResult:
+    def __init__(self, returns: list[int]) -> None:
+        self.returns = returns
+
+
+class FakeComposer:
+    def __init__(self, app_client: "FakeAppClient") -> None:
+        self.app_client = app_client
+        self.batches: list[list[str]] = []
+
+    def refund_batch(self, args: dict[str, Any], params: Any = None) -> "FakeComposer":
+        self.batches.append(args["contributors"])
+        return self
+
+    def send(self) -> FakeResult:
+        contributors = sum(map(len, self.batches))
+        self.app_client.groups.append(contributors)
+        if contributors > self.app_client.max_contributors:
+            raise self.app_client.error
+        return FakeResult([100 * len(batch) for batch in self.batches])
+
+
+class FakeAppClient:
+    def __init__(self, max_contributors: int, error: Exception) -> None:
+        self.max_contributors = max_contributors
+        self.error = error
+        self.groups: list[int] = []
+
+    def new_group(self) -> FakeComposer:
+        return FakeComposer(self)
+
+
+def test_refund_all_halves_groups_over_budget() -> None:
+    pytest.importorskip("algokit_utils")
+    app_client = FakeAppClient(20, RuntimeError("dynamic cost budget exceeded"))
+    contributors = [f"C{index}" for index in range(70)]
+
+    report = refund_all(app_client, 1, contributors)  # type: ignore[arg-type]
+
+    assert report.refunded == 7_000
+    assert app_client.groups == [63, 31, 15, 15, 15, 15, 10]
+
+
+def test_refund_all_stops_on_other_failures() -> None:
+    pytest.importorskip("algokit_utils")
+    app_client = FakeAppClient(0, RuntimeError("logic eval error: Refunds not available"))
+
+    with pytest.raises(RuntimeError, match="Refunds not available"):
+        refund_all(app_client, 1, ["C0", "C1"])  # type: ignore[arg-type]
+    assert app_client.groups == [2]
@@ -0,0 +1,187 @@
+"""
+Tests for reading campaign files and resuming bulk loads
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smart_contracts._helpers.confirmations import TransactionExpiredError
+from smart_contracts.campus_funding import seeding
+from smart_contracts.campus_funding.seeding import (
+    CampaignRow,
+    Checkpoint,
+    IndexCounts,
+    _box_references,
+    _spread_references,
+    read_campaigns,
+    rows_loaded,
+    seed_campaigns,
+)
+from tests.test_confirmations import FakeAlgod, signed
+
+CAMPAIGN = {
+    "title": "Solar Benches",
+    "description": "Phone charging benches for the quad",
+    "goal_amount": 2_000_000,
+    "duration_seconds": 604_800,
+    "image_url": "https://example.com/benches.jpg",
+}
+
+
+def test_read_csv_and_jsonl(tmp_path: Path) -> None:
+    csv_path = tmp_path / "campaigns.csv"
+    csv_path.write_text(
+        "title,description,goal_amount,duration_seconds,image_url\n"
+        'Solar Benches,"Phone charging benches for the quad",2000000,604800,'
+        "https://example.com/benches.jpg\n"
+    )
+    jsonl_path = tmp_path / "campaigns.jsonl"
+    jsonl_path.write_text(json.dumps(CAMPAIGN) + "\n\n" + json.dumps(CAMPAIGN) + "\n")
+
+    assert read_campaigns(csv_path) == [CampaignRow(**CAMPAIGN)]
+    assert read_campaigns(jsonl_path) == [CampaignRow(**CAMPAIGN)] * 2
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"title": ""}, "Row 1: missing title"),
+        ({"goal_amount": "lots"}, "Row 1: invalid literal"),
+        ({"duration_seconds": 0}, "must be positive"),
+        ({"description": "x" * 1_000}, "exceeds 1024 bytes"),
+    ],
+)
+def test_invalid_rows(tmp_path: Path, overrides: dict[str, object], message: str) -> None:
+    path = tmp_path / "campaigns.jsonl"
+    path.write_text(json.dumps({**CAMPAIGN, **overrides}) + "\n")
+    with pytest.raises(ValueError, match=message):
+        read_campaigns(path)
+
+
+def test_unsupported_file(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="expected .csv or .jsonl"):
+        read_campaigns(tmp_path / "campaigns.xlsx")
+
+
+def test_resume_from_counter(tmp_path: Path) -> None:
+    path = tmp_path / "campaigns.csv.checkpoint.json"
+    Checkpoint(source="campaigns.csv", first_campaign_id=11, rows_done=16).save(path)
+    checkpoint = Checkpoint.load(path)
+    assert checkpoint == Checkpoint("campaigns.csv", 11, 16)
+
+    # Nothing confirmed yet, part of the load, all of it
+    assert rows_loaded(checkpoint, total_campaigns=10, row_count=40) == 0
+    assert rows_loaded(checkpoint, total_campaigns=42, row_count=40) == 32
+    assert rows_loaded(checkpoint, total_campaigns=50, row_count=40) == 40
+
+    with pytest.raises(ValueError, match="something else is creating campaigns"):
+        rows_loaded(checkpoint, total_campaigns=51, row_count=40)
+
+
+def bucket(day: int, page: int | None = None) -> bytes:
+    key = b"d" + day.to_bytes(8, "big")
+    return key if page is None else key + page.to_bytes(8, "big")
+
+
+def test_box_references_cover_indexes() -> None:
+    day = 86_400
+    key = (7).to_bytes(8, "big")
+    creator = bytes(range(32))
+    creator_index = b"c" + creator
+    counts = {bucket(101): 3, creator_index: 128}
+    indexes = IndexCounts(lambda key: counts.get(key, 0))
+    # Well inside a day: one bucket. The creator has filled a page, so the
+    # campaign starts the next one.
+    assert _box_references(7, day, now=100 * day + 3_600, creator=creator, indexes=indexes) == [
+        key,
+        b"m" + key,
+        creator_index,
+        creator_index + (1).to_bytes(8, "big"),
+        bucket(101),
+        bucket(101, 0),
+    ]
+    # Close to midnight the deadline may land on either side
+    assert _box_references(8, day, now=101 * day - 30, creator=creator, indexes=indexes)[4:] == [
+        bucket(101),
+        bucket(101, 0),
+        bucket(102),
+        bucket(102, 0),
+    ]
+
+
+def test_index_counts_cross_pages() -> None:
+    indexes = IndexCounts(lambda key: 127)
+    first, second = bucket(5), bucket(6)
+    # The 128th ID fills page 0, the next starts page 1
+    assert indexes.append([first]) == [first, bucket(5, 0)]
+    assert indexes.append([first]) == [first, bucket(5, 1)]
+    # Either day may take the ID, so day 6 might now be on page 0 or 1
+    assert indexes.append([first, second]) == [first, bucket(5, 1), second, bucket(6, 0)]
+    assert indexes.append([second]) == [second, bucket(6, 0), bucket(6, 1)]
+
+
+def test_spread_references() -> None:
+    shared = [b"c", b"d", b"d0"]
+    calls = [[bytes([index]), bytes([index]) + b"m", *shared] for index in range(3)]
+    spread = _spread_references(calls)
+    # Shared index boxes are referenced once for the whole group
+    assert [len(names) for names in spread] == [8, 1, 0]
+    assert sorted(name for names in spread for name in names) == sorted(set(sum(calls, [])))
+
+    with pytest.raises(ValueError, match="9 box references"):
+        _spread_references([[bytes([index]) for index in range(9)]])
+
+
+class FakeSeedingClient:
+    """Reports the campaign counter and hands out a FakeAlgod"""
+
+    app_id = 1
+
+    def __init__(self, algod: FakeAlgod, total: int) -> None:
+        self.total = total
+        self.algorand = self
+        self.client = self
+        self.algod = algod
+
+    def new_group(self) -> "FakeSeedingClient":
+        return self
+
+    def get_total_campaigns(self) -> "FakeSeedingClient":
+        return self
+
+    def simulate(self, **kwargs: Any) -> Any:
+        return type("Simulation", (), {"returns": [self.total]})
+
+
+def test_seeding_stops_at_first_failed_group(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def build_group(app_client: Any, sender: str, rows: Any, first_id: int, indexes: Any) -> Any:
+        campaign_ids = range(first_id, first_id + len(rows))
+        return [signed(f"campaign{campaign_id}", last_valid=103) for campaign_id in campaign_ids]
+
+    monkeypatch.setattr(seeding, "_build_group", build_group)
+    # The second group, campaigns 13 and 14, never confirms
+    algod = FakeAlgod(dropped=("campaign13", "campaign14"))
+    app_client = FakeSeedingClient(algod, total=10)
+    checkpoint_path = tmp_path / "campaigns.csv.checkpoint.json"
+
+    with pytest.raises(TransactionExpiredError):
+        asyncio.run(
+            seed_campaigns(
+                app_client,  # type: ignore[arg-type]
+                "SENDER",
+                [CampaignRow(**CAMPAIGN)] * 8,  # type: ignore[arg-type]
+                checkpoint_path,
+                source="campaigns.csv",
+                group_size=2,
+                window=1,
+            )
+        )
+
+    assert algod.calls["send_transactions"] == 2
+    assert Checkpoint.load(checkpoint_path) == Checkpoint("campaigns.csv", 11, 2)
@@ -0,0 +1,90 @@
+"""
+Startup cost of the smart_contracts CLI
+
+Imports smart_contracts.__main__ under `python -X importtime` and checks
+that nothing only a deploy needs is loaded, and that the import stays
+within a time budget. Run with `pytest tests/test_startup.py -s` to see
+the slowest imports.
+
+The CLI keeps startup light by importing deploy configs and tools inside
+the functions that need them. The package __init__ files stay empty:
+puyapy compiles them along with the contract, so they can't hold lazy
+exports either.
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CLI_MODULE = "smart_contracts.__main__"
+# Loaded lazily by the deploy action or by code that needs the contracts
+DEFERRED_MODULES = (
+    "algokit_utils",
+    "algosdk",
+    "algopy",
+    "dotenv",
+    "smart_contracts.artifacts",
+    "smart_contracts.campus_funding",
+)
+STARTUP_BUDGET_US = 500_000
+RUNS = 3
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module `module` loads"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_package_inits_are_empty() -> None:
+    inits = sorted((PROJECT_ROOT / "smart_contracts").glob("**/__init__.py"))
+    assert inits
+    for init in inits:
+        body = ast.parse(init.read_text()).body
+        # Nothing but a docstring
+        docstring = body[:1] if body and isinstance(body[0], ast.Expr) else []
+        assert body == docstring, f"{init.relative_to(PROJECT_ROOT)} has code"
+
+
+def test_package_import_leaves_contract_unloaded() -> None:
+    loaded = import_times("smart_contracts.campus_funding")
+    assert "algopy" not in loaded
+    assert "smart_contracts.campus_funding.contract" not in loaded
+
+
+def test_cli_import_defers_deploy_dependencies() -> None:
+    loaded = import_times(CLI_MODULE)
+    early = sorted(
+        name
+        for name in loaded
+        if any(name == deferred or name.startswith(f"{deferred}.") for deferred in DEFERRED_MODULES)
+    )
+    assert not early, f"Imported at CLI startup: {early}"
+
+
+def test_cli_import_within_budget() -> None:
+    # Best of several runs, so the first one's bytecode compilation and a
+    # busy machine don't count against the budget
+    runs = [import_times(CLI_MODULE) for _ in range(RUNS)]
+    fastest = min(runs, key=lambda times: times[CLI_MODULE])
+
+    slowest = sorted(fastest.items(), key=lambda item: item[1], reverse=True)[:10]
+    print("\nslowest imports (cumulative us):")
+    for name, cumulative in slowest:
+        print(f"{cumulative:>10}  {name}")
+
+    assert fastest[CLI_MODULE] < STARTUP_BUDGET_US